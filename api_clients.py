@@ -0,0 +1,198 @@
+"""AI API 클라이언트 공용 풀.
+
+Anthropic 클라이언트는 API 키마다, Gemini GenerativeModel은
+(API 키, 모델, 시스템 프롬프트, 출력 형식)마다 하나만 만들어 모든 스레드가 함께 쓴다.
+클라이언트를 재사용하면 내부 연결이 유지되므로(Anthropic: httpx keep-alive 연결 풀,
+Gemini: gRPC 채널) 호출할 때마다 TLS 핸드셰이크와 객체 생성을 반복하지 않는다.
+
+genai.configure는 프로세스 전역 설정이며 호출될 때마다 기존 Gemini 클라이언트를 버리므로,
+이 모듈에서 API 키가 바뀔 때만 호출한다. 다른 곳에서 직접 호출하지 않는다.
+
+API 주소를 바꾸려면(프록시, 벤치마크용 가짜 서버 등) Anthropic은 SDK가 읽는
+ANTHROPIC_BASE_URL, Gemini는 GEMINI_API_ENDPOINT 환경변수(REST 전송으로 접속)를 쓴다.
+
+Gemini 컨텍스트 캐시(get_gemini_cached_model)도 (API 키, 모델, 시스템 프롬프트, 캐시 내용)마다
+하나만 만들어 만료 전까지 재사용한다.
+
+translator.py, embedder.py, parsers/base.py가 함께 쓴다.
+"""
+
+import datetime
+import hashlib
+import os
+import threading
+import time
+
+# Anthropic 연결 풀: 동시 번역·매칭 요청 수보다 넉넉하게 유지하고,
+# 요청 사이 간격(속도 제한 대기 포함)보다 길게 연결을 살려 둔다.
+_ANTHROPIC_MAX_CONNECTIONS = 32
+_ANTHROPIC_KEEPALIVE_SECONDS = 120
+
+# Gemini 컨텍스트 캐시 유지 시간(초). 만들지 못한 내용은 이 시간 동안 다시 시도하지 않는다.
+GEMINI_CONTEXT_CACHE_TTL = 3600
+
+_lock = threading.Lock()
+_anthropic_clients = {}
+_async_anthropic_clients = {}
+_gemini_models = {}
+_gemini_cached_models = {}  # 키 → (모델 또는 None, 만료 시각)
+_gemini_cache_lock = threading.Lock()
+_gemini_configured_key = None
+
+
+def get_anthropic_client(api_key: str, max_retries: int = None):
+    """API 키별 공용 anthropic.Anthropic 클라이언트를 반환한다 (처음 호출 시 생성).
+
+    max_retries를 주면 SDK 내부 재시도 횟수만 바꾼 사본을 반환한다 (연결 풀은 공유).
+    rate_limiter의 AIMD 제어기가 429를 직접 보도록 번역에서는 0으로 쓴다.
+    """
+    import anthropic
+
+    with _lock:
+        return _cached_anthropic_client(
+            _anthropic_clients, api_key, max_retries,
+            lambda: anthropic.Anthropic(api_key=api_key, http_client=_make_anthropic_http_client()),
+        )
+
+
+def get_async_anthropic_client(api_key: str, max_retries: int = None):
+    """API 키별 공용 anthropic.AsyncAnthropic 클라이언트를 반환한다.
+
+    비동기 연결 풀은 처음 사용한 이벤트 루프에 묶이므로, 같은 루프(translator_async의
+    전용 루프)에서만 사용한다.
+    """
+    import anthropic
+
+    with _lock:
+        return _cached_anthropic_client(
+            _async_anthropic_clients, api_key, max_retries,
+            lambda: anthropic.AsyncAnthropic(
+                api_key=api_key, http_client=_make_anthropic_http_client(async_client=True),
+            ),
+        )
+
+
+def _cached_anthropic_client(cache: dict, api_key: str, max_retries, create):
+    """(API 키, 재시도 횟수)별 클라이언트를 캐시에서 찾거나 만든다. _lock 안에서 호출한다."""
+    client = cache.get((api_key, max_retries))
+    if client is None:
+        base = cache.get((api_key, None))
+        if base is None:
+            base = create()
+            cache[(api_key, None)] = base
+        client = base if max_retries is None else base.with_options(max_retries=max_retries)
+        cache[(api_key, max_retries)] = client
+    return client
+
+
+def _make_anthropic_http_client(async_client: bool = False):
+    """keep-alive 연결 풀 설정을 적용한 httpx 클라이언트. httpx를 쓸 수 없으면 SDK 기본값."""
+    try:
+        import httpx
+        from anthropic import DefaultAsyncHttpxClient, DefaultHttpxClient
+    except ImportError:
+        return None
+    client_class = DefaultAsyncHttpxClient if async_client else DefaultHttpxClient
+    return client_class(
+        limits=httpx.Limits(
+            max_connections=_ANTHROPIC_MAX_CONNECTIONS,
+            max_keepalive_connections=_ANTHROPIC_MAX_CONNECTIONS,
+            keepalive_expiry=_ANTHROPIC_KEEPALIVE_SECONDS,
+        ),
+    )
+
+
+def gemini_async_supported() -> bool:
+    """Gemini 비동기 호출(generate_content_async)을 쓸 수 있는지 반환한다.
+
+    google.generativeai의 비동기 클라이언트는 gRPC 전송만 지원하므로,
+    GEMINI_API_ENDPOINT로 REST 전송을 쓰는 경우에는 False이다.
+    """
+    return not os.environ.get("GEMINI_API_ENDPOINT", "")
+
+
+def get_gemini_model(
+    api_key: str,
+    model_name: str,
+    system_instruction: str = None,
+    json_output: bool = False,
+):
+    """(API 키, 모델, 시스템 프롬프트, 출력 형식)별 공용 GenerativeModel을 반환한다.
+
+    Args:
+        api_key: Gemini API 키
+        model_name: 모델 ID (예: "gemini-2.5-flash")
+        system_instruction: 시스템 프롬프트
+        json_output: True이면 JSON 응답(response_mime_type)을 요청한다.
+    """
+    import google.generativeai as genai
+
+    key = (api_key, model_name, system_instruction, json_output)
+    with _lock:
+        model = _gemini_models.get(key)
+        if model is None:
+            _configure_gemini(api_key)
+            model = genai.GenerativeModel(
+                model_name,
+                system_instruction=system_instruction,
+                generation_config={"response_mime_type": "application/json"} if json_output else None,
+            )
+            _gemini_models[key] = model
+        return model
+
+
+def _configure_gemini(api_key: str) -> None:
+    """API 키가 바뀌었을 때만 genai.configure를 호출한다. _lock 안에서 호출한다."""
+    global _gemini_configured_key
+    import google.generativeai as genai
+
+    if _gemini_configured_key != api_key:
+        endpoint = os.environ.get("GEMINI_API_ENDPOINT", "")
+        if endpoint:
+            genai.configure(api_key=api_key, transport="rest", client_options={"api_endpoint": endpoint})
+        else:
+            genai.configure(api_key=api_key)
+        _gemini_configured_key = api_key
+
+
+def get_gemini_cached_model(
+    api_key: str,
+    model_name: str,
+    system_instruction: str,
+    context: str,
+):
+    """system_instruction과 context를 Gemini 컨텍스트 캐시에 올린 GenerativeModel을 반환한다.
+
+    여러 요청이 같은 긴 앞부분(예: 한국법 조문 목록)을 공유할 때 쓴다. 반환된 모델에는
+    요청마다 달라지는 부분만 보낸다. 캐시는 GEMINI_CONTEXT_CACHE_TTL 동안 재사용하고
+    만료가 가까우면 새로 만든다.
+
+    캐시를 만들 수 없으면(최소 토큰 수 미달, 지원하지 않는 전송 등) None을 반환한다.
+    이때는 get_gemini_model의 모델에 context를 프롬프트 앞부분으로 붙여 보낸다.
+    """
+    import google.generativeai as genai
+    from google.generativeai import caching
+
+    digest = hashlib.sha256(context.encode("utf-8")).hexdigest()
+    key = (api_key, model_name, system_instruction, digest)
+    # 같은 내용의 캐시를 여러 스레드가 동시에 만들지 않도록 생성 전체를 잠근다
+    with _gemini_cache_lock:
+        model, expires_at = _gemini_cached_models.get(key, (None, 0))
+        if time.time() < expires_at:
+            return model
+        with _lock:
+            _configure_gemini(api_key)
+        try:
+            cache = caching.CachedContent.create(
+                model=f"models/{model_name}",
+                system_instruction=system_instruction,
+                contents=[context],
+                ttl=datetime.timedelta(seconds=GEMINI_CONTEXT_CACHE_TTL),
+            )
+            model = genai.GenerativeModel.from_cached_content(cached_content=cache)
+        except Exception as e:
+            print(f"[Gemini 컨텍스트 캐시] 생성 실패, 프롬프트에 포함하여 전송: {type(e).__name__}")
+            model = None
+        # 만료 1분 전에 새로 만든다
+        _gemini_cached_models[key] = (model, time.time() + GEMINI_CONTEXT_CACHE_TTL - 60)
+        return model
@@ -3,6 +3,7 @@ import os
 import re
 import sys
 import glob
+import time
 import unicodedata
 import warnings
 import pandas as pd
@@ -15,14 +16,19 @@ warnings.filterwarnings('ignore', category=FutureWarning)
 
 from pdf_parser import (
     parse_pdf, split_articles, _detect_lang,
-    extract_structured_articles, save_structured_to_excel
+    extract_structured_articles, iter_structured_articles, save_structured_to_excel
 )
 from html_parser import parse_eu_html_to_dataframe, parse_china_html_to_dataframe
 from translator import translate_batch, _clean_translation_output
+import job_queue
+import translation_journal
+import translation_memory
 from embedder import (
+    BatchMatchError,
     find_similar_korean,
     find_similar_korean_ai,
     find_similar_korean_batch,
+    prompt_cache_stats,
     select_relevant_korean_laws,
 )
 
@@ -709,6 +715,16 @@ def _detect_country_from_filename(filename: str) -> str:
     return ''
 
 
+def _structured_excel_path(base_name_structured: str) -> str:
+    """구조화 엑셀 저장 경로 (구조화법률 폴더의 국가별 하위 폴더, 국가 감지 실패 시 루트 폴더)."""
+    structured_dir = _safe_join(DATA_DIR, "output", "구조화법률")
+    country = _detect_country_from_filename(base_name_structured)
+    if country:
+        structured_dir = os.path.join(structured_dir, country)
+    os.makedirs(structured_dir, exist_ok=True)
+    return os.path.join(structured_dir, f"{base_name_structured}.xlsx")
+
+
 def _korean_law_name(source: str) -> str:
     """PDF/Excel 파일명에서 한국법 명칭 추출. 예: '구조화_한국_특허법(법률)(...).xlsx' → '한국_특허법'"""
     name = source.replace(".pdf", "").replace(".PDF", "").replace(".xlsx", "").replace(".XLSX", "").replace(".rtf", "").replace(".RTF", "")
@@ -757,6 +773,157 @@ def _esc(text: str) -> str:
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
+def _show_translation_memory_stats(before: dict) -> None:
+    """이번 번역에서 번역 메모리가 적중/미적중한 횟수를 표시한다."""
+    after = translation_memory.stats()
+    hits = after["hits"] - before["hits"]
+    misses = after["misses"] - before["misses"]
+    if hits + misses == 0:
+        return
+    st.caption(
+        f"번역 메모리: 적중 {hits}회 / 미적중 {misses}회 "
+        f"(적중률 {hits / (hits + misses):.0%}, API 호출 {hits}회 절약)"
+    )
+
+
+def _match_progress_callback(progress_bar, label: str):
+    """일괄 매칭의 (완료 배치 수, 전체 배치 수)를 진행률 막대에 표시하는 콜백을 만든다."""
+    def _update(current, total):
+        progress_bar.progress(current / total, text=f"{label}... (배치 {current}/{total})")
+    return _update
+
+
+def _match_batch_inline(articles: list[dict], korea_index: dict, relevant_sources, progress_callback) -> dict:
+    """화면에서 일괄 매칭을 실행한다. 실패한 배치는 오류로 표시하고 성공한 배치의 결과를 반환한다."""
+    cache_before = prompt_cache_stats()
+    try:
+        results = find_similar_korean_batch(
+            articles, korea_index, relevant_law_sources=relevant_sources, progress_callback=progress_callback,
+        )
+    except BatchMatchError as e:
+        st.error(f"❌ 일괄 매칭 오류: {e}")
+        results = e.results
+    _show_prompt_cache_stats(cache_before)
+    return results
+
+
+def _show_prompt_cache_stats(before: dict) -> None:
+    """이번 매칭에서 한국법 조문 목록이 프롬프트 캐시에서 읽힌 비율을 제공자별로 표시한다."""
+    parts = []
+    for provider, name in (("claude", "Claude"), ("gemini", "Gemini")):
+        after = prompt_cache_stats()[provider]
+        input_tokens = after["input_tokens"] - before[provider]["input_tokens"]
+        if not input_tokens:
+            continue
+        cached = after["cached_tokens"] - before[provider]["cached_tokens"]
+        parts.append(f"{name} 입력 토큰 {input_tokens:,}개 중 {cached:,}개 캐시 적중 ({cached / input_tokens:.0%})")
+    if parts:
+        st.caption("프롬프트 캐시: " + " / ".join(parts))
+
+
+def _show_resumed_groups(before: int) -> None:
+    """이번 번역에서 중단된 이전 실행의 결과를 이어받았으면 알린다."""
+    resumed = translation_journal.resumed_groups() - before
+    if resumed:
+        st.info(f"이전에 중단된 번역에서 조문 {resumed}개를 이어받고 나머지만 번역했습니다.")
+
+
+# 스트리밍 번역 패널: 한 번에 보여줄 조문 수와 조문별로 보여줄 번역문 끝부분 길이
+_STREAM_PANEL_MAX_ARTICLES = 5
+_STREAM_PANEL_TAIL_CHARS = 600
+
+
+def _stream_panel_callback(panel):
+    """번역 중인 조문의 부분 번역문을 panel(st.empty)에 표시하는 stream_callback을 만든다."""
+    def _render(partials: dict) -> None:
+        with panel.container():
+            if not partials:
+                return
+            st.caption(f"번역 중인 조문 {len(partials)}개 (실시간)")
+            for label, texts in list(partials.items())[:_STREAM_PANEL_MAX_ARTICLES]:
+                st.markdown(f"**{label}**")
+                columns = st.columns(2)
+                for column, engine, name in zip(columns, ("gemini", "claude"), ("Gemini", "Claude")):
+                    if engine in texts:
+                        text = texts[engine]
+                        if len(text) > _STREAM_PANEL_TAIL_CHARS:
+                            text = "…" + text[-_STREAM_PANEL_TAIL_CHARS:]
+                        column.caption(name)
+                        column.text(text or "(응답 대기 중)")
+    return _render
+
+
+_JOB_STATUS_LABELS = {
+    "queued": "대기",
+    "running": "실행 중",
+    "done": "완료",
+    "failed": "실패",
+    "cancelled": "취소됨",
+}
+_JOB_KIND_LABELS = {"translate": "번역", "match": "매칭", "structure": "구조화"}
+
+
+def _run_background_job(kind: str, params: dict, label: str):
+    """백그라운드 작업을 제출하고 끝날 때까지 단계별 진행률을 표시한 뒤 결과를 반환한다.
+
+    작업은 작업자 프로세스(job_worker.py)에서 실행되므로 위젯 조작으로 페이지가 다시 실행되어도
+    계속된다. 작업 ID는 결과를 받을 때까지 세션에 두므로, 다시 실행된 페이지는 같은 입력의
+    작업에 다시 연결되어 진행률 표시를 이어간다. 결과를 받은 뒤 다시 실행하면 새 작업을 만든다.
+    """
+    state_key = f"_bg_job_{job_queue.make_job_key(kind, params)}"
+    job_id = st.session_state.get(state_key)
+    job = job_queue.get(job_id) if job_id else None
+    if job is None or job["status"] in ("failed", "cancelled"):
+        job_id = job_queue.submit(kind, params, label)
+        st.session_state[state_key] = job_id
+    job_queue.ensure_worker()
+    st.caption(f"백그라운드 작업 #{job_id} — 페이지를 다시 실행하거나 다른 메뉴로 이동해도 작업은 계속됩니다.")
+
+    bars = {}
+    while True:
+        job = job_queue.get(job_id)
+        for stage, (current, total) in job["progress"].items():
+            if stage not in bars:
+                bars[stage] = st.progress(0.0, text=f"{stage} 대기 중...")
+            bars[stage].progress(
+                min(current / total, 1.0) if total else 0.0, text=f"{stage} 중... ({current}/{total})",
+            )
+        if job["status"] in job_queue.FINISHED_STATUSES:
+            st.session_state.pop(state_key, None)
+        if job["status"] == "done":
+            for stage, bar in bars.items():
+                bar.progress(1.0, text=f"{stage} 완료!")
+            return job["result"]
+        if job["status"] in ("failed", "cancelled"):
+            st.error(f"백그라운드 작업 #{job_id} {_JOB_STATUS_LABELS[job['status']]}: {job['error']}")
+            st.stop()
+        # 작업자가 비정상 종료했으면 새 작업자가 작업을 다시 대기열에 넣어 이어서 실행한다
+        if not job_queue.worker_alive():
+            job_queue.ensure_worker()
+        time.sleep(1)
+
+
+def _show_background_jobs() -> None:
+    """사이드바에 최근 백그라운드 작업의 상태·진행률을 표시한다."""
+    jobs = job_queue.list_jobs(limit=10)
+    if not jobs:
+        st.caption("최근 작업 없음")
+        return
+    for job in jobs:
+        kind = _JOB_KIND_LABELS.get(job["kind"], job["kind"])
+        status = _JOB_STATUS_LABELS.get(job["status"], job["status"])
+        progress = ", ".join(f"{stage} {current}/{total}" for stage, (current, total) in job["progress"].items())
+        st.caption(f"#{job['id']} {kind} · {job['label']} — {status}" + (f" ({progress})" if progress else ""))
+        if job["status"] in job_queue.ACTIVE_STATUSES and not job["cancel_requested"]:
+            if st.button("취소", key=f"job_cancel_{job['id']}"):
+                job_queue.cancel(job["id"])
+
+
+# Streamlit 1.37 이상이면 작업 현황만 주기적으로 다시 그린다
+if hasattr(st, "fragment"):
+    _show_background_jobs = st.fragment(run_every=5)(_show_background_jobs)
+
+
 # ── 공통 스타일 ──────────────────────────────────────────────
 DETAIL_STYLE = """
 <style>
@@ -900,6 +1067,10 @@ with st.sidebar:
 
     st.divider()
 
+    # 백그라운드 작업 현황
+    with st.expander("백그라운드 작업"):
+        _show_background_jobs()
+
     # 도움말
     with st.expander("사용 가이드"):
         st.markdown("""
@@ -957,6 +1128,9 @@ if page == "법령 구조화":
         html_url = None
         struct_pdf_selected = None
         use_ai_titles = False
+        pdf_workers = 1
+        title_workers = 1
+        struct_background = False
 
     elif struct_country in ["중국", "유럽(EPC)"]:
         # 중국, 유럽은 HTML URL 또는 파일 업로드
@@ -976,6 +1150,9 @@ if page == "법령 구조화":
             uploaded_file = None
             struct_pdf_selected = None
             use_ai_titles = False
+            pdf_workers = 1
+            title_workers = 1
+            struct_background = False
         else:
             html_url = None
             struct_folder = COUNTRY_MAP[struct_country]
@@ -993,6 +1170,9 @@ if page == "법령 구조화":
             )
             uploaded_file = None
             use_ai_titles = False
+            pdf_workers = 1
+            title_workers = 1
+            struct_background = False
     else:
         # 기타 국가는 파일 업로드만
         input_method = "파일 업로드"
@@ -1020,6 +1200,34 @@ if page == "법령 구조화":
             key="struct_ai_titles",
         )
 
+        title_workers = st.number_input(
+            "AI 제목 추출 동시 요청 수",
+            min_value=1,
+            max_value=16,
+            value=4,
+            step=1,
+            disabled=not use_ai_titles,
+            help="여러 조문의 제목을 동시에 요청합니다. 전체 요청 속도는 분당 한도(GEMINI_RPM) 안에서 조절됩니다.",
+            key="struct_title_workers",
+        )
+
+        pdf_workers = st.number_input(
+            "PDF 추출 프로세스 수",
+            min_value=1,
+            max_value=max(1, os.cpu_count() or 1),
+            value=1,
+            step=1,
+            help="2 이상이면 PDF 페이지를 여러 프로세스에서 나누어 추출합니다. 페이지가 많은 법령에서 빨라집니다.",
+            key="struct_pdf_workers",
+        )
+
+        struct_background = st.checkbox(
+            "백그라운드 작업으로 실행",
+            key="struct_background",
+            help="PDF/RTF 구조화를 별도 작업자 프로세스에서 실행하고 결과 엑셀을 저장합니다. "
+                 "실행 중에 화면을 조작하거나 다른 메뉴로 이동해도 작업이 계속됩니다.",
+        )
+
     # 실행 버튼
     can_run = False
     if struct_country == "일본":
@@ -1039,6 +1247,7 @@ if page == "법령 구조화":
     if struct_run:
         output_dir = os.path.join(DATA_DIR, "output")
         os.makedirs(output_dir, exist_ok=True)
+        struct_saved = False
 
         with st.status("법령 구조화 파싱 중...", expanded=True) as status:
             # 일본 HTML 파일 업로드 처리
@@ -1095,7 +1304,21 @@ if page == "법령 구조화":
                 # XML 파일인지 PDF 파일인지 확인
                 file_extension = os.path.splitext(struct_pdf_selected)[1].lower()
 
-                if file_extension == '.xml':
+                if struct_background and file_extension in ('.pdf', '.rtf'):
+                    # 작업자 프로세스에서 구조화하고 엑셀까지 저장한다
+                    base_name_no_ext = _basename(struct_pdf_selected).rsplit('.', 1)[0]
+                    excel_path = _structured_excel_path(f"구조화_{struct_country}_{base_name_no_ext}")
+                    result = _run_background_job("structure", {
+                        "file_path": struct_pdf_selected,
+                        "use_ai_titles": use_ai_titles,
+                        "workers": int(pdf_workers),
+                        "title_workers": int(title_workers),
+                        "excel_path": excel_path,
+                    }, label=_basename(struct_pdf_selected))
+                    df_structured = pd.DataFrame(result["rows"])
+                    struct_saved = True
+                    st.write(f"{len(df_structured)}개 항목 추출 (조/항/호 단위)")
+                elif file_extension == '.xml':
                     # XML 파일 처리 (독일법)
                     from pdf_parser import extract_structured_articles_from_xml
                     st.write("독일 법령 XML 파싱 중...")
@@ -1112,6 +1335,7 @@ if page == "법령 구조화":
                         struct_pdf_selected,
                         use_ai_titles=use_ai_titles,
                         gemini_api_key=st.secrets.get("GEMINI_API_KEY", "") if use_ai_titles else None,
+                        title_workers=int(title_workers),
                     )
                     st.write(f"{len(df_structured)}개 항목 추출 (조/항/호 단위)")
                 else:
@@ -1129,12 +1353,28 @@ if page == "법령 구조화":
                     else:
                         update_progress = None
 
-                    df_structured = extract_structured_articles(
+                    # 조문 단위로 받아 앞 조문부터 미리보기를 갱신
+                    rows = []
+                    preview_text = st.empty()
+                    preview_table = st.empty()
+                    for row in iter_structured_articles(
                         struct_pdf_selected,
                         use_ai_titles=use_ai_titles,
                         gemini_api_key=gemini_api_key,
                         progress_callback=update_progress,
-                    )
+                        workers=int(pdf_workers),
+                        title_workers=int(title_workers),
+                    ):
+                        rows.append(row)
+                        if len(rows) % 20 == 0:
+                            preview_text.text(f"{len(rows)}개 항목 추출 중... (현재: {row['조문번호']})")
+                        if len(rows) == 20:
+                            preview_table.dataframe(
+                                pd.DataFrame(rows), use_container_width=True, hide_index=True
+                            )
+                    preview_text.empty()
+                    preview_table.empty()
+                    df_structured = pd.DataFrame(rows)
                     st.write(f"{len(df_structured)}개 항목 추출 (조/항/호 단위)")
 
                 # 파일명 생성
@@ -1143,10 +1383,6 @@ if page == "법령 구조화":
                 st.error("파일을 선택하거나 URL을 입력해주세요.")
                 st.stop()
 
-            # 구조화 파일은 구조화법률 폴더의 국가별 하위 폴더에 저장
-            structured_dir = _safe_join(DATA_DIR, "output", "구조화법률")
-            os.makedirs(structured_dir, exist_ok=True)
-
             # 파일명 생성
             if struct_country == "일본" and uploaded_file:
                 # 일본 업로드 파일의 경우
@@ -1159,17 +1395,10 @@ if page == "법령 구조화":
                 base_name_no_ext = _basename(struct_pdf_selected).rsplit('.', 1)[0]
                 base_name_structured = f"구조화_{struct_country}_{base_name_no_ext}"
 
-            # 국가별 하위 폴더 생성 및 저장
-            country = _detect_country_from_filename(base_name_structured)
-            if country:
-                country_dir = os.path.join(structured_dir, country)
-                os.makedirs(country_dir, exist_ok=True)
-                excel_path = os.path.join(country_dir, f"{base_name_structured}.xlsx")
-            else:
-                # 국가 감지 실패 시 루트 폴더에 저장
-                excel_path = os.path.join(structured_dir, f"{base_name_structured}.xlsx")
-
-            save_structured_to_excel(df_structured, excel_path)
+            # 구조화 파일은 구조화법률 폴더의 국가별 하위 폴더에 저장
+            excel_path = _structured_excel_path(base_name_structured)
+            if not struct_saved:
+                save_structured_to_excel(df_structured, excel_path)
             st.write(f"저장 완료: `{excel_path}`")
 
             status.update(label="구조화 완료", state="complete")
@@ -1178,12 +1407,9 @@ if page == "법령 구조화":
         st.subheader("구조화 결과 미리보기")
         st.dataframe(df_structured.head(20), use_container_width=True, hide_index=True)
 
-        # Excel 다운로드 버튼 추가
-        import io
-        excel_buffer = io.BytesIO()
-        with pd.ExcelWriter(excel_buffer, engine="openpyxl") as writer:
-            df_structured.to_excel(writer, index=False, sheet_name="법조문")
-        excel_data = excel_buffer.getvalue()
+        # Excel 다운로드 버튼 추가 (저장한 파일을 그대로 내려준다)
+        with open(excel_path, "rb") as f:
+            excel_data = f.read()
 
         st.download_button(
             label="📥 구조화 Excel 다운로드",
@@ -1260,6 +1486,27 @@ elif page == "번역 실행":
             help="사용할 번역 서비스를 선택하세요. API 키가 없는 경우 해당 서비스는 건너뜁니다.",
         )
 
+    async_translation = st.checkbox(
+        "고속 번역 (비동기 엔진)",
+        key="trans_async_mode",
+        help="조문 수가 많은 법령용. 제공자별 동시 요청 수·분당 요청 수 한도"
+             "(GEMINI_RPM, CLAUDE_RPM 등 환경변수)까지 요청을 보내 번역합니다.",
+    )
+
+    background_jobs = st.checkbox(
+        "백그라운드 작업으로 실행",
+        key="trans_background",
+        help="번역과 한국법 매칭을 별도 작업자 프로세스에서 실행합니다. 실행 중에 화면을 조작하거나 "
+             "새로고침해도 작업이 계속되며, 여러 법령을 동시에 번역할 수 있습니다.",
+    )
+
+    streaming_translation = st.checkbox(
+        "실시간 번역 표시 (스트리밍)",
+        key="trans_streaming",
+        help="번역문을 스트리밍으로 받아 번역 중인 조문의 번역문을 바로 보여줍니다. "
+             "고속 번역·백그라운드 작업에서는 적용되지 않습니다.",
+    )
+
     st.divider()
 
     # ── 한국법 선택 ──
@@ -1599,24 +1846,48 @@ elif page == "번역 실행":
 
             # ── 3) 번역 실행 ──
             st.subheader("번역 진행")
-            progress_bar = st.progress(0, text="번역 준비 중...")
-
-            def _update_progress(current, total):
-                progress_bar.progress(current / total, text=f"번역 중... ({current}/{total})")
 
             # 번역 서비스 선택에 따라 플래그 설정
             use_gemini = "Gemini" in translation_service
             use_claude = "Claude" in translation_service
 
-            translated = translate_batch(
-                foreign_articles,
-                source_lang=source_lang,
-                progress_callback=_update_progress,
-                group_by_article=True,
-                use_gemini=use_gemini,
-                use_claude=use_claude,
-            )
-            progress_bar.progress(1.0, text="번역 완료!")
+            if background_jobs:
+                translated = _run_background_job("translate", {
+                    "articles": foreign_articles,
+                    "source_lang": source_lang,
+                    "use_gemini": use_gemini,
+                    "use_claude": use_claude,
+                    "async_mode": async_translation,
+                }, label=base_name)
+            else:
+                progress_bar = st.progress(0, text="번역 준비 중...")
+                diff_progress_bar = st.progress(0, text="차이 요약 대기 중...")
+
+                def _update_progress(current, total):
+                    progress_bar.progress(current / total, text=f"번역 중... ({current}/{total})")
+
+                def _update_diff_progress(current, total):
+                    diff_progress_bar.progress(current / total, text=f"차이 요약 중... ({current}/{total})")
+
+                stream_panel = st.empty()
+                memory_before = translation_memory.stats()
+                resumed_before = translation_journal.resumed_groups()
+                translated = translate_batch(
+                    foreign_articles,
+                    source_lang=source_lang,
+                    progress_callback=_update_progress,
+                    diff_progress_callback=_update_diff_progress,
+                    group_by_article=True,
+                    use_gemini=use_gemini,
+                    use_claude=use_claude,
+                    async_mode=async_translation,
+                    stream_callback=_stream_panel_callback(stream_panel) if streaming_translation else None,
+                )
+                stream_panel.empty()
+                progress_bar.progress(1.0, text="번역 완료!")
+                diff_progress_bar.progress(1.0, text="차이 요약 완료!")
+                _show_translation_memory_stats(memory_before)
+                _show_resumed_groups(resumed_before)
 
             # ── 4) 유사 한국법 AI 매칭 ──
             st.subheader("한국법 유사 조문 매칭")
@@ -1663,13 +1934,20 @@ elif page == "번역 실행":
                         'translated': combined_translated
                     })
 
-            # 일괄 매칭 실행 (한 번의 API 호출)
-            match_progress.progress(0.5, text="한국법 조문 일괄 매칭 중... (AI 처리 중)")
-            batch_results = find_similar_korean_batch(
-                batch_articles,
-                korea_index,
-                relevant_law_sources=relevant_sources
-            )
+            # 일괄 매칭 실행 (배치별 API 호출을 동시에 진행)
+            if background_jobs:
+                batch_results = _run_background_job("match", {
+                    "articles": batch_articles,
+                    "korea_index": korea_index,
+                    "relevant_law_sources": relevant_sources,
+                }, label=base_name)
+            else:
+                batch_results = _match_batch_inline(
+                    batch_articles,
+                    korea_index,
+                    relevant_sources,
+                    _match_progress_callback(match_progress, "한국법 조문 일괄 매칭 중"),
+                )
 
             # 디버깅: 매칭 결과 확인
             st.write(f"batch_results 키: {list(batch_results.keys())[:10]}")
@@ -2012,23 +2290,46 @@ elif page == "번역 실행":
 
             # ── 3) 선택한 조문만 재번역 ──
             st.subheader("재번역 진행")
-            progress_bar = st.progress(0, text="재번역 준비 중...")
-
-            def _update_progress(current, total):
-                progress_bar.progress(current / total, text=f"재번역 중... ({current}/{total})")
 
             use_gemini = "Gemini" in translation_service
             use_claude = "Claude" in translation_service
 
-            translated = translate_batch(
-                retrans_articles,
-                source_lang=source_lang,
-                progress_callback=_update_progress,
-                group_by_article=True,
-                use_gemini=use_gemini,
-                use_claude=use_claude,
-            )
-            progress_bar.progress(1.0, text="재번역 완료!")
+            # 재번역은 번역 메모리를 조회하지 않고 새 번역으로 메모리를 갱신한다
+            if background_jobs:
+                translated = _run_background_job("translate", {
+                    "articles": retrans_articles,
+                    "source_lang": source_lang,
+                    "use_gemini": use_gemini,
+                    "use_claude": use_claude,
+                    "use_memory": False,
+                    "async_mode": async_translation,
+                }, label=f"{base_name} (재번역)")
+            else:
+                progress_bar = st.progress(0, text="재번역 준비 중...")
+                diff_progress_bar = st.progress(0, text="차이 요약 대기 중...")
+
+                def _update_progress(current, total):
+                    progress_bar.progress(current / total, text=f"재번역 중... ({current}/{total})")
+
+                def _update_diff_progress(current, total):
+                    diff_progress_bar.progress(current / total, text=f"차이 요약 중... ({current}/{total})")
+
+                stream_panel = st.empty()
+                translated = translate_batch(
+                    retrans_articles,
+                    source_lang=source_lang,
+                    progress_callback=_update_progress,
+                    diff_progress_callback=_update_diff_progress,
+                    group_by_article=True,
+                    use_gemini=use_gemini,
+                    use_claude=use_claude,
+                    use_memory=False,
+                    async_mode=async_translation,
+                    stream_callback=_stream_panel_callback(stream_panel) if streaming_translation else None,
+                )
+                stream_panel.empty()
+                progress_bar.progress(1.0, text="재번역 완료!")
+                diff_progress_bar.progress(1.0, text="차이 요약 완료!")
 
             # ── 4) 선택한 조문만 재매칭 ──
             st.subheader("한국법 재매칭")
@@ -2069,10 +2370,17 @@ elif page == "번역 실행":
                         'translated': str(first_item.get("gemini", "")) or str(first_item.get("claude", ""))
                     })
 
-            match_progress.progress(0.5, text="한국법 조문 재매칭 중... (AI 처리 중)")
-            batch_results = find_similar_korean_batch(
-                batch_articles, korea_index, relevant_law_sources=relevant_sources
-            )
+            if background_jobs:
+                batch_results = _run_background_job("match", {
+                    "articles": batch_articles,
+                    "korea_index": korea_index,
+                    "relevant_law_sources": relevant_sources,
+                }, label=f"{base_name} (재매칭)")
+            else:
+                batch_results = _match_batch_inline(
+                    batch_articles, korea_index, relevant_sources,
+                    _match_progress_callback(match_progress, "한국법 조문 재매칭 중"),
+                )
 
             for article_num, group in article_groups.items():
                 if article_num == "전문" or article_num.endswith("(삭제)"):
@@ -2384,11 +2692,18 @@ elif page == "번역 실행":
                 })
 
             match_progress = st.progress(0, text="한국법 조문 재매칭 중...")
-            match_progress.progress(0.5, text="한국법 조문 재매칭 중... (AI 처리 중)")
 
-            batch_results = find_similar_korean_batch(
-                batch_articles, korea_index, relevant_law_sources=relevant_sources
-            )
+            if background_jobs:
+                batch_results = _run_background_job("match", {
+                    "articles": batch_articles,
+                    "korea_index": korea_index,
+                    "relevant_law_sources": relevant_sources,
+                }, label=f"{_basename(foreign_excel_selected)} (재매칭)")
+            else:
+                batch_results = _match_batch_inline(
+                    batch_articles, korea_index, relevant_sources,
+                    _match_progress_callback(match_progress, "한국법 조문 재매칭 중"),
+                )
 
             match_progress.progress(1.0, text="재매칭 완료!")
 
@@ -0,0 +1,93 @@
+"""편/장/절 계층 배정 벤치마크 (기존 선형 탐색 vs HierarchyIndex)
+
+5,000개 조문으로 된 가상의 한국 법령 텍스트를 만들어,
+조문마다 계층 목록을 처음부터 훑는 기존 방식과 bisect 색인 방식의
+시간을 비교하고 배정 결과가 같은지 확인한다.
+
+실행: python bench_hierarchy.py [조문 수]
+"""
+
+import sys
+import time
+
+from parsers.hierarchy import HierarchyIndex
+from parsers.korea import _split_korean, _detect_hierarchy_korean
+
+
+def make_synthetic_statute(article_count: int) -> str:
+    """편 > 장 > 절 구조를 가진 가상의 한국 법령 텍스트를 만든다.
+
+    편마다 장 5개, 장마다 절 4개, 절마다 조문 25개를 둔다.
+    """
+    lines = ["가상법", "[시행 2025. 1. 1.] [법률 제1호, 2025. 1. 1., 제정]"]
+    article_no = 0
+    part_no = chapter_no = section_no = 0
+    while article_no < article_count:
+        if article_no % 500 == 0:
+            part_no += 1
+            lines.append(f"제{part_no}편 가상 편 제목 {part_no}")
+        if article_no % 100 == 0:
+            chapter_no += 1
+            lines.append(f"제{chapter_no}장 가상 장 제목 {chapter_no}")
+        if article_no % 25 == 0:
+            section_no += 1
+            lines.append(f"제{section_no}절 가상 절 제목 {section_no}")
+        article_no += 1
+        lines.append(f"제{article_no}조(목적{article_no}) 이 법은 제{article_no}조의 목적을 정한다.")
+        lines.append(f"① 제{article_no}조 제1항의 내용이다. 다른 조문(제{max(1, article_no - 1)}조)을 참조한다.")
+        lines.append(f"② 제{article_no}조 제2항의 내용이다.")
+    return "\n".join(lines)
+
+
+def legacy_assign(text: str, articles: list[dict], hierarchy: list[dict]) -> list[tuple]:
+    """기존 방식: text.find로 조문 위치를 찾고, 계층 목록을 처음부터 훑는다."""
+    levels = []
+    for article in articles:
+        article_pos = text.find(article["text"])
+        part = chapter = section = ""
+        for h in hierarchy:
+            if h["start_pos"] > article_pos:
+                break
+            if h["type"] == "part":
+                part, chapter, section = h["title"], "", ""
+            elif h["type"] == "chapter":
+                chapter, section = h["title"], ""
+            elif h["type"] == "section":
+                section = h["title"]
+        levels.append((part, chapter, section))
+    return levels
+
+
+def indexed_assign(articles: list[dict], hierarchy: list[dict]) -> list[tuple]:
+    """색인 방식: 분리 시 기록한 위치를 HierarchyIndex에서 조회한다."""
+    index = HierarchyIndex(hierarchy)
+    return [index.at(a["start"]) for a in articles]
+
+
+if __name__ == "__main__":
+    article_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    print("=" * 70)
+    print(f"계층 배정 벤치마크 (가상 법령, 조문 {article_count}개)")
+    print("=" * 70)
+
+    text = make_synthetic_statute(article_count)
+    hierarchy = _detect_hierarchy_korean(text)
+    articles = [a for a in _split_korean(text) if a["id"] != "전문"]
+    print(f"텍스트 길이: {len(text):,}자, 계층 경계: {len(hierarchy)}개, 조문: {len(articles)}개")
+
+    start = time.perf_counter()
+    legacy = legacy_assign(text, articles, hierarchy)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = indexed_assign(articles, hierarchy)
+    indexed_time = time.perf_counter() - start
+
+    print(f"\n기존 방식 (find + 선형 탐색): {legacy_time * 1000:10.1f} ms")
+    print(f"색인 방식 (HierarchyIndex):   {indexed_time * 1000:10.1f} ms")
+    print(f"속도 향상: {legacy_time / indexed_time:.0f}x")
+
+    identical = legacy == indexed
+    print(f"결과 동일: {'✅' if identical else '❌'}")
+    sys.exit(0 if identical else 1)
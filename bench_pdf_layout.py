@@ -0,0 +1,131 @@
+"""PDF 레이아웃 추출 벤치마크 (기존 crop/filter 방식 vs NumPy 배열 방식)
+
+DATA/EPC, DATA/KOREA의 PDF 각 페이지에 대해 문자(chars)를 미리 읽어 둔 뒤,
+2단 판별·컬럼 분리·위첨자 제거·텍스트 생성 단계만 측정한다.
+두 방식의 결과 텍스트가 같은지도 페이지마다 확인한다.
+
+실행: python bench_pdf_layout.py [PDF 경로 ...]
+"""
+
+import glob
+import sys
+import time
+from collections import Counter
+
+import pdfplumber
+
+from parsers.base import _extract_text_with_layout
+
+
+def _legacy_without_superscript(page) -> str:
+    """기존 방식: Counter로 최빈 크기를 구하고 page.filter로 위첨자 제거"""
+    chars = page.chars
+    if not chars:
+        return page.extract_text(layout=True) or ""
+    sizes = [round(c["size"], 1) for c in chars]
+    dominant_size = Counter(sizes).most_common(1)[0][0]
+    threshold = dominant_size * 0.75
+    filtered = [c for c in chars if c["size"] >= threshold]
+    if not filtered:
+        return page.extract_text(layout=True) or ""
+    filtered_page = page.filter(
+        lambda obj: obj.get("size", 999) >= threshold
+        if obj["object_type"] == "char"
+        else True
+    )
+    return filtered_page.extract_text(layout=True) or ""
+
+
+def _legacy_with_layout(page, filter_superscript: bool = True) -> str:
+    """기존 방식: 문자 목록을 여러 번 순회하고 좌우 컬럼을 crop하여 추출"""
+    if not page.chars:
+        return page.extract_text() or ""
+    page_width = page.width
+    page_height = page.height
+    mid_x = page_width / 2
+    x_coords = [c["x0"] for c in page.chars]
+    left_chars = sum(1 for x in x_coords if x < mid_x)
+    right_chars = sum(1 for x in x_coords if x >= mid_x)
+    total_chars = len(x_coords)
+    is_two_column = (
+        total_chars > 0 and
+        left_chars / total_chars > 0.3 and
+        right_chars / total_chars > 0.3
+    )
+    if is_two_column:
+        sorted_x = sorted(set([c["x0"] for c in page.chars]))
+        max_gap = 0
+        gap_pos = mid_x
+        for i in range(len(sorted_x) - 1):
+            gap = sorted_x[i + 1] - sorted_x[i]
+            if (abs(sorted_x[i] - mid_x) < page_width * 0.2 and gap > max_gap):
+                max_gap = gap
+                gap_pos = (sorted_x[i] + sorted_x[i + 1]) / 2
+        if max_gap > page_width * 0.05:
+            mid_x = gap_pos
+        left_crop = page.crop((0, 0, mid_x, page_height))
+        right_crop = page.crop((mid_x, 0, page_width, page_height))
+        if filter_superscript:
+            left_text = _legacy_without_superscript(left_crop)
+            right_text = _legacy_without_superscript(right_crop)
+        else:
+            left_text = left_crop.extract_text(layout=True) or ""
+            right_text = right_crop.extract_text(layout=True) or ""
+        return left_text + "\n" + right_text
+    if filter_superscript:
+        return _legacy_without_superscript(page)
+    return page.extract_text(layout=True) or ""
+
+
+def _time_page(fn, page, repeat: int) -> tuple[float, str]:
+    best = float("inf")
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = fn(page)
+        best = min(best, time.perf_counter() - start)
+    return best, text
+
+
+def bench_file(pdf_path: str, repeat: int = 3) -> tuple[float, float, bool]:
+    legacy_total = 0.0
+    vector_total = 0.0
+    identical = True
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page.chars  # pdfminer 파싱은 두 방식 공통이므로 측정에서 제외
+            legacy_time, legacy_text = _time_page(_legacy_with_layout, page, repeat)
+            vector_time, vector_text = _time_page(_extract_text_with_layout, page, repeat)
+            legacy_total += legacy_time
+            vector_total += vector_time
+            if legacy_text != vector_text:
+                identical = False
+                print(f"  ⚠️  {page.page_number}페이지 결과 불일치")
+        page_count = len(pdf.pages)
+
+    print(f"  페이지 수: {page_count}")
+    print(f"  기존 방식:  {legacy_total * 1000:8.1f} ms ({legacy_total / page_count * 1000:6.2f} ms/페이지)")
+    print(f"  배열 방식:  {vector_total * 1000:8.1f} ms ({vector_total / page_count * 1000:6.2f} ms/페이지)")
+    print(f"  속도 향상:  {legacy_total / vector_total:.2f}x")
+    print(f"  결과 동일:  {'✅' if identical else '❌'}")
+    return legacy_total, vector_total, identical
+
+
+if __name__ == "__main__":
+    pdf_files = sys.argv[1:] or sorted(
+        glob.glob("DATA/EPC/*.pdf") + glob.glob("DATA/KOREA/*.pdf")
+    )
+
+    print("=" * 70)
+    print("PDF 레이아웃 추출 벤치마크")
+    print("=" * 70)
+
+    all_identical = True
+    for pdf_path in pdf_files:
+        print(f"\n📄 {pdf_path}")
+        _, _, identical = bench_file(pdf_path)
+        all_identical = all_identical and identical
+
+    print("\n" + "=" * 70)
+    print("✅ 모든 페이지 결과 동일" if all_identical else "❌ 결과가 다른 페이지가 있습니다")
+    sys.exit(0 if all_identical else 1)
@@ -0,0 +1,292 @@
+"""정규식 정제·분리 단계 벤치마크 (기존 순차/호출마다 컴파일 vs 모듈 상수·합친 패턴)
+
+DATA/ 의 국가별 입력 파일로 파서마다 정규식 단계만 떼어 측정한다.
+- EPC: 조문 본문의 편/장/절 제목 제거 (6개 패턴 → 합친 2개 패턴)
+- 미국: Westlaw 메타데이터 제거 (13회 순차 치환 → 3회)
+- 홍콩: 조문 제목 정리·본문 끝 헤더 제거 (호출마다 컴파일 → 모듈 상수)
+- 항/호/목 파싱 (한국·영문·미국): 중첩 루프 안의 re.compile → 모듈 상수
+두 방식의 결과가 같은지도 입력마다 확인한다.
+
+실행: python bench_regex.py
+"""
+
+import glob
+import re
+import sys
+import time
+
+from parsers.base import parse_pdf, parse_rtf, _apply_cleanup_rules
+from parsers.epc import (
+    _clean_epc_annotations,
+    _ENGLISH_ARTICLE_PATTERN,
+    _HIERARCHY_HEADING_LINE_PATTERN,
+    _HIERARCHY_HEADING_INLINE_PATTERN,
+    _EN_PARAGRAPH_PATTERN,
+    _EN_ITEM_PATTERN,
+    _EN_SUBITEM_PATTERN,
+    _split_english,
+)
+from parsers.hongkong import (
+    _HK_PAGE_HEADER_RULES,
+    _HK_ARTICLE_PATTERN,
+    _HK_TITLE_CLEANUP_PATTERNS,
+    _HK_TRAILING_HEADER_PATTERN,
+    _HK_TRAILING_DIVISION_PATTERN,
+    _split_hk_english,
+)
+from parsers.korea import (
+    _KO_PARAGRAPH_PATTERN,
+    _KO_ITEM_PATTERN,
+    _KO_SUBITEM_PATTERN,
+    _KO_SUBSUBITEM_PATTERN,
+    _split_korean,
+)
+from parsers.newzealand import _split_nz_english
+from parsers.usa import (
+    _clean_us_westlaw_metadata,
+    _US_PARAGRAPH_PATTERN,
+    _US_ITEM_PATTERN,
+    _US_SUBITEM_PATTERN,
+    _US_SUBSUBITEM_PATTERN,
+    _split_us_english,
+)
+
+
+# ══════════════════════════════════════════════════════════════
+# 기존 구현 (비교 기준)
+# ══════════════════════════════════════════════════════════════
+
+def _legacy_strip_hierarchy_headings(chunks: list[str]) -> list[str]:
+    """기존 _split_english 2차 단계: 호출마다 6개 패턴을 컴파일하고 순차 적용"""
+    hierarchy_patterns = [
+        re.compile(r"^(?:PART|Part)\s+[IVX]+[^\n]*\n?", re.MULTILINE | re.IGNORECASE),
+        re.compile(r"^(?:CHAPTER|Chapter)\s+[IVX0-9]+[^\n]*\n?", re.MULTILINE | re.IGNORECASE),
+        re.compile(r"^(?:SECTION|Section)\s+[IVX]+[^\n]*\n?", re.MULTILINE | re.IGNORECASE),
+        re.compile(r"\n(?:PART|Part)\s+[IVX]+[^\n]*", re.IGNORECASE),
+        re.compile(r"\n(?:CHAPTER|Chapter)\s+[IVX0-9]+[^\n]*", re.IGNORECASE),
+        re.compile(r"\n(?:SECTION|Section)\s+[IVX]+[^\n]*", re.IGNORECASE),
+    ]
+    cleaned = []
+    for chunk in chunks:
+        for pattern in hierarchy_patterns:
+            chunk = pattern.sub("", chunk)
+        cleaned.append(chunk.strip())
+    return cleaned
+
+
+def _fused_strip_hierarchy_headings(chunks: list[str]) -> list[str]:
+    cleaned = []
+    for chunk in chunks:
+        chunk = _HIERARCHY_HEADING_LINE_PATTERN.sub("", chunk)
+        chunk = _HIERARCHY_HEADING_INLINE_PATTERN.sub("", chunk)
+        cleaned.append(chunk.strip())
+    return cleaned
+
+
+def _legacy_clean_us_westlaw_metadata(text: str) -> str:
+    """기존 _clean_us_westlaw_metadata: 메타데이터 종류마다 문서 전체를 한 번씩 치환"""
+    text = re.sub(r"(?m)^CREDIT\(S\).*?(?=^§\s*\d+|\Z)", "", text, flags=re.DOTALL | re.MULTILINE)
+    text = re.sub(r"(?m)^Notes of Decisions\s*\(\d+\)\s*$", "", text)
+    text = re.sub(r"(?m)^End of Document\s*$", "", text)
+    text = re.sub(r"(?m)^©\s*20\d{2}\s+Thomson Reuters.*$", "", text)
+    text = re.sub(r"(?m)^Currentness\s*$", "", text)
+    text = re.sub(r"(?m)^Effective:.*$", "", text)
+    text = re.sub(r"(?m)^KeyCite\s.*$", "", text)
+    text = re.sub(r"(?m)^\d+\s+U\.?S\.?C\.?A\.?\s+§\s*\d+.*$", "", text)
+    text = re.sub(r"(?m)^\d+\s+USCA\s+§\s*\d+.*$", "", text)
+    text = re.sub(r"(?m)^Current through P\.L\..*$", "", text)
+    text = re.sub(r"(?m)^Refs & Annos\s*$", "", text)
+    text = re.sub(r"(?m)^Disposition Table\s*$", "", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text
+
+
+def _legacy_clean_hk_chunks(pairs: list[tuple]) -> list[tuple]:
+    """기존 _split_hk_english 조문별 정리: 문자열 패턴으로 re.sub/re.search 호출"""
+    cleaned = []
+    for title, chunk in pairs:
+        title = re.sub(r'\s+\d{1,3}-\d{1,3}$', '', title).strip()
+        title = re.sub(r'\s+\d{1,3}$', '', title).strip()
+        title = re.sub(r'\s+R\.\s*[\d\-,\s]*$', '', title).strip()
+        title = re.sub(r'\s+Art\.\s*[\d\-,\s]*$', '', title, flags=re.IGNORECASE).strip()
+        trail_match = re.search(
+            r"\n(?:Last updated date\n[^\n]*\n)?"
+            r"(?:(?:Part|Division)\s+\d+[A-Z]?[—\-–][^\n]*\n)*"
+            r"(?:Part|Division)\s+\d+[A-Z]?\n"
+            r"(?:[^\n]+\n)*"
+            r"(?:\([^\n]+\)\n?)*"
+            r"(?:(?:Part|Division)\s+\d+[A-Z]?[—\-–][^\n]*\n?)*"
+            r"\s*$",
+            chunk
+        )
+        if trail_match:
+            chunk = chunk[:trail_match.start()].strip()
+        chunk = re.sub(
+            r"\n(?:Division)\s+\d+[A-Z]?[—\-–][^\n]+"
+            r"(?:\n[a-zA-Z][^\n(][^\n]*)?"
+            r"(?:\n\([^\n]+\))*"
+            r"\s*$",
+            "", chunk
+        ).strip()
+        cleaned.append((title, chunk))
+    return cleaned
+
+
+def _precompiled_clean_hk_chunks(pairs: list[tuple]) -> list[tuple]:
+    cleaned = []
+    for title, chunk in pairs:
+        for title_pattern in _HK_TITLE_CLEANUP_PATTERNS:
+            title = title_pattern.sub('', title).strip()
+        trail_match = _HK_TRAILING_HEADER_PATTERN.search(chunk)
+        if trail_match:
+            chunk = chunk[:trail_match.start()].strip()
+        chunk = _HK_TRAILING_DIVISION_PATTERN.sub("", chunk).strip()
+        cleaned.append((title, chunk))
+    return cleaned
+
+
+def _nested_matches(text: str, levels: list) -> list:
+    """항 → 호 → 목 순으로 중첩 분리한다.
+
+    levels가 문자열이면 기존 파서처럼 루프 안에서 매번 re.compile을 호출하고,
+    컴파일된 패턴이면 그대로 사용한다.
+    """
+    pattern = levels[0]
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    matches = list(pattern.finditer(text))
+    result = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = text[match.end():end].strip()
+        children = _nested_matches(body, levels[1:]) if len(levels) > 1 else []
+        result.append((match.group(0), body, children))
+    return result
+
+
+def _paragraph_stage(levels: list):
+    def run(texts: list[str]) -> list:
+        return [_nested_matches(t, levels) for t in texts]
+    return run
+
+
+# ══════════════════════════════════════════════════════════════
+# 측정
+# ══════════════════════════════════════════════════════════════
+
+def _best_time(fn, arg, repeat: int) -> tuple[float, object]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_stage(name: str, legacy_fn, current_fn, inputs: list, repeat: int = 5) -> bool:
+    legacy_total = 0.0
+    current_total = 0.0
+    identical = True
+    for arg in inputs:
+        legacy_time, legacy_result = _best_time(legacy_fn, arg, repeat)
+        current_time, current_result = _best_time(current_fn, arg, repeat)
+        legacy_total += legacy_time
+        current_total += current_time
+        if legacy_result != current_result:
+            identical = False
+
+    print(f"\n🔹 {name} (입력 {len(inputs)}개)")
+    print(f"  기존 방식:  {legacy_total * 1000:8.2f} ms")
+    print(f"  개선 방식:  {current_total * 1000:8.2f} ms")
+    print(f"  속도 향상:  {legacy_total / current_total:.2f}x")
+    print(f"  결과 동일:  {'✅' if identical else '❌'}")
+    return identical
+
+
+def _article_chunks(text: str, pattern) -> list[str]:
+    matches = list(pattern.finditer(text))
+    chunks = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        chunks.append(text[match.start():end].strip())
+    return chunks
+
+
+def _article_texts(articles: list[dict]) -> list[str]:
+    return [a["text"] for a in articles if a["id"] != "전문"]
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("정규식 정제·분리 단계 벤치마크")
+    print("=" * 70)
+
+    epc_texts = [parse_pdf(p) for p in sorted(glob.glob("DATA/EPC/*.pdf"))]
+    hk_texts = [parse_pdf(p) for p in sorted(glob.glob("DATA/HONGKONG/*.pdf"))]
+    nz_texts = [parse_pdf(p) for p in sorted(glob.glob("DATA/NEWZEALAND/*.pdf"))]
+    ko_texts = [parse_pdf(p) for p in sorted(glob.glob("DATA/KOREA/*.pdf"))]
+    us_texts = [parse_rtf(p) for p in sorted(glob.glob("DATA/USA/*.rtf"))]
+
+    results = []
+
+    # EPC: 조문별 편/장/절 제목 제거
+    epc_chunks = [
+        _article_chunks(_clean_epc_annotations(t), _ENGLISH_ARTICLE_PATTERN)
+        for t in epc_texts
+    ]
+    results.append(bench_stage(
+        "EPC 편/장/절 제목 제거",
+        _legacy_strip_hierarchy_headings, _fused_strip_hierarchy_headings, epc_chunks,
+    ))
+
+    # 미국: Westlaw 메타데이터 제거
+    results.append(bench_stage(
+        "미국 Westlaw 메타데이터 제거",
+        _legacy_clean_us_westlaw_metadata, _clean_us_westlaw_metadata, us_texts,
+    ))
+
+    # 홍콩: 조문 제목·본문 끝 헤더 정리
+    hk_pairs = []
+    for t in hk_texts:
+        cleaned, _ = _apply_cleanup_rules(t, _HK_PAGE_HEADER_RULES)
+        matches = list(_HK_ARTICLE_PATTERN.finditer(cleaned))
+        pairs = []
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(cleaned)
+            pairs.append((match.group(2).strip(), cleaned[match.start():end].strip()))
+        hk_pairs.append(pairs)
+    results.append(bench_stage(
+        "홍콩 조문 제목·헤더 정리",
+        _legacy_clean_hk_chunks, _precompiled_clean_hk_chunks, hk_pairs,
+    ))
+
+    # 항/호/목 파싱
+    english_levels = [_EN_PARAGRAPH_PATTERN, _EN_ITEM_PATTERN, _EN_SUBITEM_PATTERN]
+    korean_levels = [_KO_PARAGRAPH_PATTERN, _KO_ITEM_PATTERN, _KO_SUBITEM_PATTERN, _KO_SUBSUBITEM_PATTERN]
+    us_levels = [_US_PARAGRAPH_PATTERN, _US_ITEM_PATTERN, _US_SUBITEM_PATTERN, _US_SUBSUBITEM_PATTERN]
+
+    english_articles = (
+        [_article_texts(_split_english(t)) for t in epc_texts]
+        + [_article_texts(_split_hk_english(t)) for t in hk_texts]
+        + [_article_texts(_split_nz_english(t)) for t in nz_texts]
+    )
+    korean_articles = [_article_texts(_split_korean(t)) for t in ko_texts]
+    us_articles = [_article_texts(_split_us_english(t)) for t in us_texts]
+
+    for name, levels, inputs in [
+        ("영문 항/호/목 파싱 (EPC·홍콩·뉴질랜드)", english_levels, english_articles),
+        ("한국 항/호/목/세목 파싱", korean_levels, korean_articles),
+        ("미국 항/호/목/세목 파싱", us_levels, us_articles),
+    ]:
+        results.append(bench_stage(
+            name,
+            _paragraph_stage([p.pattern for p in levels]),
+            _paragraph_stage(levels),
+            inputs,
+        ))
+
+    all_identical = all(results)
+    print("\n" + "=" * 70)
+    print("✅ 모든 단계 결과 동일" if all_identical else "❌ 결과가 다른 단계가 있습니다")
+    sys.exit(0 if all_identical else 1)
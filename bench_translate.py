@@ -0,0 +1,182 @@
+"""번역 벤치마크 (고정 대기 제거 전후, 로컬 가짜 LLM 서버)
+
+요청마다 일정한 지연 후 응답하는 가짜 LLM 서버(Anthropic Messages API와
+Gemini generateContent REST API 흉내)를 로컬에 띄우고, 조문 200개로 된
+가상의 법령을 번역하여 걸린 시간을 비교한다.
+
+- 이전 방식: 항목마다 Gemini → 1초 대기 → Claude → 1초 대기 → 차이 요약,
+  batch_size(10)개마다 2초 대기
+- 현재 방식: translate_batch(group_by_article=False) — 항목별 번역·차이 요약을
+  파이프라인으로 겹쳐 실행하고, 제공자 한도(rate_limiter)를 다 쓴 경우에만 기다린다.
+- 참고: 조문 단위 그룹 번역(기본)과 비동기 엔진(async_mode=True)
+
+실제 API 클라이언트가 가짜 서버로 요청을 보내도록 ANTHROPIC_BASE_URL,
+GEMINI_API_ENDPOINT를 설정하고, 임시 폴더의 .streamlit/secrets.toml에 가짜 API 키를 둔다.
+번역 메모리는 끄고, 분당 요청 수 한도는 가짜 서버에 맞게 넉넉히 둔다
+(GEMINI_RPM·CLAUDE_RPM 환경변수로 바꿀 수 있다).
+
+실행: python bench_translate.py [조문 수] [응답 지연(초)]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Anthropic /v1/messages 와 Gemini :generateContent 요청에 지연 후 응답한다."""
+
+    latency = 0.2
+    lock = threading.Lock()
+    request_count = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        with FakeLLMHandler.lock:
+            FakeLLMHandler.request_count += 1
+        time.sleep(self.latency)
+
+        if self.path.startswith("/v1/messages"):
+            text = body["messages"][-1]["content"]
+            reply = {
+                "id": "msg_fake",
+                "type": "message",
+                "role": "assistant",
+                "model": body.get("model", ""),
+                "content": [{"type": "text", "text": f"번역문(Claude): {text[:40]}"}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": len(text) // 4, "output_tokens": 20},
+            }
+        elif ":generateContent" in self.path:
+            text = body["contents"][-1]["parts"][0]["text"]
+            answer = f"번역문(Gemini): {text[:40]}"
+            if "**입력:**" in text:
+                # 여러 항목을 묶은 JSON 요청(차이 요약 배치 등)에는 항목별 JSON으로 응답한다
+                batch = json.loads(text.split("**입력:**", 1)[1].split("**응답 형식", 1)[0])
+                answer = json.dumps(
+                    {key: f"번역문(Gemini): {json.dumps(value, ensure_ascii=False)[:40]}" for key, value in batch.items()},
+                    ensure_ascii=False,
+                )
+            reply = {
+                "candidates": [{
+                    "content": {"parts": [{"text": answer}], "role": "model"},
+                    "finishReason": "STOP",
+                    "index": 0,
+                }],
+            }
+        else:
+            self.send_error(404)
+            return
+
+        data = json.dumps(reply, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_server(latency: float) -> ThreadingHTTPServer:
+    """가짜 LLM 서버를 빈 포트에 띄우고 API 주소·가짜 키를 환경에 설정한다."""
+    FakeLLMHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLMHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    os.environ["ANTHROPIC_BASE_URL"] = base_url
+    os.environ["GEMINI_API_ENDPOINT"] = base_url
+    os.environ["TRANSLATION_MEMORY"] = "0"
+    os.environ.setdefault("GEMINI_RPM", "6000")
+    os.environ.setdefault("CLAUDE_RPM", "6000")
+
+    # st.secrets는 현재 폴더의 .streamlit/secrets.toml을 읽는다
+    work_dir = tempfile.mkdtemp(prefix="bench_translate_")
+    os.makedirs(os.path.join(work_dir, ".streamlit"))
+    with open(os.path.join(work_dir, ".streamlit", "secrets.toml"), "w", encoding="utf-8") as f:
+        f.write('GEMINI_API_KEY = "fake-gemini-key"\nANTHROPIC_API_KEY = "fake-anthropic-key"\n')
+    os.chdir(work_dir)
+    return server
+
+
+def make_synthetic_articles(article_count: int) -> list[dict]:
+    """조문마다 항 2개를 가진 가상의 영문 법령 조문 리스트를 만든다."""
+    articles = []
+    for n in range(1, article_count + 1):
+        for paragraph in (1, 2):
+            articles.append({
+                "id": f"Article {n}",
+                "조문번호": f"Article {n}",
+                "항": paragraph,
+                "text": f"({paragraph}) Paragraph {paragraph} of Article {n} of the synthetic patent act.",
+            })
+    return articles
+
+
+def legacy_translate_items(articles: list[dict], source_lang: str, batch_size: int = 10) -> list[dict]:
+    """이전 방식: 항목별 순차 번역과 고정 대기."""
+    from translator import _get_system_prompt, summarize_diff, translate_claude, translate_gemini
+
+    system_prompt = _get_system_prompt(source_lang)
+    results = []
+    for i, article in enumerate(articles):
+        gemini_text = translate_gemini(article["text"], system_prompt)
+        time.sleep(1)
+        claude_text = translate_claude(article["text"], system_prompt)
+        time.sleep(1)
+        results.append({
+            "id": article["id"],
+            "gemini": gemini_text,
+            "claude": claude_text,
+            "diff_summary": summarize_diff(gemini_text, claude_text),
+        })
+        if (i + 1) % batch_size == 0:
+            time.sleep(2)
+    return results
+
+
+def timed(label: str, func, *args, **kwargs):
+    FakeLLMHandler.request_count = 0
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:8.1f} s  (요청 {FakeLLMHandler.request_count}회)")
+    return result, elapsed
+
+
+if __name__ == "__main__":
+    article_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.2
+
+    print("=" * 70)
+    print(f"번역 벤치마크 (가상 법령 조문 {article_count}개, 가짜 LLM 응답 지연 {latency}초)")
+    print("=" * 70)
+
+    server = start_fake_server(latency)
+    from translator import translate_batch
+
+    articles = make_synthetic_articles(article_count)
+    # 항목별 경로는 조문 하나(첫 항)씩 번역하여 이전 방식과 같은 입력을 쓴다
+    items = [{k: v for k, v in a.items() if k != "조문번호"} for a in articles if a["항"] == 1]
+
+    legacy, legacy_time = timed("이전 방식 (항목별 + 고정 대기)", legacy_translate_items, items, "english")
+    current, current_time = timed(
+        "현재 방식 (항목별 파이프라인)", translate_batch, items, "english", group_by_article=False,
+    )
+    timed("조문 그룹 번역 (기본)", translate_batch, articles, "english")
+    timed("비동기 엔진 (async_mode=True)", translate_batch, articles, "english", async_mode=True)
+
+    print(f"\n항목별 경로 속도 향상: {legacy_time / current_time:.1f}x")
+
+    keys = ("id", "gemini", "claude", "diff_summary")
+    identical = [{k: r[k] for k in keys} for r in legacy] == [{k: r[k] for k in keys} for r in current]
+    print(f"결과 동일: {'✅' if identical else '❌'}")
+    server.shutdown()
+    sys.exit(0 if identical else 1)
@@ -3,7 +3,9 @@ import json
 import os
 import pickle
 import re
+import threading
 import time
+from collections import Counter
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
@@ -15,6 +17,28 @@ _model = None
 # 임베딩 캐시 저장 폴더
 _CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".embedding_cache")
 
+# 프롬프트 캐시 사용량 (제공자별 입력 토큰·캐시에서 읽은 토큰·캐시에 쓴 토큰 누적)
+_prompt_cache_stats = {"claude": Counter(), "gemini": Counter()}
+_prompt_cache_lock = threading.Lock()
+# Gemini 컨텍스트 캐시 최소 크기(약 1024토큰)에 확실히 못 미치는 짧은 목록은 캐시를 만들지 않는다
+_GEMINI_CACHE_MIN_CHARS = 1024
+
+# 일괄 매칭에서 동시에 보내는 배치 요청 수 (MATCH_BATCH_CONCURRENCY 환경변수로 변경).
+# 실제 요청 속도는 rate_limiter의 Claude 한도가 함께 조절한다.
+MATCH_BATCH_CONCURRENCY = int(os.environ.get("MATCH_BATCH_CONCURRENCY", 4))
+
+
+class BatchMatchError(RuntimeError):
+    """일괄 매칭에서 일부 배치가 실패했을 때 발생한다.
+
+    results에는 성공한 배치의 매칭 결과, failed_ids에는 실패한 배치의 외국법 조문 ID가 있다.
+    """
+
+    def __init__(self, message: str, results: dict[str, list[dict]], failed_ids: list[str]):
+        super().__init__(message)
+        self.results = results
+        self.failed_ids = failed_ids
+
 
 def _get_model() -> SentenceTransformer:
     """다국어 임베딩 모델을 로드한다 (싱글턴)."""
@@ -121,56 +145,122 @@ def find_similar_korean(
 
 # ── AI 기반 매칭 ─────────────────────────────────────────────
 
-def _call_gemini(prompt: str, system: str, max_retries: int = 3) -> str:
-    """Gemini API를 재시도 포함하여 호출한다."""
+def _record_prompt_usage(provider: str, input_tokens: int, cached_tokens: int, cache_write_tokens: int = 0) -> None:
+    """요청 하나의 입력 토큰 사용량을 프롬프트 캐시 통계에 더한다."""
+    with _prompt_cache_lock:
+        stats = _prompt_cache_stats[provider]
+        stats["requests"] += 1
+        stats["input_tokens"] += input_tokens
+        stats["cached_tokens"] += cached_tokens
+        stats["cache_write_tokens"] += cache_write_tokens
+
+
+def _record_claude_usage(usage) -> None:
+    """Anthropic 응답의 usage를 기록한다 (input_tokens는 캐시 읽기·쓰기 토큰을 뺀 값)."""
+    if usage is None:
+        return
+    cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+    _record_prompt_usage("claude", usage.input_tokens + cache_read + cache_write, cache_read, cache_write)
+
+
+def prompt_cache_stats() -> dict:
+    """프롬프트 캐시 누적 통계.
+
+    Returns:
+        {'claude': {'requests', 'input_tokens', 'cached_tokens', 'cache_write_tokens'}, 'gemini': {...}}
+        input_tokens는 캐시에서 읽은 토큰을 포함한 전체 입력 토큰 수
+    """
+    keys = ("requests", "input_tokens", "cached_tokens", "cache_write_tokens")
+    with _prompt_cache_lock:
+        return {
+            provider: {key: stats[key] for key in keys}
+            for provider, stats in _prompt_cache_stats.items()
+        }
+
+
+def _claude_system_blocks(system: str, cached_context: str | None):
+    """시스템 프롬프트 뒤에 캐시할 공통 앞부분을 붙인 system 블록 (cache_control 지정)."""
+    if not cached_context:
+        return system
+    return [
+        {"type": "text", "text": system},
+        {"type": "text", "text": cached_context, "cache_control": {"type": "ephemeral"}},
+    ]
+
+
+def _call_gemini(prompt: str, system: str, max_retries: int = 3, cached_context: str | None = None) -> str:
+    """Gemini API를 재시도 포함하여 호출한다.
+
+    cached_context: 여러 요청이 공유하는 긴 앞부분 (예: 한국법 조문 목록).
+        컨텍스트 캐시에 올려 재사용하고, 캐시를 만들 수 없으면 프롬프트 맨 앞에 붙인다
+        (같은 앞부분은 Gemini 암묵적 캐시 대상이 된다).
+    """
     import streamlit as st
-    import google.generativeai as genai
+    from api_clients import get_gemini_cached_model, get_gemini_model
+    from rate_limiter import request_slot, retry_delay
 
     api_key = st.secrets.get("GEMINI_API_KEY", "")
     if not api_key or api_key == "your-key-here":
         return ""
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel("gemini-2.5-flash", system_instruction=system)
+    model = None
+    if cached_context and len(cached_context) >= _GEMINI_CACHE_MIN_CHARS:
+        model = get_gemini_cached_model(api_key, "gemini-2.5-flash", system, cached_context)
+    if model is None:
+        model = get_gemini_model(api_key, "gemini-2.5-flash", system)
+        if cached_context:
+            prompt = f"{cached_context}\n\n{prompt}"
 
     for attempt in range(max_retries):
         try:
-            response = model.generate_content(
-                prompt,
-                request_options={"timeout": 120},
-            )
-            time.sleep(1)
+            with request_slot("gemini"):
+                response = model.generate_content(
+                    prompt,
+                    request_options={"timeout": 120},
+                )
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None:
+                _record_prompt_usage(
+                    "gemini", usage.prompt_token_count or 0, usage.cached_content_token_count or 0,
+                )
             return response.text.strip()
-        except Exception:
+        except Exception as e:
             if attempt < max_retries - 1:
-                time.sleep(3 * (attempt + 1))
+                time.sleep(retry_delay(e, attempt))
             else:
                 return ""
 
 
-def _call_claude(prompt: str, system: str, max_retries: int = 3) -> str:
-    """Claude API를 재시도 포함하여 호출한다."""
+def _call_claude(prompt: str, system: str, max_retries: int = 3, cached_context: str | None = None) -> str:
+    """Claude API를 재시도 포함하여 호출한다.
+
+    cached_context: 여러 요청이 공유하는 긴 앞부분. 시스템 프롬프트 뒤에 붙여
+        프롬프트 캐시(cache_control)로 재사용한다.
+    """
     import streamlit as st
-    import anthropic
+    from api_clients import get_anthropic_client
+    from rate_limiter import request_slot, retry_delay
 
     api_key = st.secrets.get("ANTHROPIC_API_KEY", "")
     if not api_key or api_key == "your-key-here":
         return ""
 
+    client = get_anthropic_client(api_key, max_retries=0)
     for attempt in range(max_retries):
         try:
-            client = anthropic.Anthropic(api_key=api_key)
-            message = client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=2048,
-                system=system,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            time.sleep(1)
+            with request_slot("claude"):
+                message = client.messages.create(
+                    model="claude-sonnet-4-5-20250929",
+                    max_tokens=2048,
+                    system=_claude_system_blocks(system, cached_context),
+                    messages=[{"role": "user", "content": prompt}],
+                )
+            _record_claude_usage(getattr(message, "usage", None))
             return message.content[0].text.strip()
-        except Exception:
+        except Exception as e:
             if attempt < max_retries - 1:
-                time.sleep(3 * (attempt + 1))
+                time.sleep(retry_delay(e, attempt))
             else:
                 return ""
 
@@ -297,12 +387,13 @@ def match_article_with_korean_law(
 
         # 제목이 있는 한국법 조문이 있으면 AI로 제목 매칭
         if title_list:
+            # 한국법 조문 제목 목록은 같은 법령의 모든 조문이 공유하므로 캐시할 앞부분으로 보낸다
+            title_context = f"한국 법령({korean_law_name})의 조문 제목 목록:\n{title_list}"
             title_prompt = (
                 f"외국법 조문 제목: '{foreign_article_title}'\n\n"
-                f"아래 한국 법령({korean_law_name})의 조문 제목 목록에서 "
-                f"위 외국법 조문 제목과 의미적으로 동일하거나 매우 유사한 조문을 1개만 선택하십시오.\n"
+                f"위 한국 법령({korean_law_name})의 조문 제목 목록에서 "
+                f"이 외국법 조문 제목과 의미적으로 동일하거나 매우 유사한 조문을 1개만 선택하십시오.\n"
                 f"의미가 명확히 다르거나 유사한 조문이 없으면 반드시 '없음'이라고 답하십시오.\n\n"
-                f"{title_list}\n"
                 f"반드시 다음 형식으로만 답하십시오:\n"
                 f"선택: [조문번호] (또는 '없음')\n"
                 f"이유: [1문장 이유]"
@@ -315,8 +406,8 @@ def match_article_with_korean_law(
             )
 
             # Gemini와 Claude 동시 호출
-            gemini_answer = _call_gemini(title_prompt, title_system)
-            claude_answer = _call_claude(title_prompt, title_system)
+            gemini_answer = _call_gemini(title_prompt, title_system, cached_context=title_context)
+            claude_answer = _call_claude(title_prompt, title_system, cached_context=title_context)
 
             gemini_id, gemini_reason = parse_ai_response(gemini_answer)
             claude_id, claude_reason = parse_ai_response(claude_answer)
@@ -342,13 +433,14 @@ def match_article_with_korean_law(
         summary = a["text"][:150].replace("\n", " ")
         article_list += f"- {a['id']}: {summary}\n"
 
+    # 한국법 조문 목록은 캐시할 앞부분, 해외법 조문은 요청마다 달라지는 부분
+    content_context = f"한국 법령({korean_law_name})의 조문 목록:\n{article_list}"
     content_prompt = (
         f"해외 법령 조문 ({foreign_article_id}) 번역문:\n"
         f"{translated_text[:500]}\n\n"  # 너무 길면 잘라서 전달
-        f"아래 한국 법령({korean_law_name})의 조문 목록에서 "
-        f"위 해외법 조문과 규율 내용이 가장 유사한 조문을 1개 선택하십시오.\n"
+        f"위 한국 법령({korean_law_name})의 조문 목록에서 "
+        f"이 해외법 조문과 규율 내용이 가장 유사한 조문을 1개 선택하십시오.\n"
         f"유사한 조문이 전혀 없으면 '없음'이라고 답하십시오.\n\n"
-        f"{article_list}\n"
         f"반드시 다음 형식으로만 답하십시오:\n"
         f"선택: [조문번호] (또는 '없음')\n"
         f"이유: [1문장 이유]"
@@ -362,8 +454,8 @@ def match_article_with_korean_law(
     )
 
     # Gemini와 Claude 동시 호출
-    gemini_answer = _call_gemini(content_prompt, content_system)
-    claude_answer = _call_claude(content_prompt, content_system)
+    gemini_answer = _call_gemini(content_prompt, content_system, cached_context=content_context)
+    claude_answer = _call_claude(content_prompt, content_system, cached_context=content_context)
 
     gemini_id, gemini_reason = parse_ai_response(gemini_answer)
     claude_id, claude_reason = parse_ai_response(claude_answer)
@@ -486,15 +578,60 @@ def _parse_batch_matches(response_text: str, korea_articles: list[dict]) -> dict
     return result_dict
 
 
+def _match_one_batch(
+    client, system_blocks: list[dict], batch: list[dict], korea_articles: list[dict], max_retries: int = 3,
+) -> dict[str, list[dict]]:
+    """외국법 조문 배치 하나를 Claude로 매칭하여 {외국법 조문 ID: [매칭 결과]}를 반환한다.
+
+    max_retries번 모두 실패하면 마지막 예외를 그대로 발생시킨다.
+    """
+    from rate_limiter import request_slot, retry_delay
+
+    foreign_list_str = "\n".join([
+        f"{art['id']}: {art.get('조문제목', '')}"
+        for art in batch
+    ])
+
+    prompt = f"""**외국법 조문 제목:**
+{foreign_list_str}
+
+위 외국법 조문 각각에 대해 가장 유사한 한국 특허법 조문을 찾아 지정된 JSON 형식으로만 응답해주세요."""
+
+    for attempt in range(max_retries):
+        response_text = ""
+        try:
+            with request_slot("claude"), client.messages.stream(
+                model="claude-sonnet-4-20250514",
+                max_tokens=16000,
+                system=system_blocks,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                for text in stream.text_stream:
+                    response_text += text
+                _record_claude_usage(getattr(stream.get_final_message(), "usage", None))
+            return _parse_batch_matches(response_text, korea_articles)
+        except Exception as e:
+            print(f"❌ 배치 매칭 오류 ({batch[0]['id']} 외 {len(batch) - 1}개, 시도 {attempt + 1}/{max_retries}): {e}")
+            print(f"응답 내용: {response_text[:500] if response_text else '응답 없음'}")
+            if attempt == max_retries - 1:
+                raise
+            time.sleep(retry_delay(e, attempt))
+
+
 def find_similar_korean_batch(
     foreign_articles: list[dict],
     korea_index: dict,
     relevant_law_sources: list[str] | None = None,
     batch_size: int = 30,
+    progress_callback=None,
+    max_concurrency: int | None = None,
 ) -> dict[str, list[dict]]:
     """외국법 조문들을 한국법과 일괄 매칭한다.
 
-    조문 수가 많으면 배치로 나누어 처리한다.
+    조문 수가 많으면 배치로 나누어 최대 max_concurrency개 배치를 동시에 요청한다.
+    결과는 배치 순서대로 합치므로 완료 순서와 무관하게 같다. 지시문과 한국법 조문 목록은 모든 배치가
+    같으므로 시스템 프롬프트의 캐시 구간(cache_control)에 두고, 배치마다 외국법 조문만 보낸다.
+    캐시 적중량은 prompt_cache_stats()로 확인한다.
 
     Args:
         foreign_articles: 외국법 조문 리스트
@@ -502,13 +639,22 @@ def find_similar_korean_batch(
         korea_index: 한국법 인덱스 {'articles': [...]}
         relevant_law_sources: 매칭 대상 한국법 필터 (예: ["특허법", "실용신안법"])
         batch_size: 한 번에 매칭할 외국법 조문 수 (기본 30개)
+        progress_callback: 진행률 콜백 (완료 배치 수, 전체 배치 수). 호출한 스레드에서 부른다.
+            실패한 배치도 완료 수에 넣는다.
+        max_concurrency: 동시에 보내는 배치 요청 수 (기본 MATCH_BATCH_CONCURRENCY)
 
     Returns:
         조문 ID를 키로, 매칭 결과 리스트를 값으로 하는 딕셔너리
         예: {'1': [{'korean_id': '2', 'score': 0.95, ...}], '2': [...], ...}
+
+    Raises:
+        BatchMatchError: 재시도 후에도 실패한 배치가 있을 때. 모든 배치를 끝낸 뒤 발생하며
+            성공한 배치의 결과(results)와 실패한 조문 ID(failed_ids)를 담는다.
     """
-    import anthropic
     import streamlit as st
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    from api_clients import get_anthropic_client
 
     # API 키 확인
     api_key = st.secrets.get("ANTHROPIC_API_KEY", "")
@@ -530,30 +676,9 @@ def find_similar_korean_batch(
         for art in korea_articles[:100]
     ])
 
-    client = anthropic.Anthropic(api_key=api_key)
-
-    # 배치 분할
-    batches = [
-        foreign_articles[i:i + batch_size]
-        for i in range(0, len(foreign_articles), batch_size)
-    ]
-
-    all_results = {}
-    total_batches = len(batches)
-
-    for batch_idx, batch in enumerate(batches):
-        if total_batches > 1:
-            st.write(f"📦 배치 {batch_idx + 1}/{total_batches} 처리 중... ({len(batch)}개 조문)")
-
-        foreign_list_str = "\n".join([
-            f"{art['id']}: {art.get('조문제목', '')}"
-            for art in batch
-        ])
-
-        prompt = f"""당신은 특허법 전문가입니다. 외국 특허법 조문들과 한국 특허법 조문들이 주어졌습니다.
-
-**외국법 조문 제목:**
-{foreign_list_str}
+    # 지시문과 한국법 조문 목록은 모든 배치가 공유하므로 시스템 프롬프트에 두고
+    # 프롬프트 캐시(cache_control)로 재사용한다. 배치마다 달라지는 외국법 조문만 사용자 메시지로 보낸다.
+    catalog_prompt = f"""당신은 특허법 전문가입니다. 외국 특허법 조문들과 한국 특허법 조문들이 주어집니다.
 
 **한국 특허법 조문 제목:**
 {korea_list_str}
@@ -577,30 +702,62 @@ def find_similar_korean_batch(
 ```
 
 매칭이 없으면 korean_id를 null로 설정하세요. JSON 형식으로만 응답해주세요."""
+    system_blocks = [{"type": "text", "text": catalog_prompt, "cache_control": {"type": "ephemeral"}}]
 
-        try:
-            response_text = ""
-            with client.messages.stream(
-                model="claude-sonnet-4-20250514",
-                max_tokens=16000,
-                messages=[{"role": "user", "content": prompt}]
-            ) as stream:
-                for text in stream.text_stream:
-                    response_text += text
-
-            batch_results = _parse_batch_matches(response_text, korea_articles)
-            all_results.update(batch_results)
-
-            if total_batches > 1:
-                st.write(f"  ✅ 배치 {batch_idx + 1} 완료: {len(batch_results)}개 매칭")
-
-        except Exception as e:
-            st.error(f"❌ 배치 {batch_idx + 1} 매칭 오류: {e}")
-            st.write("응답 내용:", response_text[:500] if 'response_text' in locals() else "응답 없음")
+    # 429는 SDK 내부 재시도 대신 _match_one_batch가 request_slot 안에서 받아 AIMD 제어기가 보게 한다
+    client = get_anthropic_client(api_key, max_retries=0)
 
-        # 배치 간 대기 (rate limit 방지)
-        if batch_idx < total_batches - 1:
-            time.sleep(2)
+    # 배치 분할
+    batches = [
+        foreign_articles[i:i + batch_size]
+        for i in range(0, len(foreign_articles), batch_size)
+    ]
 
-    st.write(f"📊 최종 매칭: {len(all_results)}개 조문")
+    total_batches = len(batches)
+    batch_results = [None] * total_batches
+    failures = []
+    if progress_callback and total_batches:
+        progress_callback(0, total_batches)
+
+    workers = max(1, min(max_concurrency or MATCH_BATCH_CONCURRENCY, total_batches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_match_one_batch, client, system_blocks, batch, korea_articles): batch_idx
+            for batch_idx, batch in enumerate(batches)
+        }
+        try:
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                batch_idx = futures[future]
+                try:
+                    batch_results[batch_idx] = future.result()
+                except Exception as e:
+                    batch_results[batch_idx] = {}
+                    failures.append((batch_idx, e))
+                    print(f"  ❌ 배치 {batch_idx + 1}/{total_batches} 실패: {e}")
+                    if progress_callback:
+                        progress_callback(done_count, total_batches)
+                    continue
+                if total_batches > 1:
+                    print(f"  ✅ 배치 {batch_idx + 1}/{total_batches} 완료: {len(batch_results[batch_idx])}개 매칭")
+                if progress_callback:
+                    progress_callback(done_count, total_batches)
+        finally:
+            # 중단(작업 취소·Streamlit 재실행 등) 시 아직 시작하지 않은 배치는 취소한다
+            for future in futures:
+                future.cancel()
+
+    # 배치 순서대로 합친다 (완료 순서와 무관하게 같은 결과)
+    all_results = {}
+    for results in batch_results:
+        all_results.update(results)
+
+    print(f"📊 최종 매칭: {len(all_results)}개 조문")
+    if failures:
+        failures.sort(key=lambda failure: failure[0])
+        failed_ids = [str(art['id']) for batch_idx, _ in failures for art in batches[batch_idx]]
+        details = "; ".join(f"배치 {batch_idx + 1}: {e}" for batch_idx, e in failures)
+        raise BatchMatchError(
+            f"{total_batches}개 배치 중 {len(failures)}개 매칭 실패 (조문 {len(failed_ids)}개) — {details}",
+            all_results, failed_ids,
+        )
     return all_results
@@ -7,6 +7,8 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 
+from parsers.hierarchy import HierarchyIndex
+
 
 def parse_eu_html(url: str) -> dict:
     """유럽 법령 HTML을 파싱하여 구조화된 데이터를 반환한다.
@@ -101,7 +103,7 @@ def _parse_html_articles(text: str) -> list[dict]:
     articles = []
 
     # 계층 구조 추출 (PART, CHAPTER)
-    hierarchy = _extract_html_hierarchy(text)
+    hierarchy = HierarchyIndex(_extract_html_hierarchy(text))
 
     # Article 패턴: "Article N" + 제목 (선택)
     article_pattern = re.compile(
@@ -129,7 +131,7 @@ def _parse_html_articles(text: str) -> list[dict]:
         article_text = '\n'.join(lines[content_start:]).strip()
 
         # 현재 조문이 속한 계층 찾기
-        article_pos = text.find(match.group(0))
+        article_pos = match.start()
         current_hierarchy = _find_hierarchy_at_position(hierarchy, article_pos)
 
         articles.append({
@@ -192,19 +194,9 @@ def _extract_html_hierarchy(text: str) -> list[dict]:
     return hierarchy
 
 
-def _find_hierarchy_at_position(hierarchy: list[dict], position: int) -> dict:
+def _find_hierarchy_at_position(hierarchy: HierarchyIndex, position: int) -> dict:
     """특정 위치에서의 계층 정보를 반환한다."""
-    current_part = ""
-    current_chapter = ""
-
-    for h in hierarchy:
-        if h['start_pos'] > position:
-            break
-        if h['type'] == 'part':
-            current_part = h['title']
-            current_chapter = ""  # 새 Part에서 Chapter 초기화
-        elif h['type'] == 'chapter':
-            current_chapter = h['title']
+    current_part, current_chapter, _ = hierarchy.at(position)
 
     return {
         'part': current_part,
@@ -445,7 +437,7 @@ def _parse_china_articles(text: str) -> list[dict]:
     articles = []
 
     # 계층 구조 추출 (章)
-    hierarchy = _extract_china_hierarchy(text)
+    hierarchy = HierarchyIndex(_extract_china_hierarchy(text))
 
     # 조문 패턴: 第X条 (X는 한자 숫자 또는 아라비아 숫자)
     # 한자 숫자: 一二三四五六七八九十百千
@@ -500,16 +492,9 @@ def _extract_china_hierarchy(text: str) -> list[dict]:
     return hierarchy
 
 
-def _find_china_chapter_at_position(hierarchy: list[dict], position: int) -> str:
+def _find_china_chapter_at_position(hierarchy: HierarchyIndex, position: int) -> str:
     """특정 위치에서의 장(章) 정보를 반환한다."""
-    current_chapter = ""
-
-    for h in hierarchy:
-        if h['start_pos'] > position:
-            break
-        if h['type'] == 'chapter':
-            current_chapter = h['title']
-
+    _, current_chapter, _ = hierarchy.at(position)
     return current_chapter
 
 
@@ -4,6 +4,8 @@ import re
 import pandas as pd
 from bs4 import BeautifulSoup
 
+from parsers.hierarchy import HierarchyIndex
+
 
 def parse_japan_html_to_dataframe(file_path: str) -> pd.DataFrame:
     """일본 법령 HTML 파일을 파싱하여 구조화된 DataFrame을 반환한다."""
@@ -20,8 +22,9 @@ def parse_japan_html_to_dataframe(file_path: str) -> pd.DataFrame:
     articles = soup.find_all('section', class_='Article')
 
     # 계층 구조 추출 (章, 節) - HTML 클래스에서
-    chapters = _extract_japan_chapters_from_html(soup)
-    sections = _extract_japan_sections_from_html(soup)
+    # 조문 번호 → 章/節 조회용 색인 (조문마다 목록 전체를 비교하지 않는다)
+    chapter_index = _build_article_range_index(_extract_japan_chapters_from_html(soup))
+    section_index = _build_article_range_index(_extract_japan_sections_from_html(soup))
 
     for article_section in articles:
         # 別表(별표) 확인 - 조문 제목에서
@@ -70,19 +73,14 @@ def parse_japan_html_to_dataframe(file_path: str) -> pd.DataFrame:
 
         # 현재 조문이 속한 장/절 찾기 (조문 번호 범위 기반)
         # 먼저 節을 찾고, 節이 있으면 그 節의 부모 章도 함께 설정
-        current_section = _find_hierarchy_by_article(article_id, sections)
-        current_chapter = ''
-
-        if current_section:
-            # 節이 있으면 그 節의 부모 章을 찾기
-            for s in sections:
-                if s['title'] == current_section and 'parent_chapter' in s:
-                    current_chapter = s['parent_chapter']
-                    break
+        section = _find_hierarchy_entry_by_article(article_id, section_index)
+        current_section = section['title'] if section else ''
+        # 節이 있으면 그 節의 부모 章
+        current_chapter = section.get('parent_chapter', '') if section else ''
 
         # 節이 없거나 부모 章을 못 찾았으면 직접 章 찾기
         if not current_chapter:
-            current_chapter = _find_hierarchy_by_article(article_id, chapters)
+            current_chapter = _find_hierarchy_by_article(article_id, chapter_index)
 
         # 항 파싱 (ParagraphSentence div들)
         para_divs = article_section.find_all('div', class_='_div_ParagraphSentence')
@@ -435,102 +433,48 @@ def _extract_japan_sections(text: str) -> list[dict]:
     return hierarchy
 
 
-def _compare_article_numbers(article1: str, article2: str) -> int:
-    """두 조문 번호를 비교한다. article1 < article2이면 -1, 같으면 0, article1 > article2이면 1"""
-    # 第X条 또는 第X条のY 형식 파싱
-    pattern = r'第([一二三四五六七八九十百千万\d]+)条(?:の([一二三四五六七八九十\d]+))?'
-
-    match1 = re.search(pattern, article1)
-    match2 = re.search(pattern, article2)
-
-    if not match1 or not match2:
-        return 0
-
-    # 주 조문 번호 비교
-    num1 = _kanji_to_arabic(match1.group(1))
-    num2 = _kanji_to_arabic(match2.group(1))
-
-    if num1 < num2:
-        return -1
-    elif num1 > num2:
-        return 1
+def _article_position(article_id: str) -> int | None:
+    """조문 번호를 순서 비교용 정수로 바꾼다 (第X条 → X*1000, 第X条のY → X*1000+Y).
 
-    # 주 번호가 같으면 の 뒤 번호 비교
-    suffix1 = match1.group(2)
-    suffix2 = match2.group(2)
+    순서는 第X条 < 第X条の1 < 第X条の2 < 第X+1条이다. 조문 번호 형식이 아니면 None.
+    """
+    match = re.search(r'第([一二三四五六七八九十百千万\d]+)条(?:の([一二三四五六七八九十\d]+))?', article_id)
+    if not match:
+        return None
+    suffix = _kanji_to_arabic(match.group(2)) if match.group(2) else 0
+    return _kanji_to_arabic(match.group(1)) * 1000 + suffix
 
-    if suffix1 is None and suffix2 is None:
-        return 0
-    elif suffix1 is None:
-        return -1  # の가 없는 것이 더 앞
-    elif suffix2 is None:
-        return 1
 
-    # の 뒤 번호 비교
-    suffix_num1 = _kanji_to_arabic(suffix1)
-    suffix_num2 = _kanji_to_arabic(suffix2)
+def _build_article_range_index(hierarchy: list[dict]) -> HierarchyIndex:
+    """조문 범위(start_article~end_article)가 있는 章/節 목록을 조문 번호 순서의 HierarchyIndex로 만든다.
 
-    if suffix_num1 < suffix_num2:
-        return -1
-    elif suffix_num1 > suffix_num2:
-        return 1
-    else:
-        return 0
-
-
-def _find_hierarchy_by_article(article_id: str, hierarchy: list[dict]) -> str:
-    """조문 번호로 해당하는 계층 정보를 찾는다."""
+    조문 범위가 없는 항목(하위 節이 있는 章)은 넣지 않는다. 각 항목은 원래 dict에
+    조문 번호 위치(start_pos, end_pos)를 더한 사본이다.
+    """
+    entries = []
     for h in hierarchy:
-        if 'start_article' not in h or 'end_article' not in h:
+        if h.get('start_article') is None or h.get('end_article') is None:
             continue
-
-        # start_article이 None이면 스킵 (하위 節이 있는 章)
-        if h['start_article'] is None or h['end_article'] is None:
+        start = _article_position(h['start_article'])
+        end = _article_position(h['end_article'])
+        if start is None or end is None:
             continue
+        entries.append({**h, 'start_pos': start, 'end_pos': end})
+    return HierarchyIndex(entries)
 
-        # article_id가 [start_article, end_article] 범위에 속하는지 확인
-        if (_compare_article_numbers(h['start_article'], article_id) <= 0 and
-            _compare_article_numbers(article_id, h['end_article']) <= 0):
-            return h['title']
-
-    return ""
 
+def _find_hierarchy_entry_by_article(article_id: str, index: HierarchyIndex) -> dict | None:
+    """조문 번호가 속한 章/節 항목을 찾는다. 어느 범위에도 없으면 None."""
+    position = _article_position(article_id)
+    if position is None:
+        return None
+    entry = index.entry_at(position)
+    if entry is None or position > entry['end_pos']:
+        return None
+    return entry
 
-def _find_hierarchy_from_element(element, hierarchy: list[dict]) -> str:
-    """HTML 요소에서 계층 정보를 찾는다. (부모를 따라가면서 Chapter/Section 찾기)"""
-    current = ""
-
-    # 계층 리스트에서 element보다 앞에 나오는 것들 중 가장 마지막 것을 찾기
-    for h in hierarchy:
-        if 'element' not in h or h['element'] is None:
-            continue
-
-        # element가 h['element'] 이후에 나오는지 확인
-        # h['element']의 모든 형제 이후 요소들을 확인
-        try:
-            # element가 h['element']와 같은 부모를 공유하거나 그 이후에 있으면
-            h_parent = h['element'].parent
-            if h_parent:
-                # 같은 섹션 안에 있는지 확인
-                elem_parent = element.parent
-                while elem_parent:
-                    if elem_parent == h_parent or h_parent in elem_parent.parents:
-                        current = h['title']
-                        break
-                    elem_parent = elem_parent.parent
-        except:
-            pass
-
-    return current
-
-
-def _find_hierarchy_at_position(hierarchy: list[dict], position: int) -> str:
-    """특정 위치에서의 계층 정보를 반환한다. (하위 호환용)"""
-    current = ""
-
-    for h in hierarchy:
-        if h['start_pos'] > position:
-            break
-        current = h['title']
 
-    return current
+def _find_hierarchy_by_article(article_id: str, index: HierarchyIndex) -> str:
+    """조문 번호로 해당하는 계층 제목을 찾는다. index는 _build_article_range_index의 반환값."""
+    entry = _find_hierarchy_entry_by_article(article_id, index)
+    return entry['title'] if entry else ""
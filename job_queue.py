@@ -0,0 +1,331 @@
+"""백그라운드 작업 큐 (SQLite).
+
+번역·한국법 매칭·법령 구조화처럼 오래 걸리는 작업을 Streamlit 스크립트 밖의
+작업자 프로세스(job_worker.py)에서 실행한다. 화면(위젯 조작)이 다시 실행되어도
+작업은 계속되고, 페이지는 작업을 제출한 뒤 진행률과 결과를 조회(폴링)한다.
+
+- submit(kind, params): 작업을 큐에 넣는다. 같은 종류·같은 입력의 작업이 대기·실행 중이면
+  새로 만들지 않고 그 작업 ID를 돌려준다. 끝난 작업은 재사용하지 않는다
+  (재번역·재매칭은 항상 새로 실행한다. 재실행된 페이지는 세션에 둔 작업 ID로 다시 연결한다).
+- get(job_id): 상태·단계별 진행률·결과·오류를 조회한다.
+- ensure_worker(): 살아 있는 작업자가 없으면 작업자 프로세스를 띄운다.
+
+작업 상태: queued → running → done | failed | cancelled.
+작업자가 비정상 종료하면 실행 중이던 작업은 다음 작업자가 다시 큐에 넣는다
+(번역은 translation_journal로 끝난 조문 그룹을 이어받는다).
+
+저장 위치는 프로젝트 폴더의 .jobs.sqlite3 이며, JOB_QUEUE_PATH 환경변수로 바꿀 수 있다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+_DB_PATH = os.environ.get("JOB_QUEUE_PATH", os.path.join(_PROJECT_DIR, ".jobs.sqlite3"))
+_WORKER_SCRIPT = os.path.join(_PROJECT_DIR, "job_worker.py")
+_WORKER_LOG = os.path.join(_PROJECT_DIR, ".job_worker.log")
+
+# 작업자 생존 판정: 마지막 신호(heartbeat)가 이보다 오래되면 죽은 것으로 본다
+WORKER_TIMEOUT_SECONDS = 20
+# 끝난 작업 기록 보관 기간
+_MAX_AGE_DAYS = 7
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("done", "failed", "cancelled")
+
+_local = threading.local()
+
+
+class JobCancelled(Exception):
+    """실행 중인 작업에 취소가 요청되었을 때 작업자 안에서 발생한다."""
+
+
+def _connect() -> sqlite3.Connection:
+    """스레드별 SQLite 연결을 반환한다 (처음 호출 시 생성)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(_DB_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(_DB_PATH, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " kind TEXT NOT NULL,"
+            " label TEXT NOT NULL,"
+            " job_key TEXT NOT NULL,"
+            " params TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " progress TEXT NOT NULL DEFAULT '{}',"
+            " result TEXT,"
+            " error TEXT,"
+            " cancel_requested INTEGER NOT NULL DEFAULT 0,"
+            " worker_pid INTEGER,"
+            " created_at REAL NOT NULL,"
+            " started_at REAL,"
+            " finished_at REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS jobs_key ON jobs (job_key, status)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS workers ("
+            " pid INTEGER PRIMARY KEY,"
+            " heartbeat REAL NOT NULL)"
+        )
+        conn.execute(
+            "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+            (time.time() - _MAX_AGE_DAYS * 86400,),
+        )
+        _local.conn = conn
+    return conn
+
+
+def _json_default(value):
+    """numpy 숫자 등 JSON으로 바로 저장되지 않는 값을 변환한다."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def make_job_key(kind: str, params: dict) -> str:
+    """작업 종류와 입력으로 중복 판정 키를 만든다."""
+    content = json.dumps({"kind": kind, "params": params}, ensure_ascii=False, sort_keys=True, default=_json_default)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def submit(kind: str, params: dict, label: str = "") -> int:
+    """작업을 큐에 넣고 작업 ID를 반환한다.
+
+    같은 종류·입력의 작업이 대기·실행 중이면 그 작업 ID를 반환한다.
+
+    Args:
+        kind: 작업 종류 ('translate', 'match', 'structure')
+        params: 작업 입력 (JSON으로 저장할 수 있는 값)
+        label: 작업 현황에 표시할 이름 (예: 법령 파일명)
+    """
+    job_key = make_job_key(kind, params)
+    conn = _connect()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT id FROM jobs WHERE job_key = ? AND status IN ('queued', 'running')"
+            " ORDER BY id DESC LIMIT 1",
+            (job_key,),
+        ).fetchone()
+        if row:
+            job_id = row["id"]
+        else:
+            job_id = conn.execute(
+                "INSERT INTO jobs (kind, label, job_key, params, status, created_at)"
+                " VALUES (?, ?, ?, ?, 'queued', ?)",
+                (kind, label or kind, job_key, _dumps(params), time.time()),
+            ).lastrowid
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return job_id
+
+
+def _row_to_job(row: sqlite3.Row, with_result: bool = True) -> dict:
+    job = {
+        "id": row["id"],
+        "kind": row["kind"],
+        "label": row["label"],
+        "status": row["status"],
+        "progress": json.loads(row["progress"] or "{}"),
+        "error": row["error"],
+        "cancel_requested": bool(row["cancel_requested"]),
+        "created_at": row["created_at"],
+        "started_at": row["started_at"],
+        "finished_at": row["finished_at"],
+    }
+    if with_result:
+        job["result"] = json.loads(row["result"]) if row["result"] else None
+    return job
+
+
+def get(job_id: int) -> dict | None:
+    """작업을 조회한다.
+
+    Returns:
+        {'id', 'kind', 'label', 'status', 'progress': {단계: [현재, 전체]}, 'result', 'error', ...}
+        또는 없으면 None
+    """
+    row = _connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return _row_to_job(row) if row else None
+
+
+def list_jobs(limit: int = 20) -> list[dict]:
+    """최근 작업 목록 (결과 제외, 최신순)."""
+    rows = _connect().execute(
+        "SELECT id, kind, label, status, progress, error, cancel_requested,"
+        " created_at, started_at, finished_at, NULL AS result"
+        " FROM jobs ORDER BY id DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+    return [_row_to_job(row, with_result=False) for row in rows]
+
+
+def cancel(job_id: int) -> None:
+    """작업을 취소한다. 대기 중이면 바로, 실행 중이면 다음 진행률 보고 때 멈춘다."""
+    conn = _connect()
+    conn.execute(
+        "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'queued'",
+        (time.time(), job_id),
+    )
+    conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+
+
+# ── 작업자용 함수 ──────────────────────────────────────────────
+
+def claim_next(worker_pid: int) -> dict | None:
+    """대기 중인 가장 오래된 작업을 실행 중으로 바꾸고 입력(params)을 포함해 반환한다."""
+    conn = _connect()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT id, params FROM jobs WHERE status = 'queued' ORDER BY id LIMIT 1"
+        ).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker_pid = ?, started_at = ? WHERE id = ?",
+                (worker_pid, time.time(), row["id"]),
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    if not row:
+        return None
+    job = get(row["id"])
+    job["params"] = json.loads(row["params"])
+    return job
+
+
+def report_progress(job_id: int, stage: str, current: int, total: int) -> None:
+    """단계별 진행률을 기록한다. 취소가 요청되었으면 JobCancelled를 발생시킨다."""
+    conn = _connect()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute("SELECT progress, cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        progress = json.loads(row["progress"] or "{}")
+        progress[stage] = [current, total]
+        conn.execute("UPDATE jobs SET progress = ? WHERE id = ?", (_dumps(progress), job_id))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    if row["cancel_requested"]:
+        raise JobCancelled()
+
+
+def finish(job_id: int, result) -> None:
+    """작업을 완료로 기록한다."""
+    _connect().execute(
+        "UPDATE jobs SET status = 'done', result = ?, finished_at = ? WHERE id = ?",
+        (_dumps(result), time.time(), job_id),
+    )
+
+
+def fail(job_id: int, error: str, cancelled: bool = False) -> None:
+    """작업을 실패(또는 취소)로 기록한다."""
+    _connect().execute(
+        "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+        ("cancelled" if cancelled else "failed", error, time.time(), job_id),
+    )
+
+
+def heartbeat(worker_pid: int) -> None:
+    """작업자가 살아 있음을 기록한다."""
+    _connect().execute(
+        "INSERT OR REPLACE INTO workers (pid, heartbeat) VALUES (?, ?)", (worker_pid, time.time())
+    )
+
+
+def register_worker(worker_pid: int) -> bool:
+    """작업자로 등록한다. 다른 작업자가 살아 있으면 등록하지 않고 False를 반환한다.
+
+    확인과 등록을 한 트랜잭션에서 하므로 동시에 뜬 작업자 중 하나만 등록된다.
+    """
+    conn = _connect()
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT COUNT(*) FROM workers WHERE pid != ? AND heartbeat >= ?",
+            (worker_pid, now - WORKER_TIMEOUT_SECONDS),
+        ).fetchone()
+        registered = row[0] == 0
+        if registered:
+            conn.execute("INSERT OR REPLACE INTO workers (pid, heartbeat) VALUES (?, ?)", (worker_pid, now))
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return registered
+
+
+def unregister_worker(worker_pid: int) -> None:
+    """작업자 종료 시 등록을 지운다."""
+    _connect().execute("DELETE FROM workers WHERE pid = ?", (worker_pid,))
+
+
+def requeue_orphaned_jobs() -> int:
+    """죽은 작업자가 실행하던 작업을 다시 대기 상태로 돌린다. 돌린 작업 수를 반환한다."""
+    conn = _connect()
+    deadline = time.time() - WORKER_TIMEOUT_SECONDS
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute("DELETE FROM workers WHERE heartbeat < ?", (deadline,))
+        count = conn.execute(
+            "UPDATE jobs SET status = 'queued', worker_pid = NULL WHERE status = 'running'"
+            " AND (worker_pid IS NULL OR worker_pid NOT IN (SELECT pid FROM workers))"
+        ).rowcount
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return count
+
+
+def worker_alive() -> bool:
+    """최근 신호를 보낸 작업자가 있는지 확인한다."""
+    row = _connect().execute(
+        "SELECT COUNT(*) FROM workers WHERE heartbeat >= ?", (time.time() - WORKER_TIMEOUT_SECONDS,)
+    ).fetchone()
+    return row[0] > 0
+
+
+_spawn_lock = threading.Lock()
+
+
+def ensure_worker() -> None:
+    """살아 있는 작업자가 없으면 작업자 프로세스를 띄운다.
+
+    작업자는 Streamlit과 별도 세션으로 실행되어 스크립트 재실행·브라우저 새로고침과
+    무관하게 계속 돈다. 로그는 .job_worker.log에 남는다.
+    """
+    with _spawn_lock:
+        if worker_alive():
+            return
+        with open(_WORKER_LOG, "a", encoding="utf-8") as log:
+            subprocess.Popen(
+                [sys.executable, _WORKER_SCRIPT],
+                cwd=os.getcwd(),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+        # 작업자가 등록될 때까지 잠시 기다린다 (중복 실행 방지)
+        deadline = time.time() + 10
+        while time.time() < deadline and not worker_alive():
+            time.sleep(0.2)
@@ -0,0 +1,157 @@
+"""백그라운드 작업자 프로세스 (job_queue의 작업 실행).
+
+job_queue.ensure_worker()가 Streamlit 프로젝트 폴더에서 띄운다 (직접 실행: python job_worker.py).
+큐에서 작업을 꺼내 작업 종류별 함수로 실행하고, 진행률·결과·오류를 큐에 기록한다.
+작업은 스레드로 동시에 최대 JOB_WORKER_CONCURRENCY개(기본 3) 실행하므로 여러 법령을
+함께 번역할 수 있다. API 요청 속도는 프로세스 안의 rate_limiter가 제공자별로 함께 조절한다.
+
+작업 종류:
+- translate: translator.translate_batch (진행률 단계: 번역, 차이 요약)
+- match: embedder.find_similar_korean_batch
+- structure: parsers.iter_structured_articles → 구조화 엑셀 저장 (결과에 추출한 행 포함)
+
+대기 작업도 실행 중인 작업도 없이 _IDLE_EXIT_SECONDS가 지나면 스스로 종료한다.
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+
+import job_queue
+
+# 신호 간격, 큐 확인 간격, 유휴 종료 시간 (초)
+_HEARTBEAT_INTERVAL = 5
+_POLL_INTERVAL = 0.5
+_IDLE_EXIT_SECONDS = 1800
+
+
+def _progress(job_id: int, stage: str):
+    """(current, total) 진행률 콜백을 만든다."""
+    return lambda current, total, *_: job_queue.report_progress(job_id, stage, current, total)
+
+
+def _run_translate(job: dict):
+    from translator import translate_batch
+
+    params = job["params"]
+    return translate_batch(
+        params["articles"],
+        source_lang=params["source_lang"],
+        progress_callback=_progress(job["id"], "번역"),
+        diff_progress_callback=_progress(job["id"], "차이 요약"),
+        group_by_article=params.get("group_by_article", True),
+        use_gemini=params.get("use_gemini", True),
+        use_claude=params.get("use_claude", True),
+        use_memory=params.get("use_memory", True),
+        async_mode=params.get("async_mode", False),
+    )
+
+
+def _run_match(job: dict):
+    from embedder import find_similar_korean_batch
+
+    params = job["params"]
+    return find_similar_korean_batch(
+        params["articles"],
+        params["korea_index"],
+        relevant_law_sources=params.get("relevant_law_sources"),
+        progress_callback=_progress(job["id"], "매칭"),
+    )
+
+
+def _run_structure(job: dict):
+    import pandas as pd
+    import streamlit as st
+
+    from pdf_parser import iter_structured_articles, save_structured_to_excel
+
+    params = job["params"]
+    use_ai_titles = params.get("use_ai_titles", False)
+    rows = list(iter_structured_articles(
+        params["file_path"],
+        use_ai_titles=use_ai_titles,
+        gemini_api_key=st.secrets.get("GEMINI_API_KEY", "") if use_ai_titles else None,
+        progress_callback=_progress(job["id"], "구조화"),
+        workers=params.get("workers", 1),
+        title_workers=params.get("title_workers", 4),
+    ))
+    df = pd.DataFrame(rows)
+    os.makedirs(os.path.dirname(params["excel_path"]) or ".", exist_ok=True)
+    save_structured_to_excel(df, params["excel_path"])
+    # 페이지가 엑셀을 다시 읽지 않고 화면 실행과 같은 DataFrame을 만들도록 행을 그대로 돌려준다
+    return {"excel_path": params["excel_path"], "rows": rows}
+
+
+_HANDLERS = {
+    "translate": _run_translate,
+    "match": _run_match,
+    "structure": _run_structure,
+}
+
+
+def _execute(job: dict) -> None:
+    """작업 하나를 실행하고 결과를 기록한다."""
+    label = f"#{job['id']} {job['kind']} ({job['label']})"
+    print(f"[작업자] 시작 {label}", flush=True)
+    try:
+        handler = _HANDLERS.get(job["kind"])
+        if handler is None:
+            raise ValueError(f"알 수 없는 작업 종류: {job['kind']}")
+        job_queue.finish(job["id"], handler(job))
+        print(f"[작업자] 완료 {label}", flush=True)
+    except job_queue.JobCancelled:
+        job_queue.fail(job["id"], "사용자가 취소함", cancelled=True)
+        print(f"[작업자] 취소 {label}", flush=True)
+    except Exception as e:
+        job_queue.fail(job["id"], f"{type(e).__name__}: {e}")
+        print(f"[작업자] 실패 {label}\n{traceback.format_exc()}", flush=True)
+
+
+def main() -> int:
+    pid = os.getpid()
+    if not job_queue.register_worker(pid):
+        print("[작업자] 이미 실행 중인 작업자가 있어 종료합니다", flush=True)
+        return 0
+
+    requeued = job_queue.requeue_orphaned_jobs()
+    if requeued:
+        print(f"[작업자] 중단된 작업 {requeued}개를 다시 대기열에 넣었습니다", flush=True)
+
+    stop = threading.Event()
+
+    def _heartbeat_loop():
+        while not stop.wait(_HEARTBEAT_INTERVAL):
+            job_queue.heartbeat(pid)
+
+    threading.Thread(target=_heartbeat_loop, daemon=True).start()
+
+    concurrency = max(1, int(os.environ.get("JOB_WORKER_CONCURRENCY", 3)))
+    print(f"[작업자] 시작 (pid {pid}, 동시 작업 {concurrency}개)", flush=True)
+
+    running = []
+    idle_since = time.time()
+    try:
+        while True:
+            running = [t for t in running if t.is_alive()]
+            job = job_queue.claim_next(pid) if len(running) < concurrency else None
+            if job:
+                thread = threading.Thread(target=_execute, args=(job,), daemon=True)
+                thread.start()
+                running.append(thread)
+                continue
+
+            if running:
+                idle_since = time.time()
+            elif time.time() - idle_since > _IDLE_EXIT_SECONDS:
+                print("[작업자] 대기 작업이 없어 종료합니다", flush=True)
+                return 0
+            time.sleep(_POLL_INTERVAL)
+    finally:
+        stop.set()
+        job_queue.unregister_worker(pid)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
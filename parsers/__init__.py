@@ -8,7 +8,8 @@
 
 import os
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 
 from parsers.base import (
@@ -17,10 +18,11 @@ from parsers.base import (
     parse_rtf,
     _parse_preamble,
     _extract_article_title,
-    _extract_title_with_gemini,
+    _extract_titles_with_gemini_batch,
     _clean_english_article,
     save_structured_to_excel,
 )
+from parsers.hierarchy import HierarchyIndex
 
 # ══════════════════════════════════════════════════════════════
 # 레지스트리
@@ -143,7 +145,10 @@ def extract_structured_articles(
     file_path: str,
     use_ai_titles: bool = False,
     gemini_api_key: str = None,
-    progress_callback=None
+    progress_callback=None,
+    workers: int = 1,
+    title_workers: int = 4,
+    title_batch_size: int = 20,
 ) -> pd.DataFrame:
     """PDF에서 법조문을 계층 구조(편/장/절/조/항/호)로 추출하여 DataFrame으로 반환한다.
 
@@ -152,16 +157,54 @@ def extract_structured_articles(
         use_ai_titles: True이면 AI로 제목 추출 (느리지만 정확)
         gemini_api_key: Gemini API 키 (use_ai_titles=True인 경우 필요)
         progress_callback: 진행률 콜백 함수 (current, total, message)
+        workers: PDF 페이지 추출에 사용할 프로세스 수 (1이면 순차 추출)
+        title_workers: AI 제목 추출 동시 요청 수 (요청 속도는 rate_limiter의 gemini 버킷이 제한)
+        title_batch_size: AI 제목 추출 한 번의 요청에 묶을 조문 수
 
     Returns:
         DataFrame with columns: ['편', '장', '절', '조문번호', '조문제목', '항', '호', '목', '세목', '원문']
     """
+    return pd.DataFrame(list(iter_structured_articles(
+        file_path,
+        use_ai_titles=use_ai_titles,
+        gemini_api_key=gemini_api_key,
+        progress_callback=progress_callback,
+        workers=workers,
+        title_workers=title_workers,
+        title_batch_size=title_batch_size,
+    )))
+
+
+def iter_structured_articles(
+    file_path: str,
+    use_ai_titles: bool = False,
+    gemini_api_key: str = None,
+    progress_callback=None,
+    workers: int = 1,
+    title_workers: int = 4,
+    title_batch_size: int = 20,
+):
+    """extract_structured_articles의 제너레이터 버전. 조문 단위로 행(dict)을 내보낸다.
+
+    조문 분리(목차/본문 중복 제거 등)는 전체 텍스트가 있어야 하므로 텍스트 추출과
+    조문 분리는 먼저 끝내고, 이후 조문별 제목 추출·항/호 파싱 결과를 바로 내보낸다.
+    AI 제목 추출처럼 조문마다 시간이 걸리는 경우 앞 조문부터 화면에 보여줄 수 있고,
+    전체 행 목록을 따로 쌓아 두지 않는다.
+
+    AI 제목 추출은 조문 분리 직후 대상 조문을 title_batch_size개씩 묶어 스레드 풀
+    (title_workers개)에 한꺼번에 요청해 두고, 행을 내보낼 때 조문 순서대로 결과를 받는다.
+    progress_callback은 조문 분리 직후(0개)와 조문(전문 제외)을 하나 처리할 때마다
+    AI 제목 추출 여부와 관계없이 불리며, 호출한 스레드(예: Streamlit 스크립트)에서만 불린다.
+
+    Yields:
+        {'편', '장', '절', '조문번호', '조문제목', '항', '호', '목', '세목', '원문'} 딕셔너리
+    """
     # 1. 텍스트 추출 (PDF 또는 RTF)
     file_ext = os.path.splitext(file_path)[1].lower()
     if file_ext == ".rtf":
         text = parse_rtf(file_path)
     else:
-        text = parse_pdf(file_path)
+        text = parse_pdf(file_path, workers=workers)
     lang = _detect_lang(file_path)
     fmt = _detect_format(file_path)
 
@@ -171,173 +214,152 @@ def extract_structured_articles(
     # 3. 조문 추출
     articles = split_articles(text, lang=lang, file_path=file_path)
 
-    # 4. 각 조문의 항/호 파싱 및 DataFrame 생성
-    rows = []
-    current_part = ""
-    current_chapter = ""
-    current_section = ""
+    # 4. 조문 시작 위치와 계층 목록을 병합하여 편/장/절 배정
+    levels = _assign_hierarchy(articles, hierarchy)
 
-    # AI 제목 추출을 사용하는 경우 전체 조문 수 계산 (진행률 표시용)
+    # 5. AI 제목 추출 요청 (제목이 없는 조문을 미리 동시에 요청)
+    # 전체 조문 수 계산 (진행률 표시용)
     total_articles = len([a for a in articles if a["id"] != "전문"])
     processed_articles = 0
-
-    for article in articles:
-        article_id = article["id"]
-        article_text = article["text"]
-
-        # 전문 처리
-        if article_id == "전문":
-            # 전문을 문단별로 파싱
-            preamble_paras = _parse_preamble(article_text)
-            if preamble_paras:
-                for para in preamble_paras:
-                    rows.append({
+    if progress_callback:
+        progress_callback(0, total_articles, "조문 분리 완료")
+
+    # 조문 title_batch_size개씩 한 번의 요청으로 묶는다 (같은 배치 안에서 조문 번호는 중복 없이)
+    title_futures = {}
+    title_executor = None
+    if use_ai_titles and gemini_api_key and lang != "korean":
+        batches = []
+        for idx, article in enumerate(articles):
+            if article["id"] == "전문" or article.get("title"):
+                continue
+            if (not batches or len(batches[-1]) >= max(1, title_batch_size)
+                    or any(articles[i]["id"] == article["id"] for i in batches[-1])):
+                batches.append([])
+            batches[-1].append(idx)
+
+        title_executor = ThreadPoolExecutor(max_workers=max(1, title_workers))
+        for batch in batches:
+            future = title_executor.submit(
+                _extract_titles_with_gemini_batch,
+                [(articles[i]["id"], articles[i]["text"]) for i in batch],
+                gemini_api_key,
+            )
+            for i in batch:
+                title_futures[i] = future
+
+    # 6. 각 조문의 항/호 파싱 및 행 생성
+    try:
+        for idx, article in enumerate(articles):
+            article_id = article["id"]
+            article_text = article["text"]
+
+            # 전문 처리
+            if article_id == "전문":
+                # 전문을 문단별로 파싱
+                preamble_paras = _parse_preamble(article_text)
+                if preamble_paras:
+                    for para in preamble_paras:
+                        yield {
+                            "편": "",
+                            "장": "",
+                            "절": "",
+                            "조문번호": "전문",
+                            "조문제목": para.get("paragraph", ""),
+                            "항": "",
+                            "호": "",
+                            "목": "",
+                            "세목": "",
+                            "원문": para["text"]
+                        }
+                else:
+                    yield {
                         "편": "",
                         "장": "",
                         "절": "",
                         "조문번호": "전문",
-                        "조문제목": para.get("paragraph", ""),
+                        "조문제목": "",
                         "항": "",
                         "호": "",
                         "목": "",
                         "세목": "",
-                        "원문": para["text"]
-                    })
-            else:
-                rows.append({
-                    "편": "",
-                    "장": "",
-                    "절": "",
-                    "조문번호": "전문",
-                    "조문제목": "",
-                    "항": "",
-                    "호": "",
-                    "목": "",
-                    "세목": "",
-                    "원문": article_text
-                })
-            continue
-
-        # 현재 조문이 속한 계층 정보 업데이트
-        article_pos = text.find(article_text)
-
-        # 전체 텍스트로 찾지 못한 경우 조문 ID 패턴으로 찾기
-        if article_pos == -1:
-            # 영문: "Article N" 형식
-            if "Article" in article_id:
-                pattern = re.escape(article_id) + r"(?:\s|$)"
-                match = re.search(pattern, text)
-                if match:
-                    article_pos = match.start()
-            # 한국어: "제N조" 형식
-            elif "제" in article_id and "조" in article_id:
-                pattern = re.escape(article_id) + r"(?:\(|<|\s|$)"
-                match = re.search(pattern, text)
-                if match:
-                    article_pos = match.start()
-            # 중국어: "第N條" 형식
-            elif "第" in article_id and "條" in article_id:
-                pattern = re.escape(article_id)
-                match = re.search(pattern, text)
-                if match:
-                    article_pos = match.start()
-
-            # 미국: "§ N." 형식
-            if article_pos == -1 and fmt == "us":
-                us_pat = re.compile(
-                    r"(?:^|\n)§\s*" + re.escape(article_id) + r"\.\s+"
-                )
-                all_matches = list(us_pat.finditer(text))
-                if all_matches:
-                    article_pos = all_matches[-1].start()
-
-            # 홍콩: "N." 형식
-            if article_pos == -1 and fmt == "hk":
-                hk_pat = re.compile(
-                    r"(?:^|\n)" + re.escape(article_id) + r"\.\s+[A-Z(]"
+                        "원문": article_text
+                    }
+                continue
+
+            # 현재 조문이 속한 계층 정보
+            current_part, current_chapter, current_section = levels[idx]
+
+            # 한국법: 조문번호/제목/원문 분리
+            if lang == "korean":
+                from parsers.korea import _clean_korean_article
+                article_id, title, article_text = _clean_korean_article(
+                    article_id, article_text
                 )
-                all_matches = list(hk_pat.finditer(text))
-                if all_matches:
-                    article_pos = all_matches[-1].start()
-
-            # 여전히 못 찾은 경우 처음 100자로 재시도
-            if article_pos == -1 and len(article_text) > 100:
-                article_pos = text.find(article_text[:100])
-
-        latest_part = ""
-        latest_chapter = ""
-        latest_section = ""
-        for h in hierarchy:
-            if h["start_pos"] > article_pos:
-                break
-            if h["type"] == "part":
-                latest_part = h["title"]
-                latest_chapter = ""
-                latest_section = ""
-            elif h["type"] == "chapter":
-                latest_chapter = h["title"]
-                latest_section = ""
-            elif h["type"] == "section":
-                latest_section = h["title"]
-        current_part = latest_part
-        current_chapter = latest_chapter
-        current_section = latest_section
-
-        # 한국법: 조문번호/제목/원문 분리
-        if lang == "korean":
-            from parsers.korea import _clean_korean_article
-            article_id, title, article_text = _clean_korean_article(
-                article_id, article_text
-            )
-        else:
-            # 조문 제목 추출
-            if "title" in article and article["title"]:
-                title = article["title"]
-            elif use_ai_titles and gemini_api_key:
-                title = _extract_title_with_gemini(article_text, article_id, gemini_api_key)
-                time.sleep(0.5)
-                processed_articles += 1
-                if progress_callback:
-                    progress_callback(processed_articles, total_articles, f"제목 추출 중: {article_id}")
             else:
-                title = _extract_article_title(article_text, lang)
-
-            # 영문 조문 원문 정리 (중복 헤더 제거)
-            if lang in ["english", None]:
-                article_text = _clean_english_article(article_id, article_text, title)
-
-        # 항/호 파싱
-        paragraphs = _parse_paragraphs_and_items(article_text, lang, fmt=fmt)
-
-        if not paragraphs:
-            rows.append({
-                "편": current_part,
-                "장": current_chapter,
-                "절": current_section,
-                "조문번호": article_id,
-                "조문제목": title,
-                "항": "",
-                "호": "",
-                "목": "",
-                "세목": "",
-                "원문": article_text
-            })
-        else:
-            for para in paragraphs:
-                rows.append({
+                # 조문 제목 추출
+                if "title" in article and article["title"]:
+                    title = article["title"]
+                elif idx in title_futures:
+                    title = title_futures[idx].result()[article_id]
+                else:
+                    title = _extract_article_title(article_text, lang)
+
+                # 영문 조문 원문 정리 (중복 헤더 제거)
+                if lang in ["english", None]:
+                    article_text = _clean_english_article(article_id, article_text, title)
+
+            processed_articles += 1
+            if progress_callback:
+                message = "제목 추출 중" if idx in title_futures else "조문 구조화 중"
+                progress_callback(processed_articles, total_articles, f"{message}: {article_id}")
+
+            # 항/호 파싱
+            paragraphs = _parse_paragraphs_and_items(article_text, lang, fmt=fmt)
+
+            if not paragraphs:
+                yield {
                     "편": current_part,
                     "장": current_chapter,
                     "절": current_section,
                     "조문번호": article_id,
                     "조문제목": title,
-                    "항": para.get("paragraph", ""),
-                    "호": para.get("item", ""),
-                    "목": para.get("subitem", ""),
-                    "세목": para.get("subsubitem", ""),
-                    "원문": para["text"]
-                })
-
-    return pd.DataFrame(rows)
+                    "항": "",
+                    "호": "",
+                    "목": "",
+                    "세목": "",
+                    "원문": article_text
+                }
+            else:
+                for para in paragraphs:
+                    yield {
+                        "편": current_part,
+                        "장": current_chapter,
+                        "절": current_section,
+                        "조문번호": article_id,
+                        "조문제목": title,
+                        "항": para.get("paragraph", ""),
+                        "호": para.get("item", ""),
+                        "목": para.get("subitem", ""),
+                        "세목": para.get("subsubitem", ""),
+                        "원문": para["text"]
+                    }
+    finally:
+        # 소비자가 중간에 멈추면 아직 시작하지 않은 제목 요청은 취소
+        if title_executor is not None:
+            title_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _assign_hierarchy(articles: list[dict], hierarchy: list[dict]) -> list[tuple[str, str, str]]:
+    """각 조문의 (편, 장, 절)을 구한다.
+
+    분리 함수가 기록한 조문 시작 위치("start")를 계층 색인에서 조회한다.
+    위치가 없는 조문은 계층 없음으로 둔다.
+
+    Returns:
+        articles와 같은 순서의 (편, 장, 절) 튜플 리스트
+    """
+    index = HierarchyIndex(hierarchy)
+    return [index.at(a.get("start", -1)) for a in articles]
 
 
 def _detect_hierarchy(text: str, lang: str, file_path: str = None) -> list[dict]:
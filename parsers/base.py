@@ -7,11 +7,17 @@
 import os
 import re
 import sys
-import time
+import json
+import hashlib
 import subprocess
+import numpy as np
 import pdfplumber
+from pdfplumber.utils import chars_to_textmap, clip_obj
 import pandas as pd
-import google.generativeai as genai
+
+from api_clients import get_gemini_model
+from parsers.cache import make_cache_key, make_page_cache_key, load_cache, save_cache
+from rate_limiter import request_slot
 
 
 # ══════════════════════════════════════════════════════════════
@@ -75,7 +81,13 @@ class BaseParser:
 # 공통 유틸리티 함수
 # ══════════════════════════════════════════════════════════════
 
-def parse_pdf(file_path: str, filter_superscript: bool = True, use_layout: bool = True) -> str:
+def parse_pdf(
+    file_path: str,
+    filter_superscript: bool = True,
+    use_layout: bool = True,
+    workers: int = 1,
+    use_cache: bool = True,
+) -> str:
     """PDF 파일에서 전체 텍스트를 추출한다.
 
     Args:
@@ -83,20 +95,176 @@ def parse_pdf(file_path: str, filter_superscript: bool = True, use_layout: bool
         filter_superscript: True이면 위첨자(superscript) 문자를 제거한다.
             EPC 등 조문 번호 옆에 옛 번호가 위첨자로 붙는 PDF에 유용하다.
         use_layout: True이면 2단 구성 등 레이아웃을 고려하여 텍스트를 추출한다.
+        workers: 페이지 추출에 사용할 프로세스 수. 2 이상이면 페이지를 구간별로
+            나누어 프로세스마다 별도의 pdfplumber 핸들로 추출하고 페이지 순서대로 합친다.
+        use_cache: True이면 파일 내용 해시와 추출 옵션이 같은 이전 결과를
+            디스크 캐시(.extract_cache/)에서 불러온다.
     """
-    texts = []
+    if use_cache:
+        cache_key = make_cache_key(
+            "pdf", file_path,
+            filter_superscript=filter_superscript, use_layout=use_layout,
+        )
+        cached = load_cache(cache_key)
+        if cached is not None:
+            return cached
+
     with pdfplumber.open(file_path) as pdf:
-        for page in pdf.pages:
-            if use_layout:
-                # 2단 구성 처리: 컬럼별로 텍스트 추출
-                page_text = _extract_text_with_layout(page, filter_superscript)
-            elif filter_superscript and page.chars:
-                page_text = _extract_without_superscript(page)
-            else:
-                page_text = page.extract_text()
-            if page_text:
-                texts.append(page_text)
-    return "\n".join(texts)
+        page_count = len(pdf.pages)
+        texts = [None] * page_count
+
+        # 페이지 단위 캐시: 개정판 PDF는 대부분의 페이지가 그대로이므로
+        # content stream이 바뀐 페이지만 다시 추출한다.
+        page_keys = []
+        if use_cache:
+            memo = {}
+            for n, page in enumerate(pdf.pages):
+                page_keys.append(make_page_cache_key(
+                    _page_fingerprint(page, memo),
+                    filter_superscript=filter_superscript, use_layout=use_layout,
+                ))
+                texts[n] = load_cache(page_keys[n])
+
+        missing = [n for n, t in enumerate(texts) if t is None]
+        if workers <= 1 or len(missing) < 2:
+            for n in missing:
+                texts[n] = _extract_page_text(pdf.pages[n], filter_superscript, use_layout)
+            parallel = False
+        else:
+            parallel = True
+
+    if parallel:
+        extracted = _extract_pages_parallel(
+            file_path, missing, filter_superscript, use_layout, workers
+        )
+        for n, page_text in zip(missing, extracted):
+            texts[n] = page_text
+
+    text = "\n".join(t for t in texts if t)
+    if use_cache:
+        for n in missing:
+            save_cache(page_keys[n], texts[n], evict=False)
+        save_cache(cache_key, text)
+    return text
+
+
+def _extract_page_text(page, filter_superscript: bool, use_layout: bool) -> str:
+    """한 페이지의 텍스트를 추출한다."""
+    if use_layout:
+        # 2단 구성 처리: 컬럼별로 텍스트 추출
+        return _extract_text_with_layout(page, filter_superscript)
+    elif filter_superscript and page.chars:
+        return _extract_without_superscript(page)
+    else:
+        return page.extract_text() or ""
+
+
+def _extract_pages(
+    file_path: str,
+    page_numbers: list[int],
+    filter_superscript: bool,
+    use_layout: bool,
+) -> list[str]:
+    """지정한 페이지들의 텍스트를 순서대로 추출한다.
+
+    프로세스 풀의 작업 단위로 쓰이므로 모듈 최상위 함수로 두고,
+    호출마다 자체 pdfplumber 핸들을 연다.
+    """
+    with pdfplumber.open(file_path) as pdf:
+        return [
+            _extract_page_text(pdf.pages[n], filter_superscript, use_layout)
+            for n in page_numbers
+        ]
+
+
+def _extract_pages_parallel(
+    file_path: str,
+    page_numbers: list[int],
+    filter_superscript: bool,
+    use_layout: bool,
+    workers: int,
+) -> list[str]:
+    """페이지 목록을 연속 구간으로 나누어 프로세스 풀에서 추출한다.
+
+    페이지마다 처리 시간이 달라 워커 수보다 잘게(워커당 약 4구간) 나누며,
+    결과는 입력한 페이지 순서대로 반환한다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    if not page_numbers:
+        return []
+
+    workers = min(workers, len(page_numbers))
+    chunk_size = max(1, -(-len(page_numbers) // (workers * 4)))
+    chunks = [
+        page_numbers[i:i + chunk_size]
+        for i in range(0, len(page_numbers), chunk_size)
+    ]
+
+    # Streamlit은 스크립트를 스레드에서 실행하고 gRPC도 스레드를 띄우므로
+    # fork 대신 spawn으로 워커를 생성한다.
+    ctx = multiprocessing.get_context("spawn")
+    texts = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        results = executor.map(
+            _extract_pages,
+            [file_path] * len(chunks),
+            chunks,
+            [filter_superscript] * len(chunks),
+            [use_layout] * len(chunks),
+        )
+        for chunk_texts in results:
+            texts.extend(chunk_texts)
+    return texts
+
+
+def _page_fingerprint(page, memo: dict) -> str:
+    """페이지의 content stream과 참조 리소스(폰트·XObject 등)로 페이지 해시를 만든다.
+
+    여러 페이지가 공유하는 리소스는 memo에 객체 번호별 해시를 저장해 한 번만 계산한다.
+    """
+    page_obj = page.page_obj
+    h = hashlib.sha256()
+    h.update(repr((page_obj.mediabox, page_obj.cropbox, page_obj.rotate)).encode())
+    for stream in page_obj.contents:
+        h.update(_pdf_object_digest(stream, memo))
+    h.update(_pdf_object_digest(page_obj.resources, memo))
+    return h.hexdigest()
+
+
+def _pdf_object_digest(obj, memo: dict) -> bytes:
+    """PDF 객체(간접 참조·스트림·사전·배열)를 재귀적으로 해시한다."""
+    from pdfminer.pdftypes import PDFObjRef, PDFStream
+
+    if isinstance(obj, PDFObjRef):
+        if obj.objid in memo:
+            return memo[obj.objid]
+        memo[obj.objid] = b"ref:%d" % obj.objid  # 순환 참조 방지
+        digest = _pdf_object_digest(obj.resolve(), memo)
+        memo[obj.objid] = digest
+        return digest
+
+    h = hashlib.sha256()
+    if isinstance(obj, PDFStream):
+        h.update(b"S")
+        h.update(_pdf_object_digest(obj.attrs, memo))
+        try:
+            h.update(obj.get_data())
+        except Exception:
+            h.update(obj.get_rawdata() or b"")
+    elif isinstance(obj, dict):
+        h.update(b"D")
+        for k in sorted(obj, key=str):
+            h.update(str(k).encode())
+            h.update(_pdf_object_digest(obj[k], memo))
+    elif isinstance(obj, (list, tuple)):
+        h.update(b"L")
+        for v in obj:
+            h.update(_pdf_object_digest(v, memo))
+    else:
+        h.update(repr(obj).encode())
+    return h.digest()
 
 
 def _extract_text_with_layout(page, filter_superscript: bool = True) -> str:
@@ -104,23 +272,31 @@ def _extract_text_with_layout(page, filter_superscript: bool = True) -> str:
 
     페이지를 좌우로 나누어 왼쪽 컬럼을 먼저 읽고, 오른쪽 컬럼을 읽는다.
     단어가 잘리지 않도록 layout=True 옵션을 사용한다.
+
+    문자 좌표·크기는 NumPy 배열로 한 번만 읽어 2단 판별, 컬럼 경계,
+    위첨자 판별을 모두 배열 연산으로 처리한다. crop/filter로 파생 페이지를
+    만들지 않고 컬럼에 걸치는 문자만 골라 같은 방식(clip_obj)으로 잘라내므로
+    결과 텍스트는 crop → filter → extract_text 방식과 같다.
     """
-    if not page.chars:
+    chars = page.chars
+    if not chars:
         return page.extract_text() or ""
 
+    arrays = _char_arrays(chars)
+
     # 페이지 너비의 중간점 계산
     page_width = page.width
     page_height = page.height
     mid_x = page_width / 2
 
     # 문자들의 x 좌표 분포를 확인하여 2단 구성인지 판단
-    x_coords = [c["x0"] for c in page.chars]
-    left_chars = sum(1 for x in x_coords if x < mid_x)
-    right_chars = sum(1 for x in x_coords if x >= mid_x)
+    x0 = arrays["x0"]
+    total_chars = len(x0)
+    left_chars = int(np.count_nonzero(x0 < mid_x))
+    right_chars = int(np.count_nonzero(x0 >= mid_x))
 
     # 양쪽에 문자가 골고루 분포되어 있으면 2단 구성으로 판단
     # (왼쪽/오른쪽 각각 전체의 30% 이상)
-    total_chars = len(x_coords)
     is_two_column = (
         total_chars > 0 and
         left_chars / total_chars > 0.3 and
@@ -128,49 +304,31 @@ def _extract_text_with_layout(page, filter_superscript: bool = True) -> str:
     )
 
     if is_two_column:
-        # 2단 구성: 왼쪽 컬럼과 오른쪽 컬럼을 별도로 추출
-        # 실제 컬럼 경계 찾기 (중간 공백 영역)
-        # x 좌표를 정렬하여 가장 큰 간격 찾기
-        sorted_x = sorted(set([c["x0"] for c in page.chars]))
-        max_gap = 0
-        gap_pos = mid_x
-
-        for i in range(len(sorted_x) - 1):
-            gap = sorted_x[i + 1] - sorted_x[i]
-            # mid_x 근처(±20%)에서 가장 큰 간격 찾기
-            if (abs(sorted_x[i] - mid_x) < page_width * 0.2 and gap > max_gap):
-                max_gap = gap
-                gap_pos = (sorted_x[i] + sorted_x[i + 1]) / 2
-
-        # 찾은 간격이 충분히 크면 사용, 아니면 mid_x 사용
-        if max_gap > page_width * 0.05:
-            mid_x = gap_pos
-
-        # 왼쪽 컬럼 (0 ~ mid_x)
-        left_bbox = (0, 0, mid_x, page_height)
-        left_crop = page.crop(left_bbox)
-
-        # 오른쪽 컬럼 (mid_x ~ page_width)
-        right_bbox = (mid_x, 0, page_width, page_height)
-        right_crop = page.crop(right_bbox)
-
-        # 각 컬럼에서 텍스트 추출 (layout=True로 단어 보존)
-        if filter_superscript:
-            left_text = _extract_without_superscript(left_crop)
-            right_text = _extract_without_superscript(right_crop)
-        else:
-            # layout=True 옵션으로 단어가 잘리지 않도록 함
-            left_text = left_crop.extract_text(layout=True) or ""
-            right_text = right_crop.extract_text(layout=True) or ""
+        # 실제 컬럼 경계 찾기: mid_x 근처(±20%)에서 x 좌표 간격이 가장 큰 곳
+        sorted_x = np.unique(x0)
+        gaps = np.diff(sorted_x)
+        near_mid = np.abs(sorted_x[:-1] - mid_x) < page_width * 0.2
+        if near_mid.any():
+            # 간격은 항상 양수이므로 근처가 아닌 곳을 0으로 두고 첫 최댓값을 고른다
+            candidates = np.where(near_mid, gaps, 0.0)
+            i = int(np.argmax(candidates))
+            # 찾은 간격이 충분히 크면 사용, 아니면 mid_x 사용
+            if candidates[i] > page_width * 0.05:
+                mid_x = float((sorted_x[i] + sorted_x[i + 1]) / 2)
 
         # 왼쪽 컬럼 먼저, 그 다음 오른쪽 컬럼
+        left_text = _extract_column_text(
+            chars, arrays, (0, 0, mid_x, page_height), filter_superscript
+        )
+        right_text = _extract_column_text(
+            chars, arrays, (mid_x, 0, page_width, page_height), filter_superscript
+        )
         return left_text + "\n" + right_text
     else:
         # 단일 컬럼: 일반 추출
         if filter_superscript:
-            return _extract_without_superscript(page)
-        else:
-            return page.extract_text(layout=True) or ""
+            chars = _drop_superscript(chars, arrays["size"])
+        return _chars_to_layout_text(chars, page.bbox)
 
 
 def _extract_without_superscript(page) -> str:
@@ -179,37 +337,105 @@ def _extract_without_superscript(page) -> str:
     if not chars:
         return page.extract_text(layout=True) or ""
 
-    # 페이지 내 주요 폰트 크기 판별 (최빈값)
-    from collections import Counter
-    sizes = [round(c["size"], 1) for c in chars]
-    if not sizes:
-        return page.extract_text(layout=True) or ""
-    dominant_size = Counter(sizes).most_common(1)[0][0]
+    sizes = np.fromiter((c["size"] for c in chars), dtype=float, count=len(chars))
+    return _chars_to_layout_text(_drop_superscript(chars, sizes), page.bbox)
+
+
+def _char_arrays(chars: list[dict]) -> dict:
+    """문자 목록의 좌표·폰트 크기를 한 번에 NumPy 배열로 읽는다."""
+    values = np.array(
+        [(c["x0"], c["top"], c["x1"], c["bottom"], c["size"]) for c in chars],
+        dtype=float,
+    ).reshape(-1, 5)
+    return {
+        "x0": values[:, 0],
+        "top": values[:, 1],
+        "x1": values[:, 2],
+        "bottom": values[:, 3],
+        "size": values[:, 4],
+    }
+
+
+def _extract_column_text(chars: list[dict], arrays: dict, bbox: tuple,
+                         filter_superscript: bool) -> str:
+    """bbox에 걸치는 문자만 잘라내어 컬럼 텍스트를 추출한다 (page.crop과 동일한 판정)."""
+    x0, top, x1, bottom = bbox
+    # pdfplumber get_bbox_overlap과 같은 겹침 판정
+    o_width = np.minimum(arrays["x1"], x1) - np.maximum(arrays["x0"], x0)
+    o_height = np.minimum(arrays["bottom"], bottom) - np.maximum(arrays["top"], top)
+    inside = np.flatnonzero((o_width >= 0) & (o_height >= 0) & (o_width + o_height > 0))
+
+    column_chars = [clip_obj(chars[i], bbox) for i in inside]
+    if filter_superscript:
+        column_chars = _drop_superscript(column_chars, arrays["size"][inside])
+    return _chars_to_layout_text(column_chars, bbox)
+
+
+def _drop_superscript(chars: list[dict], sizes: np.ndarray) -> list[dict]:
+    """주요 폰트 크기(최빈값)의 75% 미만인 문자를 위첨자로 보고 제거한다."""
+    if not chars:
+        return chars
+    threshold = _dominant_font_size(sizes) * 0.75
+    keep = sizes >= threshold
+    if not keep.any():
+        return chars
+    return [c for c, k in zip(chars, keep) if k]
 
-    # 주요 크기의 75% 미만인 문자는 위첨자로 간주하여 제거
-    threshold = dominant_size * 0.75
-    filtered = [c for c in chars if c["size"] >= threshold]
 
-    # 필터링된 문자로 텍스트 재구성 (pdfplumber의 기본 extract_text 로직 활용)
-    if not filtered:
-        return page.extract_text(layout=True) or ""
+def _dominant_font_size(sizes: np.ndarray) -> float:
+    """소수 첫째 자리로 반올림한 폰트 크기의 최빈값을 구한다.
 
-    # 필터링된 chars만으로 페이지 텍스트 재추출
-    filtered_page = page.filter(
-        lambda obj: obj.get("size", 999) >= threshold
-        if obj["object_type"] == "char"
-        else True
+    동률이면 먼저 등장한 크기를 고른다 (Counter.most_common과 같은 규칙).
+    반올림은 고유 크기 몇 개에만 파이썬 round를 적용하여 기존 결과와 맞춘다.
+    """
+    unique, first_index, inverse = np.unique(
+        sizes, return_index=True, return_inverse=True
     )
-    return filtered_page.extract_text(layout=True) or ""
+    counts = np.bincount(inverse.ravel())
+
+    totals: dict[float, int] = {}
+    first_seen: dict[float, int] = {}
+    for size, count, first in zip(unique.tolist(), counts.tolist(), first_index.tolist()):
+        rounded = round(size, 1)
+        totals[rounded] = totals.get(rounded, 0) + count
+        first_seen[rounded] = min(first_seen.get(rounded, first), first)
+    return max(totals, key=lambda r: (totals[r], -first_seen[r]))
+
+
+def _chars_to_layout_text(chars: list[dict], bbox: tuple) -> str:
+    """문자 목록을 bbox 기준 layout=True 텍스트로 변환한다 (page.extract_text와 동일)."""
+    textmap = chars_to_textmap(
+        chars,
+        layout=True,
+        layout_bbox=tuple(bbox),
+        layout_width=bbox[2] - bbox[0],
+        layout_height=bbox[3] - bbox[1],
+    )
+    return textmap.as_string or ""
 
 
-def parse_rtf(file_path: str) -> str:
+def parse_rtf(file_path: str, use_cache: bool = True) -> str:
     """RTF 파일에서 텍스트를 추출한다.
 
     macOS에서는 textutil 명령을 사용하고,
     그 외에는 striprtf 라이브러리를 사용한다.
     최종 fallback으로 RTF 태그를 regex로 제거한다.
+    use_cache=True이면 파일 내용 해시로 디스크 캐시를 사용한다.
     """
+    if not use_cache:
+        return _parse_rtf_uncached(file_path)
+
+    cache_key = make_cache_key("rtf", file_path)
+    cached = load_cache(cache_key)
+    if cached is not None:
+        return cached
+    text = _parse_rtf_uncached(file_path)
+    save_cache(cache_key, text)
+    return text
+
+
+def _parse_rtf_uncached(file_path: str) -> str:
+    """캐시 없이 RTF 파일에서 텍스트를 추출한다."""
     # macOS: textutil 사용
     if sys.platform == "darwin":
         try:
@@ -386,9 +612,46 @@ def _extract_article_title(text: str, lang: str) -> str:
     return ""
 
 
+_TITLE_SYSTEM_INSTRUCTION = "당신은 법률 문서 전문가입니다. 법조문에서 제목을 정확하게 추출합니다."
+_TITLE_SAMPLE_CHARS = 500
+
+
+def _get_title_model(gemini_api_key: str, json_output: bool = False):
+    """제목 추출용 GenerativeModel (api_clients 공용 풀에서 API 키·출력 형식별로 재사용)."""
+    return get_gemini_model(
+        gemini_api_key, "gemini-2.5-flash", _TITLE_SYSTEM_INSTRUCTION, json_output=json_output,
+    )
+
+
+def _validate_ai_title(title: str):
+    """AI가 반환한 제목을 검증한다.
+
+    Returns:
+        정리된 제목. "없음"류 응답이면 빈 문자열(제목 없음),
+        제목으로 볼 수 없는 응답(너무 김, 조문 참조 포함)이면 None.
+    """
+    title = title.strip()
+
+    # 1. 너무 길면 제목이 아님 (100자 이상)
+    if len(title) > 100:
+        return None
+
+    # 2. 조문 번호가 포함되어 있으면 제목이 아님
+    if re.search(r'\bArticle\s+\d+|\bSection\s+\d+|\bArt\.\s*\d+', title, re.IGNORECASE):
+        return None
+
+    # 3. "제목 없음", "없음", "no title" 등의 응답은 빈 문자열로
+    if re.search(r'(no title|없음|제목\s*없음|none)', title, re.IGNORECASE):
+        return ""
+
+    return title
+
+
 def _extract_title_with_gemini(article_text: str, article_id: str, gemini_api_key: str) -> str:
     """Gemini API를 사용하여 법조문에서 제목을 추출한다.
 
+    스레드 안전하다. 요청 속도는 rate_limiter의 gemini 버킷으로 제한한다.
+
     Args:
         article_text: 조문 원문
         article_id: 조문 번호 (예: "Article 1")
@@ -401,7 +664,7 @@ def _extract_title_with_gemini(article_text: str, article_id: str, gemini_api_ke
         return ""
 
     # 텍스트가 너무 길면 처음 500자만 사용
-    text_sample = article_text[:500] if len(article_text) > 500 else article_text
+    text_sample = article_text[:_TITLE_SAMPLE_CHARS]
 
     prompt = f"""다음은 법조문의 일부입니다. 이 조문의 제목만 추출하세요.
 
@@ -419,16 +682,14 @@ def _extract_title_with_gemini(article_text: str, article_id: str, gemini_api_ke
 제목:"""
 
     try:
-        genai.configure(api_key=gemini_api_key)
-        model = genai.GenerativeModel(
-            "gemini-2.5-flash",
-            system_instruction="당신은 법률 문서 전문가입니다. 법조문에서 제목을 정확하게 추출합니다.",
-        )
+        model = _get_title_model(gemini_api_key)
 
-        response = model.generate_content(
-            prompt,
-            request_options={"timeout": 30},
-        )
+        # 여러 스레드에서 동시에 호출되므로 프로세스 공용 한도 안에서 요청
+        with request_slot("gemini"):
+            response = model.generate_content(
+                prompt,
+                request_options={"timeout": 30},
+            )
 
         # 응답이 차단되었거나 빈 경우 안전하게 처리
         if not response.candidates:
@@ -436,22 +697,8 @@ def _extract_title_with_gemini(article_text: str, article_id: str, gemini_api_ke
         candidate = response.candidates[0]
         if not candidate.content or not candidate.content.parts:
             return ""
-        title = candidate.content.parts[0].text.strip()
 
-        # 응답 검증
-        # 1. 너무 길면 제목이 아님 (100자 이상)
-        if len(title) > 100:
-            return ""
-
-        # 2. 조문 번호가 포함되어 있으면 제목이 아님
-        if re.search(r'\bArticle\s+\d+|\bSection\s+\d+|\bArt\.\s*\d+', title, re.IGNORECASE):
-            return ""
-
-        # 3. "제목 없음", "없음", "no title" 등의 응답은 빈 문자열로
-        if re.search(r'(no title|없음|제목\s*없음|none)', title, re.IGNORECASE):
-            return ""
-
-        return title
+        return _validate_ai_title(candidate.content.parts[0].text) or ""
 
     except Exception as e:
         # API 오류 시 빈 문자열 반환
@@ -459,6 +706,127 @@ def _extract_title_with_gemini(article_text: str, article_id: str, gemini_api_ke
         return ""
 
 
+def _extract_titles_with_gemini_batch(articles: list[tuple[str, str]], gemini_api_key: str) -> dict:
+    """여러 조문의 제목을 한 번의 Gemini 요청(JSON 응답)으로 추출한다.
+
+    각 조문의 앞부분(500자)을 묶어 {조문번호: 제목} JSON으로 받고, 제목마다
+    _validate_ai_title 규칙을 적용한다. 응답에 빠졌거나 검증에 실패한 조문만
+    _extract_title_with_gemini로 한 건씩 다시 요청한다.
+
+    Args:
+        articles: [(조문 번호, 조문 원문), ...] — 조문 번호는 서로 달라야 한다
+        gemini_api_key: Gemini API 키
+
+    Returns:
+        {조문 번호: 제목} (제목이 없으면 빈 문자열)
+    """
+    if not gemini_api_key or gemini_api_key == "your-key-here":
+        return {article_id: "" for article_id, _ in articles}
+    if len(articles) == 1:
+        article_id, article_text = articles[0]
+        return {article_id: _extract_title_with_gemini(article_text, article_id, gemini_api_key)}
+
+    article_blocks = "\n\n".join(
+        f"[조문 번호: {article_id}]\n{article_text[:_TITLE_SAMPLE_CHARS]}"
+        for article_id, article_text in articles
+    )
+    prompt = f"""다음은 여러 법조문의 앞부분입니다. 각 조문의 제목만 추출하세요.
+
+규칙:
+1. 조문에 제목이 있으면 제목만 반환
+2. 제목이 없으면 빈 문자열("")
+3. 조문 참조는 제목이 아닙니다 (예: "Article 24", "under Article X", "R. 39" 등)
+4. 순수한 제목만 추출 (참조 번호 제외)
+5. 제목은 보통 2-10단어 정도입니다
+6. 모든 조문 번호를 키로 하는 JSON 객체만 출력: {{"조문 번호": "제목", ...}}
+
+{article_blocks}"""
+
+    raw_titles = {}
+    try:
+        model = _get_title_model(gemini_api_key, json_output=True)
+        with request_slot("gemini"):
+            response = model.generate_content(
+                prompt,
+                request_options={"timeout": 60},
+            )
+        if response.candidates and response.candidates[0].content and response.candidates[0].content.parts:
+            parsed = json.loads(response.candidates[0].content.parts[0].text)
+            if isinstance(parsed, dict):
+                raw_titles = parsed
+    except Exception as e:
+        # 배치 요청 실패 시 전체를 조문별 요청으로 대체
+        print(f"Warning: Gemini batch title error ({len(articles)}개 조문): {type(e).__name__}")
+
+    titles = {}
+    for article_id, article_text in articles:
+        raw_title = raw_titles.get(article_id)
+        title = _validate_ai_title(raw_title) if isinstance(raw_title, str) else None
+        if title is None:
+            title = _extract_title_with_gemini(article_text, article_id, gemini_api_key)
+        titles[article_id] = title
+    return titles
+
+
+# ══════════════════════════════════════════════════════════════
+# 조문 위치 추적 (정제 전 원문 기준 오프셋)
+# ══════════════════════════════════════════════════════════════
+
+def _apply_cleanup_rules(text: str, rules: list, offsets: np.ndarray = None):
+    """(정규식, 치환문자열) 규칙을 순서대로 적용한다.
+
+    offsets(각 문자의 원문 위치 배열)를 주면 치환과 함께 갱신하므로,
+    정제된 텍스트에서 찾은 조문 위치를 원문 위치로 되돌릴 수 있다.
+
+    Returns:
+        (정제된 텍스트, 갱신된 offsets 또는 None)
+    """
+    for regex, repl in rules:
+        if offsets is None:
+            text = regex.sub(repl, text)
+        else:
+            text, offsets = _sub_with_offsets(regex, repl, text, offsets)
+    return text, offsets
+
+
+def _sub_with_offsets(regex, repl: str, text: str, offsets: np.ndarray):
+    """regex.sub(repl, text)와 같은 결과를 만들면서 원문 위치 배열도 갱신한다.
+
+    치환으로 새로 들어간 문자는 매치 시작 위치를 원문 위치로 삼는다.
+    """
+    text_parts = []
+    offset_parts = []
+    last = 0
+    for match in regex.finditer(text):
+        start, end = match.span()
+        text_parts.append(text[last:start])
+        offset_parts.append(offsets[last:start])
+        replacement = match.expand(repl)
+        if replacement:
+            if start < len(offsets):
+                anchor = offsets[start]
+            else:
+                anchor = offsets[-1] + 1 if len(offsets) else 0
+            text_parts.append(replacement)
+            offset_parts.append(np.full(len(replacement), anchor, dtype=offsets.dtype))
+        last = end
+
+    if not text_parts:
+        return text, offsets
+    text_parts.append(text[last:])
+    offset_parts.append(offsets[last:])
+    return "".join(text_parts), np.concatenate(offset_parts)
+
+
+def _chunk_start(text: str, start: int, end: int, offsets: np.ndarray = None) -> int:
+    """text[start:end] 조문 청크에서 앞 공백을 건너뛴 첫 글자의 원문 위치를 반환한다."""
+    chunk = text[start:end]
+    pos = start + len(chunk) - len(chunk.lstrip())
+    if offsets is None:
+        return pos
+    return int(offsets[pos]) if pos < len(offsets) else int(offsets[-1]) + 1
+
+
 def _clean_english_article(article_id: str, article_text: str, article_title: str = "") -> str:
     """영문 조문에서 중복 헤더를 제거한다.
 
@@ -0,0 +1,130 @@
+"""추출 결과 디스크 캐시.
+
+parse_pdf / parse_rtf / parse_german_xml 결과를 파일 내용 해시와 추출 옵션으로
+만든 키로 `.extract_cache/`에 pickle로 저장한다. 파일 경로·수정 시각이 아니라
+내용으로 키를 만들므로 같은 법령 파일을 다른 이름으로 옮겨도 캐시가 적중한다.
+PDF는 페이지별 텍스트도 페이지 내용 해시로 따로 저장하여, 개정판 PDF에서는
+바뀐 페이지만 다시 추출한다.
+
+전체 크기가 상한(기본 512MB, EXTRACT_CACHE_MAX_MB 환경변수로 조정)을 넘으면
+가장 오래 사용하지 않은 항목부터 지운다(LRU, 파일 mtime 기준).
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".extract_cache"
+)
+_MAX_CACHE_BYTES = int(os.environ.get("EXTRACT_CACHE_MAX_MB", "512")) * 1024 * 1024
+
+# 추출 로직이 바뀌어 기존 캐시를 무효화해야 할 때 올린다.
+_CACHE_VERSION = 1
+
+
+def file_digest(file_path: str) -> str:
+    """파일 내용의 SHA-256 해시를 반환한다."""
+    h = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def make_cache_key(kind: str, file_path: str, **options) -> str:
+    """추출 종류(pdf/rtf/xml), 파일 내용 해시, 추출 옵션으로 캐시 키를 만든다."""
+    return _make_key(kind, file_digest(file_path), options)
+
+
+def make_page_cache_key(page_digest: str, **options) -> str:
+    """PDF 한 페이지의 내용 해시와 추출 옵션으로 페이지 캐시 키를 만든다."""
+    return _make_key("pdf-page", page_digest, options)
+
+
+def _make_key(kind: str, digest: str, options: dict) -> str:
+    content = json.dumps(
+        {
+            "version": _CACHE_VERSION,
+            "kind": kind,
+            "digest": digest,
+            "options": options,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+
+
+def load_cache(cache_key: str):
+    """캐시 항목이 있으면 로드하고 최근 사용 시각을 갱신한다. 없으면 None."""
+    cache_path = os.path.join(_CACHE_DIR, f"{cache_key}.pkl")
+    try:
+        with open(cache_path, "rb") as f:
+            value = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError) as e:
+        print(f"[캐시] 손상된 캐시 항목 무시: {cache_key} ({e})")
+        return None
+
+    try:
+        os.utime(cache_path)  # LRU: 사용 시각 갱신
+    except OSError:
+        pass
+    return value
+
+
+def save_cache(cache_key: str, value, evict: bool = True) -> None:
+    """캐시 항목을 저장하고, 상한을 넘으면 오래된 항목을 정리한다.
+
+    여러 항목(페이지 캐시 등)을 연달아 저장할 때는 evict=False로 저장하고
+    마지막 저장에서만 정리하여 디렉터리 스캔을 한 번으로 줄인다.
+    """
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    cache_path = os.path.join(_CACHE_DIR, f"{cache_key}.pkl")
+    # 동시에 여러 프로세스가 쓰더라도 반쯤 쓰인 파일이 읽히지 않도록 교체 방식으로 저장
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"[캐시] 저장 실패: {cache_key} ({e})")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return
+    if evict:
+        _evict()
+
+
+def _evict() -> None:
+    """캐시 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제한다."""
+    entries = []
+    total = 0
+    try:
+        with os.scandir(_CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".pkl"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+    except FileNotFoundError:
+        return
+
+    if total <= _MAX_CACHE_BYTES:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= _MAX_CACHE_BYTES:
+            break
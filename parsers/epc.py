@@ -1,7 +1,14 @@
 """유럽(EPC) 법령 파서."""
 
 import re
-from parsers.base import BaseParser, _extract_article_title, _clean_english_article
+import numpy as np
+from parsers.base import (
+    BaseParser,
+    _extract_article_title,
+    _clean_english_article,
+    _apply_cleanup_rules,
+    _chunk_start,
+)
 
 
 class EpcParser(BaseParser):
@@ -48,74 +55,112 @@ class EpcParser(BaseParser):
         return -1
 
 
-def _clean_epc_annotations(text: str) -> str:
-    """EPC PDF의 여백 참조·개정 이력·페이지 머리글을 제거한다.
-
-    EPC PDF는 여백에 관련 조문/규칙 참조(Art. N, R. N)가 있는데,
-    텍스트 추출 시 본문에 섞여 들어온다.
-    """
+# EPC PDF 정제 규칙 (정규식, 치환문자열) — 순서대로 적용
+_EPC_ANNOTATION_RULES = [
     # 페이지 머리글/바닥글: "숫자\nEuropean Patent Convention..."
-    text = re.sub(r'\n\d{1,3}\nEuropean Patent Convention[^\n]*', '', text)
-    text = re.sub(r'\nEuropean Patent Convention[^\n]*\n\d{1,3}(?=\n|$)', '', text)
+    (re.compile(r'\n\d{1,3}\nEuropean Patent Convention[^\n]*'), ''),
+    (re.compile(r'\nEuropean Patent Convention[^\n]*\n\d{1,3}(?=\n|$)'), ''),
 
     # Article/Rule 줄 끝의 여백 참조: "Article 16 Art. 15" → "Article 16"
-    text = re.sub(
+    (re.compile(
         r'^((?:Article|Rule)\s+\d+[A-Za-z]*)\s+(?:Art\.|R\.)\s*[\d,\s\-a-zA-Z]+$',
-        r'\1', text, flags=re.MULTILINE
-    )
+        re.MULTILINE
+    ), r'\1'),
 
     # 단독 여백 참조 줄: "Art. 15, 92" 또는 "R. 11, 61-65" (줄 전체)
-    text = re.sub(r'(?m)^(?:Art\.|R\.)\s*[\d,\s\-a-zA-Z]{1,30}$', '', text)
+    (re.compile(r'(?m)^(?:Art\.|R\.)\s*[\d,\s\-a-zA-Z]{1,30}$'), ''),
 
     # 여백 참조 연속 줄 (줄바꿈된 참조 번호): "12d, 97, 98" 또는 "134a"
     # 숫자와 콤마가 주인 짧은 줄만 제거 (Article/Rule/Section 등은 보호)
-    text = re.sub(
-        r'(?m)^(?!Article|Rule|Section|The |A |An |In |No |Any )[\d][,\s\d\-a-zA-Z]{0,19}$(?=\n(?:\(|[A-Z][a-z]))',
-        '', text
-    )
+    (re.compile(
+        r'(?m)^(?!Article|Rule|Section|The |A |An |In |No |Any )[\d][,\s\d\-a-zA-Z]{0,19}$(?=\n(?:\(|[A-Z][a-z]))'
+    ), ''),
 
     # 제목 줄 끝의 여백 참조: "Receiving Section R. 10, 11" → "Receiving Section"
     # "Boards of Appeal R. 12a, 12b, 12c," 처럼 알파벳 포함 참조도 처리
     # 주의: \s 대신 [ ] 사용 (개행 매칭 방지)
-    text = re.sub(r'(?m)^([A-Z][a-zA-Z ]+?)[ ]+R\.[ ]*[\d, \-a-zA-Z]+[, ]*$', r'\1', text)
+    (re.compile(r'(?m)^([A-Z][a-zA-Z ]+?)[ ]+R\.[ ]*[\d, \-a-zA-Z]+[, ]*$'), r'\1'),
 
     # 제목 줄 끝의 참조 번호 잔여: "Legal Division 134a" → "Legal Division"
     # "Enlarged Board of Appeal 112a" → "Enlarged Board of Appeal"
-    text = re.sub(r'(?m)^([A-Z][a-zA-Z ]+?)[ ]+(\d+[a-z])$', r'\1', text)
+    (re.compile(r'(?m)^([A-Z][a-zA-Z ]+?)[ ]+(\d+[a-z])$'), r'\1'),
 
     # 본문 줄 끝의 참조 번호: "shall be responsible for: 12d, 13, 109"
-    text = re.sub(r'(?m)((?:for|of|under|to):?[ ]*)(\d+[a-z]?(?:,[ ]*\d+[a-z]?)*)[ ]*$', r'\1', text)
+    (re.compile(r'(?m)((?:for|of|under|to):?[ ]*)(\d+[a-z]?(?:,[ ]*\d+[a-z]?)*)[ ]*$'), r'\1'),
 
     # "See opinion(s)/decision(s) of..." 줄 제거
-    text = re.sub(r'(?m)^See opinions?(?:/decisions?)? of[^\n]*$', '', text)
+    (re.compile(r'(?m)^See opinions?(?:/decisions?)? of[^\n]*$'), ''),
 
     # 개정 이력 줄 제거: "Amended by...", "Inserted by...", "Title amended by..." 등
-    text = re.sub(r'(?m)^(?:(?:Title )?[Aa]mended|[Ii]nserted|[Dd]eleted|See decision|See decisions) (?:by |of )[^\n]*$', '', text)
+    (re.compile(r'(?m)^(?:(?:Title )?[Aa]mended|[Ii]nserted|[Dd]eleted|See decision|See decisions) (?:by |of )[^\n]*$'), ''),
 
     # 연속 빈 줄 정리
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    (re.compile(r'\n{3,}'), '\n\n'),
+]
+
+# ══════════════════════════════════════════════════════════════
+# 조문 분리·항 파싱 패턴 (모듈 로드 시 한 번만 컴파일)
+# ══════════════════════════════════════════════════════════════
+
+# 줄 시작의 조문 머리: "Article 52", "Rule 1", "Section 3a" ...
+_ENGLISH_ARTICLE_PATTERN = re.compile(
+    r"(?:^|\n)"
+    r"((?:Article|Section|Rule|Regulation)\s+\d+[A-Za-z]*)\b",
+    re.IGNORECASE,
+)
+_ARTICLE_NUMBER_PATTERN = re.compile(r"\d+")
+
+# 조문 본문에 섞인 편/장/절 제목.
+# 줄 시작 제목(Part/Chapter/Section)은 줄머리 단어가 서로 배타적이므로
+# 한 번의 교대(alternation) 패턴으로 지워도 순차 적용과 결과가 같다.
+_HIERARCHY_HEADING_LINE_PATTERN = re.compile(
+    r"^(?:(?:PART|Part)\s+[IVX]+|(?:CHAPTER|Chapter)\s+[IVX0-9]+|(?:SECTION|Section)\s+[IVX]+)"
+    r"[^\n]*\n?",
+    re.MULTILINE | re.IGNORECASE,
+)
+_HIERARCHY_HEADING_INLINE_PATTERN = re.compile(
+    r"\n(?:(?:PART|Part)\s+[IVX]+|(?:CHAPTER|Chapter)\s+[IVX0-9]+|(?:SECTION|Section)\s+[IVX]+)"
+    r"[^\n]*",
+    re.IGNORECASE,
+)
+_DELETED_MARK_PATTERN = re.compile(r"\(deleted\)|\(repealed\)", re.IGNORECASE)
+
+# 항 (1) / 호 (a) (i, v, x 제외) / 목 (i), (ii) ...
+_EN_PARAGRAPH_PATTERN = re.compile(r"(?:^|\n)\s*\((\d+)\)\s+")
+_EN_ITEM_PATTERN = re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+")
+_EN_SUBITEM_PATTERN = re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+")
+_MEANS_PATTERN = re.compile(r'\bmeans\b')
+
+
+def _clean_epc_annotations(text: str) -> str:
+    """EPC PDF의 여백 참조·개정 이력·페이지 머리글을 제거한다.
+
+    EPC PDF는 여백에 관련 조문/규칙 참조(Art. N, R. N)가 있는데,
+    텍스트 추출 시 본문에 섞여 들어온다.
+    """
+    text, _ = _apply_cleanup_rules(text, _EPC_ANNOTATION_RULES)
     return text
 
 
-def _split_english(text: str) -> list[dict]:
+def _split_english(text: str, offsets: np.ndarray = None) -> list[dict]:
     """영문 법령을 조문 단위로 분리한다.
 
     줄 시작에 오는 'Article N' 만 조문 시작으로 인식한다.
     - 본문 중간의 참조("pursuant to Article 174")는 무시한다.
     - 분리 후 본문이 짧은 항목(목차·참조표 등)은 제거한다.
     - 같은 Article 번호가 여러 번 나오면 가장 긴 본문을 유지한다.
+
+    각 조문에는 원문 기준 시작 위치("start")를 기록한다.
+    offsets는 호출 측에서 text를 미리 정제한 경우의 문자별 원문 위치 배열이다.
     """
+    if offsets is None:
+        offsets = np.arange(len(text))
+
     # EPC 여백 주석 제거 (European Patent Convention 포함 시)
     if "European Patent Convention" in text:
-        text = _clean_epc_annotations(text)
+        text, offsets = _apply_cleanup_rules(text, _EPC_ANNOTATION_RULES, offsets)
 
-    pattern = re.compile(
-        r"(?:^|\n)"
-        r"((?:Article|Section|Rule|Regulation)\s+\d+[A-Za-z]*)\b",
-        re.IGNORECASE,
-    )
-
-    candidates = list(pattern.finditer(text))
+    candidates = list(_ENGLISH_ARTICLE_PATTERN.finditer(text))
     if not candidates:
         return [{"id": "전문", "text": text.strip()}] if text.strip() else []
 
@@ -132,32 +177,25 @@ def _split_english(text: str) -> list[dict]:
         article_id = match.group(1).strip()
 
         # 비정상 ID 필터 (PDF 줄바꿈으로 숫자가 합쳐진 경우: Article 169196 등)
-        num_match = re.search(r"\d+", article_id)
+        num_match = _ARTICLE_NUMBER_PATTERN.search(article_id)
         if num_match and len(num_match.group()) > 4:
             continue
 
-        raw_articles.append({"id": article_id, "text": chunk})
+        raw_articles.append({
+            "id": article_id,
+            "text": chunk,
+            "start": _chunk_start(text, start, end, offsets),
+        })
 
     # 2차: 조문 내용에서 편/장/절 제목 제거
-    hierarchy_patterns = [
-        re.compile(r"^(?:PART|Part)\s+[IVX]+[^\n]*\n?", re.MULTILINE | re.IGNORECASE),
-        re.compile(r"^(?:CHAPTER|Chapter)\s+[IVX0-9]+[^\n]*\n?", re.MULTILINE | re.IGNORECASE),
-        re.compile(r"^(?:SECTION|Section)\s+[IVX]+[^\n]*\n?", re.MULTILINE | re.IGNORECASE),
-        re.compile(r"\n(?:PART|Part)\s+[IVX]+[^\n]*", re.IGNORECASE),
-        re.compile(r"\n(?:CHAPTER|Chapter)\s+[IVX0-9]+[^\n]*", re.IGNORECASE),
-        re.compile(r"\n(?:SECTION|Section)\s+[IVX]+[^\n]*", re.IGNORECASE),
-    ]
-
     for a in raw_articles:
-        cleaned_text = a["text"]
-        for pattern in hierarchy_patterns:
-            cleaned_text = pattern.sub("", cleaned_text)
-        cleaned_text = cleaned_text.strip()
-        a["text"] = cleaned_text
+        cleaned_text = _HIERARCHY_HEADING_LINE_PATTERN.sub("", a["text"])
+        cleaned_text = _HIERARCHY_HEADING_INLINE_PATTERN.sub("", cleaned_text)
+        a["text"] = cleaned_text.strip()
 
     # 3차: 삭제 조문 감지 — 본문에 (deleted) / (repealed) 포함 시 표시
     for a in raw_articles:
-        if re.search(r"\(deleted\)|\(repealed\)", a["text"], re.IGNORECASE):
+        if _DELETED_MARK_PATTERN.search(a["text"]):
             a["deleted"] = True
 
     # 4차: 같은 ID 중복 시 가장 긴 본문만 유지 (TOC < 본문이므로 자동 제거)
@@ -299,15 +337,14 @@ def _parse_paragraphs_english(text: str) -> list[dict]:
     results = []
 
     # Paragraph: (1), (2)...
-    para_pattern = re.compile(r"(?:^|\n)\s*\((\d+)\)\s+")
-    paragraphs = list(para_pattern.finditer(text))
+    paragraphs = list(_EN_PARAGRAPH_PATTERN.finditer(text))
 
     if not paragraphs:
         return []
 
     # 정의 조항 감지
     def _is_definition_paragraph(para_text: str) -> bool:
-        means_count = len(re.findall(r'\bmeans\b', para_text))
+        means_count = len(_MEANS_PATTERN.findall(para_text))
         if means_count >= 3:
             return True
         if "unless the context otherwise requires" in para_text.lower():
@@ -332,8 +369,7 @@ def _parse_paragraphs_english(text: str) -> list[dict]:
             continue
 
         # Item: (a), (b), (c)... (i, v, x 제외 - 로마 숫자와 구분)
-        item_pattern = re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+")
-        items = list(item_pattern.finditer(para_text))
+        items = list(_EN_ITEM_PATTERN.finditer(para_text))
 
         if not items:
             results.append({
@@ -362,8 +398,7 @@ def _parse_paragraphs_english(text: str) -> list[dict]:
                 item_text = para_text[item_start:item_end].strip()
 
                 # Subitem: (i), (ii), (iii), (iv)... (로마 숫자)
-                subitem_pattern = re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+")
-                subitems = list(subitem_pattern.finditer(item_text))
+                subitems = list(_EN_SUBITEM_PATTERN.finditer(item_text))
 
                 if not subitems:
                     results.append({
@@ -5,6 +5,7 @@ import xml.etree.ElementTree as ET
 from html import unescape
 import pandas as pd
 from parsers.base import BaseParser
+from parsers.cache import make_cache_key, load_cache, save_cache
 
 
 class GermanyParser(BaseParser):
@@ -32,11 +33,12 @@ class GermanyParser(BaseParser):
         return []
 
 
-def parse_german_xml(file_path: str) -> list[dict]:
+def parse_german_xml(file_path: str, use_cache: bool = True) -> list[dict]:
     """독일 법령 XML 파일을 파싱하여 조문 목록을 반환한다.
 
     Args:
         file_path: XML 파일 경로
+        use_cache: True이면 파일 내용 해시로 디스크 캐시를 사용한다.
 
     Returns:
         조문 정보 딕셔너리 리스트
@@ -47,6 +49,20 @@ def parse_german_xml(file_path: str) -> list[dict]:
         - content: 조문 내용 (HTML 태그 제거됨)
         - paragraphs: 항 목록 (각 항은 {'num': 번호, 'text': 내용, 'items': [호 목록]})
     """
+    if not use_cache:
+        return _parse_german_xml_uncached(file_path)
+
+    cache_key = make_cache_key("xml", file_path)
+    cached = load_cache(cache_key)
+    if cached is not None:
+        return cached
+    articles = _parse_german_xml_uncached(file_path)
+    save_cache(cache_key, articles)
+    return articles
+
+
+def _parse_german_xml_uncached(file_path: str) -> list[dict]:
+    """캐시 없이 독일 법령 XML 파일을 파싱한다."""
     tree = ET.parse(file_path)
     root = tree.getroot()
 
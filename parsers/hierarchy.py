@@ -0,0 +1,57 @@
+"""편/장/절 계층 색인.
+
+계층 목록(type/title/start_pos)을 위치순으로 정렬하고, 경계마다 그 시점의
+편·장·절 상태를 미리 계산해 둔다. 임의 위치의 계층은 bisect로 O(log n)에 찾는다.
+PDF 파서(parsers), HTML 파서(html_parser), 일본 파서(japan_parser)가 함께 쓴다.
+일본 파서는 문자 위치 대신 조문 번호를 정수로 바꾼 값을 start_pos로 넣어 쓴다.
+"""
+
+from bisect import bisect_right
+
+
+class HierarchyIndex:
+    """위치 → (편, 장, 절) 조회용 색인.
+
+    상태 전이는 기존 선형 탐색과 같다:
+    - part: 편 갱신, 장·절 초기화
+    - chapter: 장 갱신, 절 초기화
+    - section: 절 갱신
+    같은 위치의 경계는 목록 순서대로 적용된다 (안정 정렬).
+    """
+
+    def __init__(self, hierarchy: list[dict]):
+        entries = sorted(hierarchy, key=lambda h: h["start_pos"])
+        self._entries = entries
+        self._starts = [h["start_pos"] for h in entries]
+        self._states = []
+
+        part = chapter = section = ""
+        for h in entries:
+            kind = h.get("type")
+            if kind == "part":
+                part = h["title"]
+                chapter = ""
+                section = ""
+            elif kind == "chapter":
+                chapter = h["title"]
+                section = ""
+            elif kind == "section":
+                section = h["title"]
+            self._states.append((part, chapter, section))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _state_at(self, position: int):
+        i = bisect_right(self._starts, position) - 1
+        return self._states[i] if i >= 0 else None
+
+    def at(self, position: int) -> tuple[str, str, str]:
+        """position 시점의 (편, 장, 절)을 반환한다. 첫 경계 이전이면 빈 문자열."""
+        state = self._state_at(position)
+        return state if state else ("", "", "")
+
+    def entry_at(self, position: int) -> dict | None:
+        """position 이전의 마지막 계층 항목(원래 dict)을 반환한다. 첫 경계 이전이면 None."""
+        i = bisect_right(self._starts, position) - 1
+        return self._entries[i] if i >= 0 else None
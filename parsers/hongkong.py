@@ -1,7 +1,14 @@
 """홍콩 법령 파서."""
 
 import re
-from parsers.base import BaseParser, _extract_article_title, _clean_english_article
+import numpy as np
+from parsers.base import (
+    BaseParser,
+    _extract_article_title,
+    _clean_english_article,
+    _apply_cleanup_rules,
+    _chunk_start,
+)
 from parsers.epc import _split_english, _parse_paragraphs_english
 
 
@@ -39,6 +46,62 @@ class HongkongParser(BaseParser):
         return -1
 
 
+# 홍콩 법령 PDF 페이지 머리글/바닥글 제거 규칙 (정규식, 치환문자열) — 순서대로 적용
+#
+# 하나의 교대 패턴으로 합치지 않는다. 각 규칙이 뒤따르는 줄바꿈까지 소비하고
+# "\n"으로 되돌리므로, 합치면 앞 머리글 매칭이 다음 머리글의 선행 줄바꿈을
+# 먹어 버리고, 첫 규칙의 연속 줄("... Section N ...")이 넷째 규칙과 겹친다.
+_HK_PAGE_HEADER_RULES = [
+    (re.compile(
+        r"\n(?:Patents Ordinance|Registered Designs Ordinance|Cap\.\s*\d+)[^\n]*(?:\n[^\n]{0,60}(?:Cap\.\s*\d+|Section\s+\d+)[^\n]*)*"
+    ), "\n"),
+    (re.compile(
+        r"\n\s*(?:Part|Division)\s+\d+[A-Z]?\s+\d+[A-Z]?-\d+\s*(?:\n|$)"
+    ), "\n"),
+    (re.compile(
+        r"\n\s*(?:Part|Division)\s+\d+[A-Z]?[—\-–].*?\d+-\d+\s*(?:\n|$)"
+    ), "\n"),
+    (re.compile(
+        r"\n\s*Section\s+\d+[A-Z]*\s+Cap\.\s*\d+\s*(?:\n|$)"
+    ), "\n"),
+]
+
+# 조문 머리: "14. Filing date" 또는 범위 조문 "14-16. ..."
+_HK_ARTICLE_PATTERN = re.compile(
+    r"(?:^|\n)"
+    r"(\d+[A-Z]?(?:-\d+[A-Z]?)?)\.\s+"
+    r"([A-Z(][^\n]+)"
+    r"(?=\n|$)"
+)
+_HK_SCHEDULE_PATTERN = re.compile(r'\nSchedule\s+\d+', re.IGNORECASE)
+
+# 제목 끝의 페이지 번호·여백 참조 — 순서대로 적용 (각 단계 사이에 strip)
+_HK_TITLE_CLEANUP_PATTERNS = [
+    re.compile(r'\s+\d{1,3}-\d{1,3}$'),
+    re.compile(r'\s+\d{1,3}$'),
+    re.compile(r'\s+R\.\s*[\d\-,\s]*$'),
+    re.compile(r'\s+Art\.\s*[\d\-,\s]*$', re.IGNORECASE),
+]
+
+# 본문 끝에 붙은 Part/Division 헤더 블록
+_HK_TRAILING_HEADER_PATTERN = re.compile(
+    r"\n(?:Last updated date\n[^\n]*\n)?"
+    r"(?:(?:Part|Division)\s+\d+[A-Z]?[—\-–][^\n]*\n)*"
+    r"(?:Part|Division)\s+\d+[A-Z]?\n"
+    r"(?:[^\n]+\n)*"
+    r"(?:\([^\n]+\)\n?)*"
+    r"(?:(?:Part|Division)\s+\d+[A-Z]?[—\-–][^\n]*\n?)*"
+    r"\s*$"
+)
+# 본문 끝의 독립 Division 헤더
+_HK_TRAILING_DIVISION_PATTERN = re.compile(
+    r"\n(?:Division)\s+\d+[A-Z]?[—\-–][^\n]+"
+    r"(?:\n[a-zA-Z][^\n(][^\n]*)?"
+    r"(?:\n\([^\n]+\))*"
+    r"\s*$"
+)
+
+
 def _split_hk_english(text: str) -> list[dict]:
     """홍콩 법령을 조문 단위로 분리한다.
 
@@ -48,37 +111,16 @@ def _split_hk_english(text: str) -> list[dict]:
 
     PDF에는 목차(TOC)와 본문에 같은 패턴이 있으므로,
     같은 조문 번호가 중복될 때 가장 긴 본문을 유지한다.
+    각 조문에는 원문 기준 시작 위치("start")를 기록한다.
     """
-    # 페이지 머리글/바닥글 제거
-    text = re.sub(
-        r"\n(?:Patents Ordinance|Registered Designs Ordinance|Cap\.\s*\d+)[^\n]*(?:\n[^\n]{0,60}(?:Cap\.\s*\d+|Section\s+\d+)[^\n]*)*",
-        "\n", text
-    )
-    text = re.sub(
-        r"\n\s*(?:Part|Division)\s+\d+[A-Z]?\s+\d+[A-Z]?-\d+\s*(?:\n|$)",
-        "\n", text
-    )
-    text = re.sub(
-        r"\n\s*(?:Part|Division)\s+\d+[A-Z]?[—\-–].*?\d+-\d+\s*(?:\n|$)",
-        "\n", text
-    )
-    text = re.sub(
-        r"\n\s*Section\s+\d+[A-Z]*\s+Cap\.\s*\d+\s*(?:\n|$)",
-        "\n", text
-    )
+    # 페이지 머리글/바닥글 제거 (원문 위치 추적)
+    text, offsets = _apply_cleanup_rules(text, _HK_PAGE_HEADER_RULES, np.arange(len(text)))
 
     # 조문 패턴: 숫자. 제목 또는 숫자-숫자. 제목 (범위 조문)
-    pattern = re.compile(
-        r"(?:^|\n)"
-        r"(\d+[A-Z]?(?:-\d+[A-Z]?)?)\.\s+"
-        r"([A-Z(][^\n]+)"
-        r"(?=\n|$)"
-    )
-
-    matches = list(pattern.finditer(text))
+    matches = list(_HK_ARTICLE_PATTERN.finditer(text))
 
     if not matches:
-        return _split_english(text)
+        return _split_english(text, offsets)
 
     # 1차: 모든 매칭으로 분리
     raw_articles = []
@@ -91,7 +133,7 @@ def _split_hk_english(text: str) -> list[dict]:
 
         # 마지막 조문에서 Schedule 영역 제거
         if i == len(matches) - 1:
-            schedule_match = re.search(r'\nSchedule\s+\d+', chunk, re.IGNORECASE)
+            schedule_match = _HK_SCHEDULE_PATTERN.search(chunk)
             if schedule_match:
                 chunk = chunk[:schedule_match.start()].strip()
 
@@ -105,38 +147,22 @@ def _split_hk_english(text: str) -> list[dict]:
         if '\n' in title:
             title = title.split('\n')[0].strip()
 
-        title = re.sub(r'\s+\d{1,3}-\d{1,3}$', '', title).strip()
-        title = re.sub(r'\s+\d{1,3}$', '', title).strip()
-        title = re.sub(r'\s+R\.\s*[\d\-,\s]*$', '', title).strip()
-        title = re.sub(r'\s+Art\.\s*[\d\-,\s]*$', '', title, flags=re.IGNORECASE).strip()
+        for title_pattern in _HK_TITLE_CLEANUP_PATTERNS:
+            title = title_pattern.sub('', title).strip()
 
         # 본문 끝에 붙은 Part/Division 헤더 블록 제거
-        trail_match = re.search(
-            r"\n(?:Last updated date\n[^\n]*\n)?"
-            r"(?:(?:Part|Division)\s+\d+[A-Z]?[—\-–][^\n]*\n)*"
-            r"(?:Part|Division)\s+\d+[A-Z]?\n"
-            r"(?:[^\n]+\n)*"
-            r"(?:\([^\n]+\)\n?)*"
-            r"(?:(?:Part|Division)\s+\d+[A-Z]?[—\-–][^\n]*\n?)*"
-            r"\s*$",
-            chunk
-        )
+        trail_match = _HK_TRAILING_HEADER_PATTERN.search(chunk)
         if trail_match:
             chunk = chunk[:trail_match.start()].strip()
 
         # 독립 Division 헤더 제거
-        chunk = re.sub(
-            r"\n(?:Division)\s+\d+[A-Z]?[—\-–][^\n]+"
-            r"(?:\n[a-zA-Z][^\n(][^\n]*)?"
-            r"(?:\n\([^\n]+\))*"
-            r"\s*$",
-            "", chunk
-        ).strip()
+        chunk = _HK_TRAILING_DIVISION_PATTERN.sub("", chunk).strip()
 
         raw_articles.append({
             "id": num,
             "text": chunk,
-            "title": title
+            "title": title,
+            "start": _chunk_start(text, start, end, offsets),
         })
 
     # 2차: 같은 ID 중복 시 가장 긴 본문만 유지 (목차 < 본문)
@@ -1,7 +1,7 @@
 """한국 법령 파서."""
 
 import re
-from parsers.base import BaseParser, _extract_article_title
+from parsers.base import BaseParser, _extract_article_title, _chunk_start
 
 
 class KoreaParser(BaseParser):
@@ -37,20 +37,48 @@ class KoreaParser(BaseParser):
         return -1
 
 
+# ══════════════════════════════════════════════════════════════
+# 조문 분리·항 파싱 패턴 (모듈 로드 시 한 번만 컴파일)
+# ══════════════════════════════════════════════════════════════
+
+# 줄 시작 + 제N조(의N) + 괄호제목 또는 삭제
+_KO_ARTICLE_PATTERN = re.compile(
+    r"(?:^|\n)"
+    r"(제\s*\d+\s*조(?:의\s*\d+)?)"
+    r"(?:\s*\(|삭제)"
+)
+_KO_DELETED_ARTICLE_PATTERN = re.compile(r"제\s*\d+\s*조(?:의\s*\d+)?\s*삭제")
+
+# 조문 헤더: 제N조(의N) + (제목) + <개정 ...> 태그
+_KO_ARTICLE_NUMBER_PATTERN = re.compile(r"(\d+(?:의\s*\d+)?)")
+_KO_ARTICLE_HEADER_PATTERN = re.compile(
+    r"^제\s*\d+\s*조(?:의\s*\d+)?"   # 제N조(의N)
+    r"\s*"
+    r"(?:\(([^)]+)\))?"               # (제목) — 선택
+    r"\s*"
+    r"(?:<[^>]*>\s*)*"                # <개정 ...> 태그 — 선택
+)
+_KO_AMENDMENT_TAG_PATTERN = re.compile(r"\s*<[^>]+>")
+
+# 항 ① / 호 1. 제1호 / 목 가. 가목 / 세목 1) 가)
+_KO_PARAGRAPH_PATTERN = re.compile(r"[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳]")
+_KO_ITEM_PATTERN = re.compile(r"(?:^|\n)\s*(?:제\s*)?(\d{1,3})(?:\.\s+|호\s*)")
+_KO_ITEM_REFERENCE_SUFFIX_PATTERN = re.compile(
+    r'^\s*(?:부터|까지|에|의|를|을|와|과|로|으로|이|가|는|만|도)'
+)
+_KO_SUBITEM_PATTERN = re.compile(r"(?:^|\n)\s*([가-힣])(?:\.\s+|목\s*)")
+_KO_SUBSUBITEM_PATTERN = re.compile(r"(?:^|\n)\s*(?:(\d{1,2})|([가-힣]))\)\s+")
+
+
 def _split_korean(text: str) -> list[dict]:
     """한국 법령을 조문 단위로 분리한다.
 
     줄 시작에 '제N조' 가 오고 바로 뒤에 괄호 제목 '(목적)' 또는 '삭제' 등이
     따라오는 경우만 실제 조문 시작으로 인식한다.
     본문 중간의 참조("제55조제1항에 따른")는 무시한다.
+    각 조문에는 원문 기준 시작 위치("start")를 기록한다.
     """
-    # 줄 시작 + 제N조(의N) + 괄호제목 또는 삭제
-    pattern = re.compile(
-        r"(?:^|\n)"
-        r"(제\s*\d+\s*조(?:의\s*\d+)?)"
-        r"(?:\s*\(|삭제)"
-    )
-    matches = list(pattern.finditer(text))
+    matches = list(_KO_ARTICLE_PATTERN.finditer(text))
 
     articles = []
 
@@ -75,10 +103,14 @@ def _split_korean(text: str) -> list[dict]:
 
         article_id = match.group(1).strip()
         # 삭제 조문 감지
-        if re.match(r"제\s*\d+\s*조(?:의\s*\d+)?\s*삭제", chunk):
+        if _KO_DELETED_ARTICLE_PATTERN.match(chunk):
             article_id = article_id + " (삭제)"
             chunk = "(삭제)"
-        articles.append({"id": article_id, "text": chunk})
+        articles.append({
+            "id": article_id,
+            "text": chunk,
+            "start": _chunk_start(text, start, end),
+        })
 
     return articles
 
@@ -128,7 +160,7 @@ def _clean_korean_article(article_id: str, article_text: str) -> tuple[str, str,
     """
     # 삭제 조문
     if "(삭제)" in article_id or article_text == "(삭제)":
-        num_match = re.search(r"(\d+(?:의\s*\d+)?)", article_id)
+        num_match = _KO_ARTICLE_NUMBER_PATTERN.search(article_id)
         num = num_match.group(1).replace(" ", "") if num_match else article_id
         return num, "(삭제)", "(삭제)"
 
@@ -136,14 +168,7 @@ def _clean_korean_article(article_id: str, article_text: str) -> tuple[str, str,
     clean_id = article_id.replace("제", "").replace("조", "").replace(" ", "")
 
     # 원문에서 제N조(제목) 헤더 분리
-    header_pattern = re.compile(
-        r"^제\s*\d+\s*조(?:의\s*\d+)?"   # 제N조(의N)
-        r"\s*"
-        r"(?:\(([^)]+)\))?"               # (제목) — 선택
-        r"\s*"
-        r"(?:<[^>]*>\s*)*"                # <개정 ...> 태그 — 선택
-    )
-    match = header_pattern.match(article_text)
+    match = _KO_ARTICLE_HEADER_PATTERN.match(article_text)
 
     title = ""
     clean_text = article_text
@@ -151,7 +176,7 @@ def _clean_korean_article(article_id: str, article_text: str) -> tuple[str, str,
     if match:
         title = match.group(1) or ""
         # 제목에서 <개정...> 태그 제거
-        title = re.sub(r"\s*<[^>]+>", "", title).strip()
+        title = _KO_AMENDMENT_TAG_PATTERN.sub("", title).strip()
         # 원문에서 헤더 부분 제거
         clean_text = article_text[match.end():].strip()
 
@@ -167,8 +192,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
     results = []
 
     # ① 항 패턴
-    para_pattern = re.compile(r"[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳]")
-    paragraphs = list(para_pattern.finditer(text))
+    paragraphs = list(_KO_PARAGRAPH_PATTERN.finditer(text))
 
     # 항이 없는 경우 전체를 하나의 항으로 간주
     if not paragraphs:
@@ -188,8 +212,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
         para_text = para_info["text"]
 
         # 호(1., 2., 3... 또는 제1호, 제2호...) 파싱
-        item_pattern = re.compile(r"(?:^|\n)\s*(?:제\s*)?(\d{1,3})(?:\.\s+|호\s*)")
-        items_raw = list(item_pattern.finditer(para_text))
+        items_raw = list(_KO_ITEM_PATTERN.finditer(para_text))
 
         # 괄호 안의 "제N호" 및 참조 "제N호부터/까지/에..." 제외
         items = []
@@ -199,7 +222,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
 
             # 뒤에 오는 텍스트 확인 (참조 조사 체크)
             suffix = para_text[end:min(end+10, len(para_text))]
-            if re.match(r'^\s*(?:부터|까지|에|의|를|을|와|과|로|으로|이|가|는|만|도)', suffix):
+            if _KO_ITEM_REFERENCE_SUFFIX_PATTERN.match(suffix):
                 continue
 
             # 앞 20자 확인 (괄호 안 제외)
@@ -225,8 +248,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
                 item_text = para_text[item_start:item_end].strip()
 
                 # 목(가., 나., 다... 또는 가목, 나목...) 파싱
-                subitem_pattern = re.compile(r"(?:^|\n)\s*([가-힣])(?:\.\s+|목\s*)")
-                subitems = list(subitem_pattern.finditer(item_text))
+                subitems = list(_KO_SUBITEM_PATTERN.finditer(item_text))
 
                 if not subitems:
                     results.append({
@@ -244,8 +266,7 @@ def _parse_paragraphs_korean(text: str) -> list[dict]:
                         subitem_text = item_text[subitem_start:subitem_end].strip()
 
                         # 세목(1), 2), 3)... 또는 가), 나), 다)...) 파싱
-                        subsubitem_pattern = re.compile(r"(?:^|\n)\s*(?:(\d{1,2})|([가-힣]))\)\s+")
-                        subsubitems = list(subsubitem_pattern.finditer(subitem_text))
+                        subsubitems = list(_KO_SUBSUBITEM_PATTERN.finditer(subitem_text))
 
                         if not subsubitems:
                             results.append({
@@ -1,7 +1,14 @@
 """뉴질랜드 법령 파서."""
 
 import re
-from parsers.base import BaseParser, _extract_article_title, _clean_english_article
+import numpy as np
+from parsers.base import (
+    BaseParser,
+    _extract_article_title,
+    _clean_english_article,
+    _apply_cleanup_rules,
+    _chunk_start,
+)
 from parsers.epc import _parse_paragraphs_english
 
 
@@ -30,6 +37,31 @@ class NewzealandParser(BaseParser):
         return _clean_english_article(article_id, text, title)
 
 
+# 뉴질랜드 법령 PDF 정제 규칙 (정규식, 치환문자열) — 순서대로 적용
+_NZ_CLEANUP_RULES = [
+    # 페이지 머리글/바닥글
+    (re.compile(r'\n\d{1,3}\nVersion as at\n[^\n]+(?:Act|Ordinance)[^\n]*'), ''),
+    (re.compile(r'\n[^\n]+(?:Act|Ordinance)[^\n]*\nVersion as at\n[^\n]*'), ''),
+    # 수정 이력
+    (re.compile(r'\nSection\s+\d+[A-Z]?\([^)]+\):[^\n]+'), ''),
+]
+
+# 본문 범위: 목차 뒤의 두 번째 "Part 1" 부터 부칙(Schedule) 전까지
+_NZ_PART1_PATTERN = re.compile(r'\nPart\s+1\n')
+_NZ_SCHEDULE_1AA_PATTERN = re.compile(r'\nSchedule\s+1AA\n')
+_NZ_SCHEDULE_PATTERN = re.compile(r'\nSchedule\n')
+
+# 조문 머리: "1 Short Title and commencement"
+_NZ_ARTICLE_PATTERN = re.compile(
+    r"(?:^|\n)"
+    r"(\d+[A-Z]?)\s+"
+    r"([A-Z][a-zA-Z\s,]+(?:of|for|and|in|to|the|under|with|from)?[^\n]*)"
+    r"(?=\n)"
+)
+_NZ_TITLE_PAGE_NUMBER_PATTERN = re.compile(r'\s+\d{1,3}$')
+_NZ_NUMBER_PATTERN = re.compile(r"\d+")
+
+
 def _split_nz_english(text: str) -> list[dict]:
     """뉴질랜드 법령을 조문 단위로 분리한다.
 
@@ -37,45 +69,36 @@ def _split_nz_english(text: str) -> list[dict]:
         '1 Short Title and commencement'
         '2 Interpretation'
     줄 시작에 숫자 + 제목이 오는 패턴을 매칭한다.
+    각 조문에는 원문 기준 시작 위치("start")를 기록한다.
     """
+    offsets = np.arange(len(text))
+
     # 본문 영역만 추출 (목차/부칙 제거)
-    part1_matches = list(re.finditer(r'\nPart\s+1\n', text))
+    part1_matches = list(_NZ_PART1_PATTERN.finditer(text))
     if len(part1_matches) >= 2:
-        text = text[part1_matches[1].start():]
+        body_start = part1_matches[1].start()
     elif part1_matches:
-        text = text[part1_matches[0].start():]
+        body_start = part1_matches[0].start()
+    else:
+        body_start = 0
+    text = text[body_start:]
+    offsets = offsets[body_start:]
 
     # 부칙(Schedule) 영역 제거
-    schedule_match = re.search(r'\nSchedule\s+1AA\n', text)
+    schedule_match = _NZ_SCHEDULE_1AA_PATTERN.search(text)
     if schedule_match:
         text = text[:schedule_match.start()]
     else:
-        schedule_match = re.search(r'\nSchedule\n', text)
+        schedule_match = _NZ_SCHEDULE_PATTERN.search(text)
         if schedule_match:
             text = text[:schedule_match.start()]
+    offsets = offsets[:len(text)]
 
-    # 페이지 머리글/바닥글 제거
-    text = re.sub(
-        r'\n\d{1,3}\nVersion as at\n[^\n]+(?:Act|Ordinance)[^\n]*',
-        '', text
-    )
-    text = re.sub(
-        r'\n[^\n]+(?:Act|Ordinance)[^\n]*\nVersion as at\n[^\n]*',
-        '', text
-    )
-
-    # 수정 이력 제거
-    text = re.sub(r'\nSection\s+\d+[A-Z]?\([^)]+\):[^\n]+', '', text)
+    # 페이지 머리글/바닥글 제거, 수정 이력 제거
+    text, offsets = _apply_cleanup_rules(text, _NZ_CLEANUP_RULES, offsets)
 
     # 조문 패턴
-    pattern = re.compile(
-        r"(?:^|\n)"
-        r"(\d+[A-Z]?)\s+"
-        r"([A-Z][a-zA-Z\s,]+(?:of|for|and|in|to|the|under|with|from)?[^\n]*)"
-        r"(?=\n)"
-    )
-
-    candidates = list(pattern.finditer(text))
+    candidates = list(_NZ_ARTICLE_PATTERN.finditer(text))
     if not candidates:
         return [{"id": "전문", "text": text.strip()}] if text.strip() else []
 
@@ -97,7 +120,7 @@ def _split_nz_english(text: str) -> list[dict]:
 
         if len(title) < 3 or title.isdigit():
             continue
-        title = re.sub(r'\s+\d{1,3}$', '', title).strip()
+        title = _NZ_TITLE_PAGE_NUMBER_PATTERN.sub('', title).strip()
 
         if title.startswith(('Version', 'Page', 's ')):
             continue
@@ -106,7 +129,8 @@ def _split_nz_english(text: str) -> list[dict]:
             "id": num,
             "text": chunk,
             "title": title,
-            "_num": int(re.match(r"\d+", num).group())
+            "start": _chunk_start(text, start, end, offsets),
+            "_num": int(_NZ_NUMBER_PATTERN.match(num).group())
         })
 
     # 같은 ID 중복 시 가장 긴 본문만 유지
@@ -119,7 +143,7 @@ def _split_nz_english(text: str) -> list[dict]:
     MIN_CONTENT_LEN = 50
     filtered = {k: v for k, v in seen.items() if len(v["text"]) >= MIN_CONTENT_LEN}
 
-    sorted_ids = sorted(filtered.keys(), key=lambda x: int(re.search(r"\d+", x).group()))
+    sorted_ids = sorted(filtered.keys(), key=lambda x: int(_NZ_NUMBER_PATTERN.search(x).group()))
 
     articles = []
 
@@ -136,7 +160,8 @@ def _split_nz_english(text: str) -> list[dict]:
         articles.append({
             "id": entry["id"],
             "text": entry["text"],
-            "title": entry.get("title", "")
+            "title": entry.get("title", ""),
+            "start": entry["start"],
         })
 
     return articles
@@ -1,7 +1,7 @@
 """대만(중국어) 법령 파서."""
 
 import re
-from parsers.base import BaseParser, _extract_article_title
+from parsers.base import BaseParser, _extract_article_title, _chunk_start
 
 
 class TaiwanParser(BaseParser):
@@ -50,16 +50,20 @@ class TaiwanParser(BaseParser):
         return -1
 
 
+# 줄 시작의 조문 머리: "第1條", "第十條之1" (모듈 로드 시 한 번만 컴파일)
+_ZH_ARTICLE_PATTERN = re.compile(
+    r"(?:^|\n)"
+    r"(第\s*(?:\d+|[一二三四五六七八九十百千]+)\s*條(?:\s*之\s*\d+)?)"
+)
+
+
 def _split_chinese(text: str) -> list[dict]:
     """대만 한문(번체) 법령을 조문 단위로 분리한다.
 
     줄 시작에 '第N條' 가 오는 경우만 조문 시작으로 인식한다.
+    각 조문에는 원문 기준 시작 위치("start")를 기록한다.
     """
-    pattern = re.compile(
-        r"(?:^|\n)"
-        r"(第\s*(?:\d+|[一二三四五六七八九十百千]+)\s*條(?:\s*之\s*\d+)?)"
-    )
-    matches = list(pattern.finditer(text))
+    matches = list(_ZH_ARTICLE_PATTERN.finditer(text))
 
     articles = []
 
@@ -83,7 +87,11 @@ def _split_chinese(text: str) -> list[dict]:
             continue
 
         article_id = match.group(1).strip()
-        articles.append({"id": article_id, "text": chunk})
+        articles.append({
+            "id": article_id,
+            "text": chunk,
+            "start": _chunk_start(text, start, end),
+        })
 
     return articles
 
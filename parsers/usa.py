@@ -1,7 +1,15 @@
 """미국 법령(Westlaw RTF) 파서."""
 
 import re
-from parsers.base import BaseParser, parse_rtf, _extract_article_title, _clean_english_article
+import numpy as np
+from parsers.base import (
+    BaseParser,
+    parse_rtf,
+    _extract_article_title,
+    _clean_english_article,
+    _apply_cleanup_rules,
+    _chunk_start,
+)
 
 
 class UsaParser(BaseParser):
@@ -41,24 +49,52 @@ class UsaParser(BaseParser):
         return -1
 
 
+# Westlaw 메타데이터 제거 규칙 (정규식, 치환문자열) — 순서대로 적용
+#
+# 줄 단위 메타데이터(Notes of Decisions, End of Document, Currentness, KeyCite,
+# 인용 머리글 등)는 하나의 교대 패턴으로 합쳐 문서를 한 번만 훑는다.
+# 각 항목은 줄 시작에 고정되고 서로 다른 머리 문자열로 시작하므로 매칭이
+# 겹치지 않으며, 줄 내용을 지워도 다른 줄이 새로 줄 시작에 오지 않는다.
+# 순차 적용과의 차이는 인접한 메타데이터 줄 사이에 남는 빈 줄 수뿐인데,
+# 이는 마지막 연속 빈 줄 정리에서 같아진다 (문서 맨 앞/끝의 공백 제외).
+_US_METADATA_LINE_PATTERNS = [
+    r"Notes of Decisions\s*\(\d+\)\s*$",
+    r"End of Document\s*$",
+    r"©\s*20\d{2}\s+Thomson Reuters.*$",
+    r"Currentness\s*$",
+    r"Effective:.*$",
+    r"KeyCite\s.*$",
+    r"\d+\s+U\.?S\.?C\.?A\.?\s+§\s*\d+.*$",
+    r"\d+\s+USCA\s+§\s*\d+.*$",
+    r"Current through P\.L\..*$",
+    r"Refs & Annos\s*$",
+    r"Disposition Table\s*$",
+]
+
+_US_WESTLAW_METADATA_RULES = [
+    (re.compile(r"(?m)^CREDIT\(S\).*?(?=^§\s*\d+|\Z)", re.DOTALL | re.MULTILINE), ""),
+    (re.compile(r"(?m)^(?:" + "|".join(_US_METADATA_LINE_PATTERNS) + r")"), ""),
+    (re.compile(r"\n{3,}"), "\n\n"),
+]
+
+# 조문 머리: "§ 101. Inventions patentable"
+_US_ARTICLE_PATTERN = re.compile(
+    r"(?:^|\n)"
+    r"(§\s*\d+[a-zA-Z]?(?:-\d+[a-zA-Z]?)?)\.\s+"
+    r"([^\n]+)"
+)
+_US_TITLE_BRACKET_PATTERN = re.compile(r'\s+\[.*$')
+
+# 항 (a) (i, v, x 제외) / 호 (1) / 목 (A) / 세목 (i), (ii) ...
+_US_PARAGRAPH_PATTERN = re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+")
+_US_ITEM_PATTERN = re.compile(r"(?:^|\n)\s*\((\d+)\)\s+")
+_US_SUBITEM_PATTERN = re.compile(r"(?:^|\n)\s*\(([A-Z])\)\s+")
+_US_SUBSUBITEM_PATTERN = re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+")
+
+
 def _clean_us_westlaw_metadata(text: str) -> str:
     """Westlaw에서 다운로드한 미국법 RTF 텍스트에서 메타데이터를 제거한다."""
-    text = re.sub(
-        r"(?m)^CREDIT\(S\).*?(?=^§\s*\d+|\Z)",
-        "", text, flags=re.DOTALL | re.MULTILINE
-    )
-    text = re.sub(r"(?m)^Notes of Decisions\s*\(\d+\)\s*$", "", text)
-    text = re.sub(r"(?m)^End of Document\s*$", "", text)
-    text = re.sub(r"(?m)^©\s*20\d{2}\s+Thomson Reuters.*$", "", text)
-    text = re.sub(r"(?m)^Currentness\s*$", "", text)
-    text = re.sub(r"(?m)^Effective:.*$", "", text)
-    text = re.sub(r"(?m)^KeyCite\s.*$", "", text)
-    text = re.sub(r"(?m)^\d+\s+U\.?S\.?C\.?A\.?\s+§\s*\d+.*$", "", text)
-    text = re.sub(r"(?m)^\d+\s+USCA\s+§\s*\d+.*$", "", text)
-    text = re.sub(r"(?m)^Current through P\.L\..*$", "", text)
-    text = re.sub(r"(?m)^Refs & Annos\s*$", "", text)
-    text = re.sub(r"(?m)^Disposition Table\s*$", "", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text, _ = _apply_cleanup_rules(text, _US_WESTLAW_METADATA_RULES)
     return text
 
 
@@ -68,16 +104,13 @@ def _split_us_english(text: str) -> list[dict]:
     미국법은 § N. Title 형식의 조문 패턴을 사용한다.
     예: § 101. Inventions patentable
         § 102. Conditions for patentability; novelty
+    각 조문에는 원문 기준 시작 위치("start")를 기록한다.
     """
-    text = _clean_us_westlaw_metadata(text)
-
-    pattern = re.compile(
-        r"(?:^|\n)"
-        r"(§\s*\d+[a-zA-Z]?(?:-\d+[a-zA-Z]?)?)\.\s+"
-        r"([^\n]+)"
+    text, offsets = _apply_cleanup_rules(
+        text, _US_WESTLAW_METADATA_RULES, np.arange(len(text))
     )
 
-    candidates = list(pattern.finditer(text))
+    candidates = list(_US_ARTICLE_PATTERN.finditer(text))
     if not candidates:
         return [{"id": "전문", "text": text.strip()}] if text.strip() else []
 
@@ -94,12 +127,13 @@ def _split_us_english(text: str) -> list[dict]:
         raw_id = match.group(1).strip()
         article_num = raw_id.replace("§", "").strip()
         title = match.group(2).strip()
-        title = re.sub(r'\s+\[.*$', '', title).strip()
+        title = _US_TITLE_BRACKET_PATTERN.sub('', title).strip()
 
         raw_articles.append({
             "id": article_num,
             "text": chunk,
-            "title": title
+            "title": title,
+            "start": _chunk_start(text, start, end, offsets),
         })
 
     # 삭제/폐지 조문 감지
@@ -200,8 +234,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
     results = []
 
     # 항(paragraph): (a), (b), (c) ... (i, v, x 제외 — 로마 숫자와 혼동 방지)
-    para_pattern = re.compile(r"(?:^|\n)\s*\(([a-hj-uw-z])\)\s+")
-    paragraphs = list(para_pattern.finditer(text))
+    paragraphs = list(_US_PARAGRAPH_PATTERN.finditer(text))
 
     if not paragraphs:
         return []
@@ -224,8 +257,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
         para_text = text[start:end].strip()
 
         # 호(item): (1), (2), (3) ...
-        item_pattern = re.compile(r"(?:^|\n)\s*\((\d+)\)\s+")
-        items = list(item_pattern.finditer(para_text))
+        items = list(_US_ITEM_PATTERN.finditer(para_text))
 
         if not items:
             results.append({
@@ -254,8 +286,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
                 item_text = para_text[item_start:item_end].strip()
 
                 # 목(subitem): (A), (B), (C) ...
-                subitem_pattern = re.compile(r"(?:^|\n)\s*\(([A-Z])\)\s+")
-                subitems = list(subitem_pattern.finditer(item_text))
+                subitems = list(_US_SUBITEM_PATTERN.finditer(item_text))
 
                 if not subitems:
                     results.append({
@@ -273,8 +304,7 @@ def _parse_paragraphs_us(text: str) -> list[dict]:
                         subitem_text = item_text[subitem_start:subitem_end].strip()
 
                         # 세목(subsubitem): (i), (ii), (iii) ...
-                        subsubitem_pattern = re.compile(r"(?:^|\n)\s*\(([ivxlcdm]+)\)\s+")
-                        subsubitems = list(subsubitem_pattern.finditer(subitem_text))
+                        subsubitems = list(_US_SUBSUBITEM_PATTERN.finditer(subitem_text))
 
                         if not subsubitems:
                             results.append({
@@ -8,6 +8,7 @@ parsers 패키지의 공개 API를 re-export한다.
 from parsers import (
     split_articles,
     extract_structured_articles,
+    iter_structured_articles,
     _detect_lang,
     _detect_format,
 )
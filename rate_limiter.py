@@ -0,0 +1,248 @@
+"""프로세스 공용 API 요청 속도 제한기.
+
+같은 프로세스 안의 모든 스레드가 제공자(provider)별로 다음 두 가지를 공유한다.
+
+- 토큰 버킷 (get_limiter): 분당 요청 수(RPM)만큼 토큰을 일정하게 채우고, 요청 전에
+  토큰 하나를 가져간다. 토큰이 남아 있으면 기다리지 않고, 예산을 다 쓴 경우에만
+  다음 토큰이 찰 때까지 기다린다. 환경변수 <PROVIDER>_RPM (예: GEMINI_RPM=300)으로 조정한다.
+- AIMD 동시성 제어기 (get_controller): 429/할당량 초과 응답을 받으면 그 제공자의
+  동시 요청 수를 절반으로 줄이고 retry-after 동안 모든 작업자의 새 요청을 멈춘다.
+  성공할 때마다 동시 요청 수를 조금씩(1/현재 한도) 늘려 최대값까지 회복한다.
+  최대 동시 요청 수는 환경변수 <PROVIDER>_MAX_CONCURRENCY로 조정한다.
+
+API 호출은 `with request_slot(provider):` 안에서 보낸다. 두 한도 중 하나라도
+다 쓴 경우에만 기다리므로, 호출 사이에 고정 대기(time.sleep)를 두지 않는다.
+"""
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+
+# 제공자별 기본 분당 요청 수
+_DEFAULT_RPM = {
+    "gemini": 60,
+    "claude": 50,
+}
+
+# 제공자별 기본 최대 동시 요청 수
+_DEFAULT_MAX_CONCURRENCY = {
+    "gemini": 16,
+    "claude": 8,
+}
+
+# retry-after가 없는 429 응답 후 새 요청을 멈추는 시간(초)
+_DEFAULT_COOLDOWN = 10.0
+# 한꺼번에 돌아온 429 응답들은 감소 신호 한 번으로 본다 (이 간격 안의 감소는 무시)
+_DECREASE_INTERVAL = 2.0
+# 비동기 대기 시 슬롯이 빌 때까지 다시 확인하는 간격(초)
+_ASYNC_POLL_INTERVAL = 0.05
+
+# 상태 코드가 없는 예외의 메시지에서 속도 제한을 알아보는 패턴 (숫자 429 또는 gRPC 상태명만)
+_RATE_LIMIT_MESSAGE_PATTERN = re.compile(r"\b429\b|RESOURCE_EXHAUSTED")
+_RETRY_AFTER_PATTERN = re.compile(
+    r"retry (?:in|after) ([\d.]+)\s*s|retry_delay\s*\{\s*seconds:\s*(\d+)", re.IGNORECASE
+)
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+_controllers = {}
+_controllers_lock = threading.Lock()
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷.
+
+    Args:
+        rate_per_minute: 분당 채워지는 토큰 수
+        burst: 버킷 용량 (연속으로 바로 보낼 수 있는 요청 수)
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = None):
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = float(burst if burst is not None else max(1, int(rate_per_minute) // 10))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_minute / 60.0)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 가져오면 0, 부족하면 가져오지 않고 기다려야 할 초를 반환한다."""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) * 60.0 / self.rate_per_minute
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 가져올 때까지 기다린다. 기다린 시간(초)을 반환한다."""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+
+def get_limiter(provider: str) -> TokenBucket:
+    """제공자별 공용 토큰 버킷을 반환한다 (처음 호출 시 생성)."""
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            rpm = float(os.environ.get(f"{provider.upper()}_RPM", _DEFAULT_RPM.get(provider, 60)))
+            limiter = TokenBucket(rpm)
+            _limiters[provider] = limiter
+        return limiter
+
+
+def rate_limit_info(error: BaseException) -> tuple[bool, float | None]:
+    """예외가 속도 제한(429/할당량 초과/과부하)인지와 retry-after(초)를 반환한다.
+
+    Anthropic RateLimitError/OverloadedError(status_code 429/529, retry-after 헤더)와
+    Gemini ResourceExhausted(code 429, 메시지의 retry_delay)를 처리한다.
+    예외 종류와 상태 코드로 판단하고, 상태 코드가 없는 예외만 메시지의 '429'·'RESOURCE_EXHAUSTED'를 본다.
+    """
+    name = type(error).__name__
+    text = str(error)
+    status = getattr(error, "status_code", None)
+    if not isinstance(status, int):
+        status = getattr(error, "code", None)
+    rate_limited = (
+        name in ("RateLimitError", "OverloadedError", "ResourceExhausted", "TooManyRequests")
+        or status in (429, 529)
+        or (not isinstance(status, int) and bool(_RATE_LIMIT_MESSAGE_PATTERN.search(text)))
+    )
+
+    retry_after = None
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is not None:
+        try:
+            retry_after = float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            retry_after = None
+    if retry_after is None:
+        m = _RETRY_AFTER_PATTERN.search(text)
+        if m:
+            retry_after = float(m.group(1) or m.group(2))
+    return rate_limited, retry_after
+
+
+class AIMDController:
+    """제공자 하나의 동시 요청 수를 AIMD(가산 증가·승산 감소)로 조절한다.
+
+    Args:
+        provider: 제공자 이름 (로그용)
+        max_concurrency: 최대 동시 요청 수 (시작값)
+        min_concurrency: 최소 동시 요청 수
+    """
+
+    def __init__(self, provider: str, max_concurrency: int, min_concurrency: int = 1):
+        self.provider = provider
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.min_concurrency = max(1, min(int(min_concurrency), self.max_concurrency))
+        self.limit = float(self.max_concurrency)
+        self.throttled = 0
+        self._in_flight = 0
+        self._cooldown_until = 0.0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def try_acquire(self) -> float:
+        """슬롯을 얻으면 0, 못 얻으면 얻지 않고 다시 시도할 때까지의 초를 반환한다."""
+        with self._cond:
+            now = time.monotonic()
+            if now < self._cooldown_until:
+                return self._cooldown_until - now
+            if self._in_flight < int(self.limit):
+                self._in_flight += 1
+                return 0.0
+            return _ASYNC_POLL_INTERVAL
+
+    def acquire(self) -> float:
+        """슬롯을 얻을 때까지 기다린다. 기다린 시간(초)을 반환한다."""
+        start = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if now < self._cooldown_until:
+                    self._cond.wait(self._cooldown_until - now)
+                    continue
+                if self._in_flight < int(self.limit):
+                    self._in_flight += 1
+                    return time.monotonic() - start
+                self._cond.wait()
+
+    def release(self, error: BaseException = None) -> None:
+        """슬롯을 반납하고 결과(성공/속도 제한/기타 오류)에 따라 한도를 조절한다."""
+        rate_limited, retry_after = rate_limit_info(error) if error is not None else (False, None)
+        with self._cond:
+            self._in_flight -= 1
+            if rate_limited:
+                now = time.monotonic()
+                cooldown = retry_after if retry_after is not None else _DEFAULT_COOLDOWN
+                self.throttled += 1
+                if now - self._last_decrease >= _DECREASE_INTERVAL:
+                    old_limit = self.limit
+                    self.limit = max(float(self.min_concurrency), self.limit / 2)
+                    self._last_decrease = now
+                    print(
+                        f"[속도 제한] {self.provider}: 동시 요청 {int(old_limit)} → {int(self.limit)}, "
+                        f"{cooldown:.1f}초 대기"
+                    )
+                self._cooldown_until = max(self._cooldown_until, now + cooldown)
+            elif error is None:
+                self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """`with controller.slot():` 블록 하나가 API 요청 하나이다. 블록의 예외로 결과를 판단한다."""
+        self.acquire()
+        try:
+            yield
+        except BaseException as e:
+            self.release(e)
+            raise
+        else:
+            self.release()
+
+
+def get_controller(provider: str) -> AIMDController:
+    """제공자별 공용 AIMD 동시성 제어기를 반환한다 (처음 호출 시 생성)."""
+    with _controllers_lock:
+        controller = _controllers.get(provider)
+        if controller is None:
+            max_concurrency = int(os.environ.get(
+                f"{provider.upper()}_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY.get(provider, 8)
+            ))
+            controller = AIMDController(provider, max_concurrency)
+            _controllers[provider] = controller
+        return controller
+
+
+@contextmanager
+def request_slot(provider: str):
+    """API 요청 하나의 공용 한도: AIMD 동시성 슬롯 + 분당 요청 수 토큰.
+
+    블록 안의 예외(429 등)는 AIMD 제어기에 전달된다.
+    """
+    with get_controller(provider).slot():
+        get_limiter(provider).acquire()
+        yield
+
+
+def retry_delay(error: BaseException, attempt: int) -> float:
+    """실패한 요청을 다시 보내기 전 대기 시간(초).
+
+    속도 제한(429)이면 AIMD 제어기가 retry-after 동안 모든 작업자의 새 요청을
+    멈추므로 따로 기다리지 않는다. 그 밖의 오류는 3초, 6초, ... 로 늘려 기다린다.
+    """
+    rate_limited, _ = rate_limit_info(error)
+    return 0.0 if rate_limited else 3 * (attempt + 1)
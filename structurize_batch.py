@@ -0,0 +1,200 @@
+"""법령 일괄 구조화 (명령행)
+
+DATA/ 또는 국가별 폴더 아래의 PDF/RTF/XML 법령 파일을 모두 찾아
+국가 폴더(없으면 parsers.get_parser)로 국가를 정하고, 여러 프로세스에서 나누어 구조화한다.
+결과는 앱(법령 구조화 페이지)과 같은 위치·이름으로 저장한다:
+
+    DATA/output/구조화법률/<국가>/구조화_<국가명>_<파일명>.xlsx
+
+결과 엑셀이 원본 파일보다 새로우면 이미 최신으로 보고 건너뛴다.
+
+실행:
+    python structurize_batch.py                    # DATA/ 전체
+    python structurize_batch.py DATA/USA DATA/EPC  # 특정 국가 폴더
+    python structurize_batch.py -j 4 --force       # 4개 프로세스, 모두 다시 생성
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from parsers import get_parser
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.environ.get("DATA_DIR", os.path.join(PROJECT_DIR, "DATA"))
+
+SUPPORTED_EXTENSIONS = (".pdf", ".rtf", ".xml")
+
+# 파서 COUNTRY_CODE → (앱의 국가 선택값, 구조화법률 하위 폴더)
+# 파일명 접두사와 폴더는 app.py의 COUNTRY_MAP / _detect_country_from_filename과 맞춘다.
+COUNTRY_NAMES = {
+    "epc": ("유럽(EPC)", "유럽"),
+    "germany": ("독일", "독일"),
+    "hongkong": ("홍콩", "홍콩"),
+    "taiwan": ("대만", "대만"),
+    "newzealand": ("뉴질랜드", "뉴질랜드"),
+    "korea": ("한국", "한국"),
+    "usa": ("미국", "미국"),
+}
+
+
+def _existing_path(path: str) -> str:
+    """한글 경로의 NFC/NFD 형태 중 이미 있는 쪽을 반환한다 (없으면 그대로).
+
+    macOS에서 커밋된 '구조화법률' 폴더는 NFD로 저장될 수 있어, 앱과 같은 폴더에
+    쓰려면 새로 만들기 전에 기존 형태를 찾아야 한다.
+    """
+    if os.path.exists(path):
+        return path
+    for form in ("NFC", "NFD"):
+        normalized = unicodedata.normalize(form, path)
+        if os.path.exists(normalized):
+            return normalized
+    return path
+
+
+def collect_inputs(paths: list[str]) -> list[str]:
+    """경로 목록에서 구조화할 법령 파일을 찾는다. output 폴더와 임시 파일은 제외한다."""
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d != "output" and not d.startswith("."))
+            for name in sorted(names):
+                if name.startswith(("~$", ".")):
+                    continue
+                if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                    files.append(os.path.join(root, name))
+    return [f for f in files if os.path.splitext(f)[1].lower() in SUPPORTED_EXTENSIONS]
+
+
+def country_code_for(file_path: str) -> str:
+    """입력 파일의 국가 코드를 정한다.
+
+    앱에서는 국가 폴더(DATA/USA 등)를 골라 구조화하므로 경로에 국가 폴더가 있으면
+    그 폴더를 따르고, 없으면 parsers.get_parser가 고른 파서의 국가를 쓴다.
+    (예: 대만 폴더의 영문 PDF는 EPC 파서로 분리되지만 결과는 '대만'으로 저장)
+    """
+    parts = os.path.normpath(os.path.abspath(file_path)).split(os.sep)
+    for part in reversed(parts[:-1]):
+        if part.lower() in COUNTRY_NAMES:
+            return part.lower()
+    return get_parser(file_path).COUNTRY_CODE
+
+
+def output_path_for(file_path: str, output_root: str) -> tuple[str, str]:
+    """입력 파일의 (앱 국가명, 결과 엑셀 경로)를 반환한다."""
+    country, folder = COUNTRY_NAMES.get(country_code_for(file_path), COUNTRY_NAMES["epc"])
+    base_name = os.path.basename(file_path).rsplit(".", 1)[0]
+    country_dir = _existing_path(os.path.join(output_root, folder))
+    return country, os.path.join(country_dir, f"구조화_{country}_{base_name}.xlsx")
+
+
+def is_up_to_date(file_path: str, excel_path: str) -> bool:
+    """결과 엑셀이 있고 원본 파일 이후에 만들어졌으면 True."""
+    excel_path = _existing_path(excel_path)
+    if not os.path.exists(excel_path):
+        return False
+    return os.path.getmtime(excel_path) >= os.path.getmtime(file_path)
+
+
+def structurize_file(file_path: str, country: str, excel_path: str) -> tuple[int, float]:
+    """법령 파일 하나를 구조화하여 엑셀로 저장한다. (행 수, 소요 시간)을 반환한다.
+
+    작업 프로세스에서 실행된다. 저장 중 중단되어도 반쯤 쓰인 파일이 최신으로
+    보이지 않도록 '~$' 임시 파일(앱 목록에서 제외됨)에 쓴 뒤 교체한다.
+    """
+    from parsers import extract_structured_articles, save_structured_to_excel
+    from parsers.germany import extract_structured_articles_from_xml
+
+    start = time.perf_counter()
+    if os.path.splitext(file_path)[1].lower() == ".xml":
+        df = extract_structured_articles_from_xml(file_path, country=country, law_name="특허법")
+    else:
+        df = extract_structured_articles(file_path)
+
+    os.makedirs(os.path.dirname(excel_path), exist_ok=True)
+    tmp_path = os.path.join(os.path.dirname(excel_path), "~$" + os.path.basename(excel_path))
+    try:
+        save_structured_to_excel(df, tmp_path)
+        os.replace(tmp_path, excel_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(df), time.perf_counter() - start
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="법령 파일을 일괄 구조화하여 엑셀로 저장한다.")
+    parser.add_argument(
+        "paths", nargs="*", default=[DATA_DIR],
+        help="법령 파일 또는 폴더 (기본: DATA/ 전체)",
+    )
+    parser.add_argument(
+        "-o", "--output", default=os.path.join(DATA_DIR, "output", "구조화법률"),
+        help="구조화 결과 루트 폴더 (기본: DATA/output/구조화법률)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="동시에 구조화할 프로세스 수 (기본: CPU 코어 수)",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="최신 결과가 있어도 다시 구조화한다.",
+    )
+    args = parser.parse_args(argv)
+
+    output_root = _existing_path(args.output)
+    inputs = collect_inputs(args.paths)
+
+    print("=" * 70)
+    print(f"법령 일괄 구조화: 파일 {len(inputs)}개 → {output_root}")
+    print("=" * 70)
+
+    tasks = []
+    for file_path in inputs:
+        country, excel_path = output_path_for(file_path, output_root)
+        if not args.force and is_up_to_date(file_path, excel_path):
+            print(f"⏭️  최신 결과 있음: {os.path.basename(excel_path)}")
+            continue
+        tasks.append((file_path, country, excel_path))
+
+    if not tasks:
+        print("\n구조화할 파일이 없습니다.")
+        return 0
+
+    jobs = max(1, min(args.jobs, len(tasks)))
+    print(f"\n🚀 {len(tasks)}개 파일 구조화 (프로세스 {jobs}개)")
+
+    failed = []
+    start = time.perf_counter()
+    # parse_pdf 병렬 추출과 같이 spawn으로 워커를 생성한다.
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx) as executor:
+        futures = {
+            executor.submit(structurize_file, file_path, country, excel_path): (file_path, excel_path)
+            for file_path, country, excel_path in tasks
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            file_path, excel_path = futures[future]
+            try:
+                row_count, elapsed = future.result()
+            except Exception as e:
+                failed.append(file_path)
+                print(f"[{done}/{len(tasks)}] ❌ {os.path.basename(file_path)}: {e}")
+                continue
+            print(f"[{done}/{len(tasks)}] ✅ {os.path.basename(excel_path)} ({row_count}행, {elapsed:.1f}초)")
+
+    print("\n" + "=" * 70)
+    print(f"완료: {len(tasks) - len(failed)}개 성공, {len(failed)}개 실패 ({time.perf_counter() - start:.1f}초)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""번역 실행 저널 (SQLite, 중단된 번역 이어하기).
+
+translate_batch는 조문 그룹 하나의 번역이 끝날 때마다 결과 행을 이 저널에 바로 기록한다.
+브라우저 새로고침·Streamlit 재실행·프로세스 종료로 번역이 중간에 끊겨도, 같은 입력으로
+다시 실행하면 저널에 있는 조문 그룹은 건너뛰고 남은 그룹만 번역한다.
+
+실행 ID는 다음 값을 합친 SHA-256 해시이다:
+
+- 입력 조문 (id, 원문, 구조 정보)
+- 원문 언어, 시스템 프롬프트, 모델 ID
+- 번역 옵션 (Gemini/Claude 사용 여부, 조문 그룹화, 번역 메모리 재사용)
+
+번역이 끝나면 그 실행의 기록은 지운다 (번역 결과는 번역 메모리에 남는다).
+일시적 오류로 실패한 그룹은 기록하지 않으므로 이어하기에서 다시 번역된다.
+_MAX_AGE_DAYS보다 오래된 미완료 실행은 자동으로 정리한다.
+
+저장 위치는 프로젝트 폴더의 .translation_journal.sqlite3 이며,
+TRANSLATION_JOURNAL_PATH 환경변수로 바꿀 수 있다. TRANSLATION_JOURNAL=0 이면 사용하지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+_DB_PATH = os.environ.get(
+    "TRANSLATION_JOURNAL_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".translation_journal.sqlite3"),
+)
+_ENABLED = os.environ.get("TRANSLATION_JOURNAL", "1") != "0"
+
+# 실행 ID 구성이 바뀌어 기존 기록을 무효화해야 할 때 올린다.
+_JOURNAL_VERSION = 1
+_MAX_AGE_DAYS = 7
+
+_local = threading.local()
+_resumed_groups = 0
+_stats_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """스레드별 SQLite 연결을 반환한다 (처음 호출 시 생성하고 오래된 실행을 정리)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(_DB_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(_DB_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translation_journal ("
+            " run_id TEXT NOT NULL,"
+            " group_key TEXT NOT NULL,"
+            " rows TEXT NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (run_id, group_key))"
+        )
+        conn.execute(
+            "DELETE FROM translation_journal WHERE updated_at < ?",
+            (time.time() - _MAX_AGE_DAYS * 86400,),
+        )
+        conn.commit()
+        _local.conn = conn
+    return conn
+
+
+def make_run_id(articles: list[dict], structure_keys: list[str], **options) -> str:
+    """입력 조문과 번역 옵션으로 실행 ID를 만든다."""
+    content = json.dumps(
+        {
+            "version": _JOURNAL_VERSION,
+            "articles": [
+                [str(a.get("id", "")), str(a.get("text", ""))]
+                + [str(a.get(key, "")) for key in structure_keys]
+                for a in articles
+            ],
+            "options": options,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _json_default(value):
+    """numpy 숫자 등 JSON으로 바로 저장되지 않는 값을 변환한다."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def load(run_id: str) -> dict:
+    """실행에서 이미 끝난 조문 그룹의 결과 행을 반환한다. {그룹 키: [결과 행, ...]}"""
+    if not _ENABLED:
+        return {}
+    try:
+        rows = _connect().execute(
+            "SELECT group_key, rows FROM translation_journal WHERE run_id = ?", (run_id,)
+        ).fetchall()
+    except sqlite3.Error as e:
+        print(f"[번역 저널] 조회 실패: {e}")
+        return {}
+    return {group_key: json.loads(group_rows) for group_key, group_rows in rows}
+
+
+def record(run_id: str, group_key: str, rows: list[dict]) -> None:
+    """끝난 조문 그룹의 결과 행을 기록한다."""
+    if not _ENABLED:
+        return
+    try:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO translation_journal (run_id, group_key, rows, updated_at)"
+            " VALUES (?, ?, ?, ?)",
+            (run_id, str(group_key), json.dumps(rows, ensure_ascii=False, default=_json_default), time.time()),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"[번역 저널] 기록 실패: {e}")
+
+
+def clear(run_id: str) -> None:
+    """끝난 실행의 기록을 지운다."""
+    if not _ENABLED:
+        return
+    try:
+        conn = _connect()
+        conn.execute("DELETE FROM translation_journal WHERE run_id = ?", (run_id,))
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"[번역 저널] 삭제 실패: {e}")
+
+
+def note_resumed(count: int) -> None:
+    """저널에서 이어받은 조문 그룹 수를 센다."""
+    global _resumed_groups
+    with _stats_lock:
+        _resumed_groups += count
+
+
+def resumed_groups() -> int:
+    """지금까지 저널에서 이어받은 조문 그룹 수 (화면 표시용 누적값)."""
+    with _stats_lock:
+        return _resumed_groups
@@ -0,0 +1,149 @@
+"""번역 메모리 (SQLite 영구 저장소).
+
+같은 원문을 같은 조건으로 다시 번역하지 않도록 번역 결과를 로컬 SQLite 파일에 저장한다.
+키는 다음 값을 합친 SHA-256 해시이다:
+
+- 정규화한 원문 (유니코드 NFC, 연속 공백을 한 칸으로)
+- 원문 언어 (source_lang)
+- 시스템 프롬프트 전문 (_get_system_prompt 결과)
+- 번역 엔진/모델 ID (예: gemini-2.5-flash)
+
+프롬프트나 모델이 바뀌면 키가 달라지므로 이전 번역이 섞이지 않는다.
+오류 표시("[Gemini 오류: ...]", "(번역 실패: ...)" 등)는 저장하지 않는다.
+
+저장 위치는 프로젝트 폴더의 .translation_memory.sqlite3 이며,
+TRANSLATION_MEMORY_PATH 환경변수로 바꿀 수 있다. TRANSLATION_MEMORY=0 이면 사용하지 않는다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import Counter
+
+_DB_PATH = os.environ.get(
+    "TRANSLATION_MEMORY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".translation_memory.sqlite3"),
+)
+_ENABLED = os.environ.get("TRANSLATION_MEMORY", "1") != "0"
+
+# 키 구성이 바뀌어 기존 항목을 무효화해야 할 때 올린다.
+_MEMORY_VERSION = 1
+
+# API 오류 표시 ([Gemini 오류: ...], [Claude API 키 미설정] 등).
+# "[Reserved]"처럼 대괄호로 시작하는 실제 번역문은 해당하지 않는다.
+ERROR_MARKER_PREFIXES = ("[Gemini ", "[Claude ")
+# 저장하지 않는 결과 (API 오류·미사용 표시)
+_UNSTORABLE_PREFIXES = ERROR_MARKER_PREFIXES + ("(번역 실패", "(번역 오류", "(Gemini 미사용)", "(Claude 미사용)")
+
+_local = threading.local()
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """스레드별 SQLite 연결을 반환한다 (처음 호출 시 생성)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(_DB_PATH) or ".", exist_ok=True)
+        conn = sqlite3.connect(_DB_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS translation_memory ("
+            " key TEXT PRIMARY KEY,"
+            " engine TEXT NOT NULL,"
+            " source_lang TEXT NOT NULL,"
+            " translation TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        conn.commit()
+        _local.conn = conn
+    return conn
+
+
+def normalize_text(text: str) -> str:
+    """키 계산용으로 원문을 정규화한다 (NFC, 연속 공백 → 한 칸)."""
+    return " ".join(unicodedata.normalize("NFC", str(text)).split())
+
+
+def make_key(text: str, source_lang: str, system_prompt: str, engine: str) -> str:
+    """원문·언어·프롬프트·엔진으로 번역 메모리 키를 만든다."""
+    content = json.dumps(
+        {
+            "version": _MEMORY_VERSION,
+            "text": normalize_text(text),
+            "source_lang": source_lang,
+            "system_prompt": system_prompt,
+            "engine": engine,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def is_storable(translation: str) -> bool:
+    """번역 메모리에 저장할 만한 결과인지 확인한다 (빈 값·오류 표시 제외)."""
+    return bool(translation and translation.strip()) and not translation.startswith(_UNSTORABLE_PREFIXES)
+
+
+def lookup(
+    text: str, source_lang: str, system_prompt: str, engine: str, min_updated_at: float | None = None,
+) -> str | None:
+    """저장된 번역을 반환한다. 없으면 None. 적중/미적중 횟수를 엔진별로 센다.
+
+    min_updated_at(time.time() 값)을 주면 그 시각 이후에 저장된 번역만 반환한다.
+    """
+    if not _ENABLED:
+        return None
+    key = make_key(text, source_lang, system_prompt, engine)
+    try:
+        row = _connect().execute(
+            "SELECT translation FROM translation_memory WHERE key = ? AND updated_at >= ?",
+            (key, min_updated_at or 0),
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[번역 메모리] 조회 실패: {e}")
+        row = None
+
+    with _stats_lock:
+        _stats[(engine, "hits" if row else "misses")] += 1
+    return row[0] if row else None
+
+
+def store(text: str, source_lang: str, system_prompt: str, engine: str, translation: str) -> None:
+    """번역 결과를 저장한다. 오류 표시 등 저장할 수 없는 결과는 무시한다."""
+    if not _ENABLED or not is_storable(translation):
+        return
+    key = make_key(text, source_lang, system_prompt, engine)
+    try:
+        conn = _connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO translation_memory"
+            " (key, engine, source_lang, translation, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (key, engine, source_lang, translation, time.time()),
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        print(f"[번역 메모리] 저장 실패: {e}")
+
+
+def stats() -> dict:
+    """적중/미적중 횟수를 반환한다.
+
+    Returns:
+        {'hits': n, 'misses': n, 'by_engine': {engine: {'hits': n, 'misses': n}}}
+    """
+    with _stats_lock:
+        snapshot = dict(_stats)
+    by_engine = {}
+    for (engine, kind), count in snapshot.items():
+        by_engine.setdefault(engine, {"hits": 0, "misses": 0})[kind] = count
+    return {
+        "hits": sum(v["hits"] for v in by_engine.values()),
+        "misses": sum(v["misses"] for v in by_engine.values()),
+        "by_engine": by_engine,
+    }
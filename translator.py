@@ -1,7 +1,9 @@
 import re
 import time
 import os
+import threading
 import warnings
+from collections import Counter
 import streamlit as st
 
 # gRPC 및 Gemini 경고 억제
@@ -9,8 +11,10 @@ os.environ['GRPC_ENABLE_FORK_SUPPORT'] = '0'
 os.environ['GRPC_POLL_STRATEGY'] = 'poll'
 warnings.filterwarnings('ignore', category=FutureWarning)
 
-import google.generativeai as genai
-import anthropic
+import translation_journal
+import translation_memory
+from api_clients import get_anthropic_client, get_gemini_model
+from rate_limiter import request_slot, retry_delay
 
 
 # AI 사고 과정 누출 패턴
@@ -118,25 +122,61 @@ def _get_diff_prompt() -> str:
 
 MAX_RETRIES = 3
 
+# 번역 엔진 모델 ID (번역 메모리 키에도 쓰인다)
+GEMINI_MODEL = "gemini-2.5-flash"
+CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+DIFF_ENGINE = f"{GEMINI_MODEL}:diff"
 
-def _call_gemini_with_retry(text: str, system_prompt: str) -> str:
-    """Gemini API를 재시도 포함하여 호출한다."""
+# 번역 결과 중 일시적 오류 표시 (배치 끝에서 자동 재시도 대상)
+_RETRYABLE_PREFIXES = ("[Gemini 오류", "[Claude 오류", "(번역 실패", "(번역 오류")
+TAIL_RETRY_ROUNDS = 2
+
+# 항목별 번역 파이프라인의 작업 스레드 수 (실제 동시 요청 수는 제공자별 한도가 정한다)
+ITEM_PIPELINE_WORKERS = 16
+
+# 스마트 배치 번역의 요청당 토큰 예산 (제공자별, 예상 출력 토큰 기준).
+# Claude 응답 상한(max_tokens=8192)과 JSON 형식 여유를 고려한 값이며,
+# 환경변수 GEMINI_BATCH_TOKENS·CLAUDE_BATCH_TOKENS로 바꿀 수 있다.
+SMART_BATCH_TOKEN_BUDGET = {"gemini": 6000, "claude": 6000}
+# 배치 JSON 요청 횟수 (첫 요청 + 응답에서 빠진 조문 재요청). 그래도 남으면 개별 번역
+BATCH_JSON_ATTEMPTS = 2
+# 깨진 JSON 응답에서 온전한 "키": "문자열" 쌍을 찾는 패턴 (이스케이프된 따옴표 허용)
+_JSON_PAIR_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+_batch_stats = Counter()
+_batch_stats_lock = threading.Lock()
+# 토큰 추정: 한국어 번역문은 원문보다 토큰이 많다. JSON 키·따옴표 등 항목별 부가 토큰.
+_OUTPUT_TOKEN_RATIO = 1.5
+_JSON_ITEM_OVERHEAD_TOKENS = 12
+
+# 조문 그룹 번역의 차이 요약 단계: 작업 스레드 수와 한 요청에 묶는 최대 번역문 쌍 수
+DIFF_WORKERS = 2
+DIFF_BATCH_SIZE = 5
+
+# 스트리밍 번역: 부분 번역문 표시 콜백을 부르는 최소 간격 (초)
+STREAM_REFRESH_SECONDS = 0.3
+
+
+def _call_gemini_with_retry(text: str, system_prompt: str, on_partial=None) -> str:
+    """Gemini API를 재시도 포함하여 호출한다.
+
+    on_partial을 주면 스트리밍(stream=True)으로 받으며 지금까지 받은 번역문으로 on_partial을 부른다.
+    """
     api_key = st.secrets.get("GEMINI_API_KEY", "")
     if not api_key or api_key == "your-key-here":
         return ""
 
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel(
-        "gemini-2.5-flash",
-        system_instruction=system_prompt,
-    )
+    model = get_gemini_model(api_key, GEMINI_MODEL, system_prompt)
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = model.generate_content(
-                text,
-                request_options={"timeout": 120},
-            )
+            with request_slot("gemini"):
+                if on_partial is not None:
+                    raw = _stream_gemini_text(model, text, on_partial).strip()
+                    return _clean_translation_output(raw) if raw else "[Gemini 응답 없음]"
+                response = model.generate_content(
+                    text,
+                    request_options={"timeout": 120},
+                )
             # 응답이 차단되었거나 빈 경우 안전하게 처리
             if not response.candidates:
                 return "[Gemini 응답 없음]"
@@ -146,9 +186,10 @@ def _call_gemini_with_retry(text: str, system_prompt: str) -> str:
             raw = candidate.content.parts[0].text.strip()
             return _clean_translation_output(raw)
         except Exception as e:
+            if on_partial is not None:
+                on_partial("")
             if attempt < MAX_RETRIES - 1:
-                wait = 3 * (attempt + 1)
-                time.sleep(wait)
+                time.sleep(retry_delay(e, attempt))
             else:
                 error_name = type(e).__name__
                 if "ResourceExhausted" in error_name or "429" in str(e):
@@ -156,55 +197,394 @@ def _call_gemini_with_retry(text: str, system_prompt: str) -> str:
                 return f"[Gemini 오류: {error_name}]"
 
 
-def translate_gemini(text: str, system_prompt: str) -> str:
-    """Gemini API로 번역한다."""
+def _stream_gemini_text(model, text: str, on_partial) -> str:
+    """Gemini 응답을 스트리밍으로 받아 전체 텍스트를 반환한다 (조각마다 on_partial 호출)."""
+    response = model.generate_content(
+        text,
+        stream=True,
+        request_options={"timeout": 120},
+    )
+    received = ""
+    for chunk in response:
+        # 차단되었거나 내용이 없는 조각은 건너뛴다
+        if not chunk.candidates:
+            continue
+        content = chunk.candidates[0].content
+        if not content or not content.parts:
+            continue
+        received += "".join(part.text for part in content.parts)
+        on_partial(received)
+    return received
+
+
+def translate_gemini(text: str, system_prompt: str, on_partial=None) -> str:
+    """Gemini API로 번역한다. on_partial을 주면 스트리밍으로 받는다."""
     api_key = st.secrets.get("GEMINI_API_KEY", "")
     if not api_key or api_key == "your-key-here":
         return "[Gemini API 키 미설정]"
-    result = _call_gemini_with_retry(text, system_prompt)
+    result = _call_gemini_with_retry(text, system_prompt, on_partial)
     return result if result else "[Gemini 번역 실패]"
 
 
-def translate_claude(text: str, system_prompt: str) -> str:
-    """Claude API로 번역한다."""
+def translate_claude(text: str, system_prompt: str, on_partial=None) -> str:
+    """Claude API로 번역한다.
+
+    on_partial을 주면 messages.stream으로 받으며 지금까지 받은 번역문으로 on_partial을 부른다.
+    사고 과정 정리(_clean_translation_output)는 스트림이 끝난 뒤 한 번만 적용한다.
+    """
     api_key = st.secrets.get("ANTHROPIC_API_KEY", "")
     if not api_key or api_key == "your-key-here":
         return "[Claude API 키 미설정]"
 
+    # SDK 내부 재시도를 끄고 429는 AIMD 제어기가 처리한다
+    client = get_anthropic_client(api_key, max_retries=0)
+    request = {
+        "model": CLAUDE_MODEL,
+        "max_tokens": 8192,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": text}],
+    }
     for attempt in range(MAX_RETRIES):
         try:
-            client = anthropic.Anthropic(api_key=api_key)
-            message = client.messages.create(
-                model="claude-sonnet-4-5-20250929",
-                max_tokens=8192,
-                system=system_prompt,
-                messages=[{"role": "user", "content": text}],
-            )
+            with request_slot("claude"):
+                if on_partial is None:
+                    message = client.messages.create(**request)
+                else:
+                    with client.messages.stream(**request) as stream:
+                        received = ""
+                        for delta in stream.text_stream:
+                            received += delta
+                            on_partial(received)
+                        message = stream.get_final_message()
             raw = message.content[0].text.strip()
             return _clean_translation_output(raw)
         except Exception as e:
+            if on_partial is not None:
+                on_partial("")
             if attempt < MAX_RETRIES - 1:
-                wait = 3 * (attempt + 1)
-                time.sleep(wait)
+                time.sleep(retry_delay(e, attempt))
             else:
                 error_name = type(e).__name__
                 error_msg = str(e)[:200]
                 return f"[Claude 오류: {error_name} — {error_msg}]"
 
 
+# 엔진 이름 → (모델 ID, 번역 함수)
+_ENGINES = {
+    "gemini": (GEMINI_MODEL, translate_gemini),
+    "claude": (CLAUDE_MODEL, translate_claude),
+}
+
+
+def _translate_with_memory(
+    engine: str,
+    text: str,
+    source_lang: str,
+    system_prompt: str,
+    use_memory: bool = True,
+    on_partial=None,
+    memory_since: float | None = None,
+) -> str:
+    """번역 메모리를 먼저 조회하고, 없으면 API로 번역하여 메모리에 저장한다.
+
+    use_memory=False이면 조회하지 않고 새로 번역한 결과로 메모리를 갱신한다 (재번역).
+    on_partial을 주면 API 번역을 스트리밍으로 받는다 (메모리에 있으면 부르지 않는다).
+    memory_since를 주면 그 시각 이후에 저장된 번역만 재사용한다.
+    """
+    model_id, translate = _ENGINES[engine]
+    if use_memory:
+        cached = translation_memory.lookup(text, source_lang, system_prompt, model_id, memory_since)
+        if cached is not None:
+            return cached
+    result = translate(text, system_prompt, on_partial=on_partial)
+    translation_memory.store(text, source_lang, system_prompt, model_id, result)
+    return result
+
+
+class _PartialTranslations:
+    """스트리밍 중인 조문의 부분 번역문 모음.
+
+    번역 작업 스레드가 조각을 받을 때마다 기록하고, 호출한 스레드가
+    STREAM_REFRESH_SECONDS마다 바뀐 내용을 꺼내 stream_callback으로 넘긴다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._texts = {}  # 조문 이름 → {엔진: 부분 번역문}
+        self._changed = False
+
+    def updater(self, label: str, engine: str):
+        """(label, engine)의 부분 번역문을 기록하는 on_partial 콜백을 만든다."""
+        def _update(text: str) -> None:
+            with self._lock:
+                self._texts.setdefault(label, {})[engine] = text
+                self._changed = True
+        return _update
+
+    def discard(self, label: str) -> None:
+        """번역이 끝난 조문을 목록에서 뺀다."""
+        with self._lock:
+            if self._texts.pop(label, None) is not None:
+                self._changed = True
+
+    def flush(self, stream_callback) -> None:
+        """바뀐 내용이 있으면 {조문 이름: {엔진: 부분 번역문}}으로 stream_callback을 부른다."""
+        with self._lock:
+            if not self._changed:
+                return
+            snapshot = {label: dict(texts) for label, texts in self._texts.items()}
+            self._changed = False
+        stream_callback(snapshot)
+
+
 def summarize_diff(gemini_result: str, claude_result: str) -> str:
-    """두 번역문의 해석 차이를 1문장으로 요약한다."""
-    if gemini_result.startswith("[") or claude_result.startswith("["):
+    """두 번역문의 해석 차이를 1문장으로 요약한다.
+
+    같은 번역문 쌍의 요약은 번역 메모리에서 재사용한다.
+    """
+    if gemini_result.startswith(translation_memory.ERROR_MARKER_PREFIXES) or claude_result.startswith(
+        translation_memory.ERROR_MARKER_PREFIXES
+    ):
         return "비교 불가 (API 오류)"
 
-    prompt = (
+    prompt = _build_diff_request(gemini_result, claude_result)
+    diff_prompt = _get_diff_prompt()
+    cached = translation_memory.lookup(prompt, "korean", diff_prompt, DIFF_ENGINE)
+    if cached is not None:
+        return cached
+    return _request_diff(prompt, diff_prompt)
+
+
+def _request_diff(prompt: str, diff_prompt: str) -> str:
+    """차이 요약 요청 한 건을 보내고 결과를 번역 메모리에 저장한다."""
+    result = _call_gemini_with_retry(prompt, diff_prompt)
+    translation_memory.store(prompt, "korean", diff_prompt, DIFF_ENGINE, result)
+    return result if result else "비교 불가 (타임아웃)"
+
+
+def summarize_diff_batch(pairs: list[tuple[str, str]]) -> list[str]:
+    """번역문 쌍 여러 개의 차이를 한 요청으로 요약한다. 입력 순서대로 요약을 반환한다.
+
+    번역 메모리에 있는 쌍은 요청에서 빼고(summarize_diff와 같은 키), 남은 쌍이
+    여러 개이면 JSON 요청 하나로 묶는다. 응답에서 빠지거나 파싱하지 못한 쌍은
+    summarize_diff와 같은 개별 요청으로 폴백한다.
+    """
+    import json
+
+    diff_prompt = _get_diff_prompt()
+    summaries = [None] * len(pairs)
+    pending = {}
+    for i, (gemini_result, claude_result) in enumerate(pairs):
+        if gemini_result.startswith(translation_memory.ERROR_MARKER_PREFIXES) or claude_result.startswith(
+            translation_memory.ERROR_MARKER_PREFIXES
+        ):
+            summaries[i] = "비교 불가 (API 오류)"
+            continue
+        prompt = _build_diff_request(gemini_result, claude_result)
+        cached = translation_memory.lookup(prompt, "korean", diff_prompt, DIFF_ENGINE)
+        if cached is not None:
+            summaries[i] = cached
+        else:
+            pending[i] = prompt
+
+    if len(pending) > 1:
+        batch_input = {
+            str(n): {"A": pairs[i][0], "B": pairs[i][1]}
+            for n, i in enumerate(pending, 1)
+        }
+        batch_content = f"""다음은 번역문 쌍 여러 개입니다. A는 Gemini, B는 Claude 번역문입니다.
+각 쌍마다 두 법률 번역문의 핵심 해석 차이를 한국어 1문장으로 요약하여 JSON 형식으로 응답해주세요.
+
+**입력:**
+{json.dumps(batch_input, ensure_ascii=False, indent=2)}
+
+**응답 형식 (JSON만):**
+```json
+{{
+  "1": "요약1",
+  "2": "요약2"
+}}
+```"""
+        try:
+            parsed = _parse_json_response(_call_gemini_with_retry(batch_content, diff_prompt))
+        except Exception as e:
+            print(f"⚠️ 차이 요약 배치({len(pending)}쌍) 실패: {e}")
+            parsed = {}
+        for n, i in enumerate(list(pending), 1):
+            value = parsed.get(str(n))
+            if isinstance(value, str) and value.strip():
+                summaries[i] = value.strip()
+                translation_memory.store(pending.pop(i), "korean", diff_prompt, DIFF_ENGINE, summaries[i])
+
+    # 묶지 못했거나 응답에서 빠진 쌍은 개별 요청
+    for i, prompt in pending.items():
+        summaries[i] = _request_diff(prompt, diff_prompt)
+    return summaries
+
+
+def _build_diff_request(gemini_result: str, claude_result: str) -> str:
+    """차이 요약 요청 본문을 만든다."""
+    return (
         f"번역문 A (Gemini):\n{gemini_result}\n\n"
         f"번역문 B (Claude):\n{claude_result}\n\n"
         "위 두 법률 번역문의 핵심 해석 차이를 한국어 1문장으로 요약하십시오."
     )
 
-    result = _call_gemini_with_retry(prompt, _get_diff_prompt())
-    return result if result else "비교 불가 (타임아웃)"
+
+# 결과 행에 그대로 옮기는 구조 정보 컬럼
+_STRUCTURE_KEYS = ["편", "장", "절", "조문번호", "조문제목", "항", "호"]
+
+
+def _group_key(item: dict) -> str:
+    """항목(입력 조문 또는 결과 행)이 속한 조문 그룹 키."""
+    return item.get('조문번호', item['id'])
+
+
+def _group_articles(articles: list[dict]) -> dict:
+    """조문 번호별로 항목을 묶는다 (입력 순서 유지)."""
+    from collections import defaultdict
+
+    groups = defaultdict(list)
+    for article in articles:
+        groups[_group_key(article)].append(article)
+    return groups
+
+
+def _is_retryable(row: dict) -> bool:
+    """결과 행에 일시적 오류(API 오류·할당량 초과·예외)로 실패한 번역이 있는지 확인한다."""
+    return any(
+        str(row.get(key, "")).startswith(_RETRYABLE_PREFIXES)
+        for key in ("gemini", "claude", "diff_summary")
+    )
+
+
+def _retry_failed_groups(results: list[dict], articles: list[dict], retranslate) -> list[dict]:
+    """실패한 조문 그룹을 배치 끝에서 다시 번역한다 (최대 TAIL_RETRY_ROUNDS회).
+
+    오류 표시는 번역 메모리에 저장되지 않고 성공한 번역은 저장되어 있으므로,
+    재번역에서는 실패한 엔진 호출만 다시 나간다. 재번역 결과는 같은 그룹의
+    행 자리에 순서대로 넣는다.
+
+    Args:
+        results: 번역 결과 행 리스트
+        articles: 입력 조문 리스트
+        retranslate: 입력 조문 일부를 받아 결과 행 리스트를 반환하는 함수
+    """
+    for round_no in range(1, TAIL_RETRY_ROUNDS + 1):
+        failed = {_group_key(row) for row in results if _is_retryable(row)}
+        if not failed:
+            break
+        print(f"🔁 실패한 조문 {len(failed)}개 재시도 ({round_no}/{TAIL_RETRY_ROUNDS})")
+        subset = [a for a in articles if _group_key(a) in failed]
+        retried = iter(retranslate(subset))
+        results = [next(retried) if _group_key(row) in failed else row for row in results]
+
+    remaining = sum(1 for row in results if _is_retryable(row))
+    if remaining:
+        print(f"⚠️ 재시도 후에도 실패한 항목 {remaining}개")
+    return results
+
+
+def _combine_article_group(group: list[dict]) -> str:
+    """조문 그룹의 항목들을 항/호/목 번호를 붙여 하나의 텍스트로 합친다."""
+    combined_parts = []
+    for art in group:
+        text = str(art.get("text", "")).strip()
+        if not text:
+            continue
+
+        prefix = ""
+        항 = art.get("항", "")
+        호 = art.get("호", "")
+        목 = art.get("목", "")
+
+        if 항 and str(항).strip():
+            try:
+                항_num = int(float(항))
+                prefix = f"({항_num}) "
+            except:
+                prefix = f"({항}) "
+
+        if 호 and str(호).strip():
+            try:
+                호_num = int(float(호))
+                prefix += f"{호_num}. "
+            except:
+                prefix += f"({호}) "
+
+        if 목 and str(목).strip():
+            prefix += f"({목}) "
+
+        combined_parts.append(prefix + text)
+
+    return "\n\n".join(combined_parts)
+
+
+def _skipped_group_results(article_num: str, group: list[dict]) -> list[dict] | None:
+    """전문·삭제 조문 그룹이면 번역 생략 결과를, 아니면 None을 반환한다."""
+    if article_num == "전문":
+        original, translated = None, "(서문 — 번역 생략)"
+    elif article_num.endswith("(삭제)"):
+        original, translated = "(삭제)", "(삭제)"
+    else:
+        return None
+
+    group_results = []
+    for article in group:
+        result = {
+            "id": article["id"],
+            "original": original if original is not None else article["text"],
+            "gemini": translated,
+            "claude": translated,
+            "diff_summary": "-",
+        }
+        for key in _STRUCTURE_KEYS:
+            if key in article:
+                result[key] = article[key]
+        group_results.append(result)
+    return group_results
+
+
+def _build_group_results(
+    group: list[dict],
+    combined_text: str,
+    gemini_text: str,
+    claude_text: str,
+    diff: str,
+) -> list[dict]:
+    """조 단위 번역 결과를 그룹의 각 항목에 할당한다 (원문·차이 요약은 첫 항목에만)."""
+    group_results = []
+    for i, article in enumerate(group):
+        result = {
+            "id": article["id"],
+            "original": combined_text if i == 0 else article["text"],
+            "gemini": gemini_text,
+            "claude": claude_text,
+            "diff_summary": diff if i == 0 else "-",
+        }
+        for key in _STRUCTURE_KEYS:
+            if key in article:
+                result[key] = article[key]
+        group_results.append(result)
+    return group_results
+
+
+def _error_group_results(group: list[dict], error: Exception) -> list[dict]:
+    """그룹 번역 중 예외가 나면 모든 항목에 오류 결과를 할당한다."""
+    error_results = []
+    for article in group:
+        result = {
+            "id": article["id"],
+            "original": article.get("text", ""),
+            "gemini": f"(번역 오류: {error})",
+            "claude": f"(번역 오류: {error})",
+            "diff_summary": "-",
+        }
+        for key in _STRUCTURE_KEYS:
+            if key in article:
+                result[key] = article[key]
+        error_results.append(result)
+    return error_results
 
 
 def translate_batch(
@@ -215,216 +595,340 @@ def translate_batch(
     group_by_article: bool = True,
     use_gemini: bool = True,
     use_claude: bool = True,
+    use_memory: bool = True,
+    async_mode: bool = False,
+    concurrency: dict | None = None,
+    diff_progress_callback=None,
+    resume: bool = True,
+    stream_callback=None,
 ) -> list[dict]:
     """조문 리스트를 배치 단위로 이중 번역한다.
 
+    끝난 조문 그룹은 번역 저널(translation_journal)에 바로 기록한다. 번역이 중간에 끊긴 뒤
+    같은 입력·옵션으로 다시 실행하면 저널에 있는 그룹은 건너뛰고 남은 그룹만 번역한다.
+
     Args:
         articles: [{'id': ..., 'text': ..., '조문번호': ...}, ...]
         source_lang: 'english' 또는 'chinese'
-        batch_size: 배치 크기 (rate limit 방지)
+        batch_size: 사용하지 않음 (호환용). 요청 속도는 rate_limiter의 제공자별 한도가 조절한다.
         progress_callback: 진행률 콜백 함수 (current, total)
         group_by_article: True이면 조문 단위로 그룹화해서 번역 (빠름)
         use_gemini: Gemini 번역 사용 여부
         use_claude: Claude 번역 사용 여부
+        use_memory: 번역 메모리에 있는 번역을 재사용할지 여부
+            (False이면 새로 번역하여 메모리를 갱신한다. 재번역용)
+        async_mode: True이면 조문 그룹을 비동기 엔진(translator_async)으로 번역한다.
+            제공자별 동시 요청 수·분당 요청 수 한도까지 요청을 보내므로 큰 법령에 적합하다.
+        concurrency: 비동기 모드의 제공자별 동시 요청 수 (예: {'gemini': 16, 'claude': 8})
+        diff_progress_callback: 차이 요약 진행률 콜백 (current, total).
+            조문 그룹 번역(group_by_article=True)과 비동기 모드에서 쓴다.
+        resume: False이면 저널의 이전 기록을 쓰지 않고 처음부터 번역한다
+        stream_callback: 스트리밍 번역 콜백. 주면 API 번역을 스트리밍으로 받고, 번역 중인 조문의
+            부분 번역문을 {조문 이름: {'gemini': ..., 'claude': ...}}로 STREAM_REFRESH_SECONDS마다
+            호출한 스레드에서 넘긴다 (번역이 끝난 조문은 빠진다). 비동기 모드에서는 쓰지 않는다.
 
     Returns:
         [{'id', 'original', 'gemini', 'claude', 'diff_summary'}, ...]
+        일시적 오류(429 등)로 실패한 조문은 배치 끝에서 자동으로 다시 번역한다.
     """
-    if group_by_article and articles and '조문번호' in articles[0]:
-        # 조문 단위로 그룹화해서 번역 (개별 API 호출)
-        return _translate_by_article_group(articles, source_lang, progress_callback, use_gemini, use_claude)
+    grouped = async_mode or bool(group_by_article and articles and '조문번호' in articles[0])
+    run_id = translation_journal.make_run_id(
+        articles, _STRUCTURE_KEYS,
+        source_lang=source_lang,
+        system_prompt=_get_system_prompt(source_lang),
+        models=[GEMINI_MODEL, CLAUDE_MODEL],
+        grouped=grouped,
+        use_gemini=use_gemini,
+        use_claude=use_claude,
+        use_memory=use_memory,
+    )
 
-    # 기존 방식: 항목별 개별 번역
-    system_prompt = _get_system_prompt(source_lang)
-    results = []
-    total = len(articles)
+    def _record_group(group_key, group_results):
+        # 일시적 오류가 남은 그룹은 기록하지 않는다 (이어하기에서 다시 번역)
+        if not any(_is_retryable(row) for row in group_results):
+            translation_journal.record(run_id, group_key, group_results)
 
-    for i, article in enumerate(articles):
-        text = article["text"]
-        article_id = article["id"]
-
-        # 전문(서문) 또는 삭제 조문은 번역 스킵
-        if article_id == "전문":
-            result = {
-                "id": article_id,
-                "original": text,
-                "gemini": "(서문 — 번역 생략)",
-                "claude": "(서문 — 번역 생략)",
-                "diff_summary": "-",
-            }
-            # 구조 정보 보존
-            for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                if key in article:
-                    result[key] = article[key]
-            results.append(result)
-            if progress_callback:
-                progress_callback(i + 1, total)
-            continue
+    def _run(items, callback, reuse_memory, diff_callback=None, streaming=None, memory_since=None):
+        if async_mode and items:
+            from translator_async import translate_groups_async
 
-        if article_id.endswith("(삭제)") or text == "(삭제)":
-            result = {
-                "id": article_id,
-                "original": "(삭제)",
-                "gemini": "(삭제)",
-                "claude": "(삭제)",
-                "diff_summary": "-",
-            }
-            # 구조 정보 보존
-            for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                if key in article:
-                    result[key] = article[key]
-            results.append(result)
-            if progress_callback:
-                progress_callback(i + 1, total)
-            continue
+            return translate_groups_async(
+                items, source_lang, callback, use_gemini, use_claude, reuse_memory, concurrency,
+                _record_group, diff_callback, memory_since=memory_since,
+            )
 
-        # Gemini 번역
-        if use_gemini:
-            gemini_text = translate_gemini(text, system_prompt)
-            time.sleep(1)
-        else:
-            gemini_text = "(Gemini 미사용)"
+        if grouped and items:
+            # 조문 단위로 그룹화해서 번역 (개별 API 호출)
+            return _translate_by_article_group(
+                items, source_lang, callback, use_gemini, use_claude, reuse_memory, diff_callback,
+                _record_group, streaming, memory_since=memory_since,
+            )
 
-        # Claude 번역
-        if use_claude:
-            claude_text = translate_claude(text, system_prompt)
-            time.sleep(1)
-        else:
-            claude_text = "(Claude 미사용)"
+        # 기존 방식: 항목별 개별 번역
+        return _translate_items(
+            items, source_lang, callback, use_gemini, use_claude, reuse_memory, _record_group,
+            stream_callback=streaming, memory_since=memory_since,
+        )
 
-        # 차이 요약
-        if use_gemini and use_claude:
-            diff = summarize_diff(gemini_text, claude_text)
-        else:
-            diff = "-"
+    # 저널에 있는 그룹(이전 실행에서 끝난 조문)은 건너뛴다
+    finished = translation_journal.load(run_id) if resume else {}
+    remaining = [a for a in articles if str(_group_key(a)) not in finished]
+    callback = progress_callback
+    if finished:
+        print(f"[번역 저널] 이전 실행에서 끝난 조문 그룹 {len(finished)}개를 이어받고 나머지를 번역합니다")
+        translation_journal.note_resumed(len(finished))
+        if progress_callback:
+            # 진행률은 이어받은 만큼 더해서 보고한다 (조문 그룹 번역은 그룹, 항목별 번역은 항목 단위)
+            offset = len(finished) if grouped else len(articles) - len(remaining)
+            callback = lambda current, total: progress_callback(offset + current, offset + total)
+
+    started_at = time.time()
+    results = _run(remaining, callback, use_memory, diff_progress_callback, stream_callback) if remaining else []
+    # 재시도에서는 이번 실행에서 성공해 메모리에 저장된 번역을 재사용한다
+    # (재번역(use_memory=False)이면 이번 실행 전에 저장된 번역은 쓰지 않는다)
+    memory_since = None if use_memory else started_at
+    results = _retry_failed_groups(
+        results, remaining, lambda subset: _run(subset, None, True, memory_since=memory_since),
+    )
+    if finished:
+        results = _merge_journaled_results(articles, finished, results, grouped)
+
+    translation_journal.clear(run_id)
+    return results
+
+
+def _merge_journaled_results(
+    articles: list[dict],
+    finished: dict,
+    new_results: list[dict],
+    grouped: bool,
+) -> list[dict]:
+    """저널에서 이어받은 그룹의 행과 이번에 번역한 행을 입력 순서대로 합친다.
+
+    조문 그룹 번역은 그룹 순서대로 그룹의 행을 모두, 항목별 번역은 입력 항목 순서대로 한 행씩 놓는다.
+    """
+    sources = {key: iter(rows) for key, rows in finished.items()}
+    new_by_group = {}
+    for row in new_results:
+        new_by_group.setdefault(str(_group_key(row)), []).append(row)
+    for key, rows in new_by_group.items():
+        sources.setdefault(key, iter(rows))
+
+    if grouped:
+        return [row for key in _group_articles(articles) for row in sources.get(str(key), [])]
+    return [row for row in (next(sources[str(_group_key(a))], None) for a in articles) if row is not None]
+
+
+def _translate_items(
+    articles: list[dict],
+    source_lang: str,
+    progress_callback=None,
+    use_gemini: bool = True,
+    use_claude: bool = True,
+    use_memory: bool = True,
+    group_callback=None,
+    max_workers: int = ITEM_PIPELINE_WORKERS,
+    stream_callback=None,
+    memory_since: float | None = None,
+) -> list[dict]:
+    """항목별로 이중 번역한다 (조문번호가 없거나 group_by_article=False일 때).
+
+    파이프라인으로 실행한다: 모든 항목의 Gemini·Claude 번역을 작업 풀에 넣고,
+    한 항목의 두 번역이 끝나는 즉시 그 항목의 차이 요약을 같은 풀에 넣는다.
+    서로 다른 항목의 번역과 차이 요약이 겹쳐 실행되고(요청 속도는 rate_limiter의
+    제공자별 한도가 조절), 결과는 입력 순서대로 조립한다.
+    진행률 콜백은 호출한 스레드에서 (완료 항목 수, 전체 항목 수)로 부른다.
+    group_callback은 같은 그룹 키의 항목이 모두 끝날 때마다 (그룹 키, 결과 행들)로 부른다.
+    stream_callback을 주면 번역을 스트리밍으로 받고 번역 중인 항목의 부분 번역문을 넘긴다.
+    memory_since를 주면 그 시각 이후에 번역 메모리에 저장된 번역만 재사용한다.
+    """
+    from collections import Counter, defaultdict
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    system_prompt = _get_system_prompt(source_lang)
+    total = len(articles)
+    results = [None] * total
+    translations = [{} for _ in range(total)]
+    engines = [e for e, used in (("gemini", use_gemini), ("claude", use_claude)) if used]
+    partials = _PartialTranslations() if stream_callback else None
+    done_count = 0
+    group_indices = defaultdict(list)
+    for i, article in enumerate(articles):
+        group_indices[_group_key(article)].append(i)
+    group_remaining = Counter({key: len(indices) for key, indices in group_indices.items()})
 
+    def _item_done(i):
+        nonlocal done_count
+        done_count += 1
+        if progress_callback:
+            progress_callback(done_count, total)
+        key = _group_key(articles[i])
+        group_remaining[key] -= 1
+        if group_callback and group_remaining[key] == 0:
+            group_callback(key, [results[j] for j in group_indices[key]])
+
+    def _finish(i, diff):
+        article = articles[i]
         result = {
-            "id": article_id,
-            "original": text,
-            "gemini": gemini_text,
-            "claude": claude_text,
+            "id": article["id"],
+            "original": article["text"],
+            "gemini": translations[i].get("gemini", "(Gemini 미사용)"),
+            "claude": translations[i].get("claude", "(Claude 미사용)"),
             "diff_summary": diff,
         }
         # 원본 article의 구조 정보 보존 (편/장/절/조문번호/조문제목/항/호)
-        for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
+        for key in _STRUCTURE_KEYS:
             if key in article:
                 result[key] = article[key]
-        results.append(result)
+        results[i] = result
+        _item_done(i)
 
-        # 배치 간 대기 (rate limit 방지)
-        if (i + 1) % batch_size == 0:
-            time.sleep(2)
-
-        if progress_callback:
-            progress_callback(i + 1, total)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {}
+        try:
+            for i, article in enumerate(articles):
+                # 전문(서문) 또는 삭제 조문은 번역 스킵
+                skipped = _skipped_item_result(article)
+                if skipped is not None:
+                    results[i] = skipped
+                    _item_done(i)
+                    continue
+                if not engines:
+                    _finish(i, "-")
+                    continue
+                for engine in engines:
+                    future = executor.submit(
+                        _translate_with_memory, engine, article["text"], source_lang, system_prompt, use_memory,
+                        partials.updater(article["id"], engine) if partials else None, memory_since,
+                    )
+                    pending[future] = (i, engine)
+
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=STREAM_REFRESH_SECONDS if partials else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    i, stage = pending.pop(future)
+                    try:
+                        value = future.result()
+                    except Exception as e:
+                        value = f"(번역 실패: {e})" if stage != "diff" else "-"
+
+                    if stage == "diff":
+                        _finish(i, value)
+                        continue
+
+                    translations[i][stage] = value
+                    if len(translations[i]) < len(engines):
+                        continue
+                    if partials:
+                        partials.discard(articles[i]["id"])
+                    # 두 번역이 모두 끝난 항목은 바로 차이 요약 단계로
+                    if (use_gemini and use_claude
+                            and "(번역 실패" not in translations[i]["gemini"]
+                            and "(번역 실패" not in translations[i]["claude"]):
+                        diff_future = executor.submit(
+                            summarize_diff, translations[i]["gemini"], translations[i]["claude"],
+                        )
+                        pending[diff_future] = (i, "diff")
+                    else:
+                        _finish(i, "-")
+
+                if partials:
+                    partials.flush(stream_callback)
+        finally:
+            # 중단(작업 취소·Streamlit 재실행 등) 시 아직 시작하지 않은 요청은 취소한다
+            for future in pending:
+                future.cancel()
 
     return results
 
 
+def _skipped_item_result(article: dict) -> dict | None:
+    """전문·삭제 항목이면 번역 생략 결과를, 아니면 None을 반환한다."""
+    text = article["text"]
+    article_id = article["id"]
+    if article_id == "전문":
+        result = {
+            "id": article_id,
+            "original": text,
+            "gemini": "(서문 — 번역 생략)",
+            "claude": "(서문 — 번역 생략)",
+            "diff_summary": "-",
+        }
+    elif article_id.endswith("(삭제)") or text == "(삭제)":
+        result = {
+            "id": article_id,
+            "original": "(삭제)",
+            "gemini": "(삭제)",
+            "claude": "(삭제)",
+            "diff_summary": "-",
+        }
+    else:
+        return None
+
+    # 구조 정보 보존
+    for key in _STRUCTURE_KEYS:
+        if key in article:
+            result[key] = article[key]
+    return result
+
+
 def _translate_by_article_group(
     articles: list[dict],
     source_lang: str,
     progress_callback=None,
     use_gemini: bool = True,
     use_claude: bool = True,
+    use_memory: bool = True,
+    diff_progress_callback=None,
+    group_callback=None,
+    stream_callback=None,
+    memory_since: float | None = None,
 ) -> list[dict]:
     """조문 단위로 그룹화해서 동시 번역한다 (빠른 번역).
 
     조문 간 동시 처리(max_workers=5)로 번역 속도를 크게 개선한다.
     각 조문 내부에서는 Gemini+Claude 병렬 번역을 유지한다.
+    번역 메모리에 같은 조문 텍스트의 번역이 있으면 API를 호출하지 않는다.
+
+    차이 요약은 별도 단계로 분리한다: 두 번역이 끝난 조문은 차이 요약 대기열에 넣고,
+    전용 작업 풀(DIFF_WORKERS)이 대기 중인 쌍을 최대 DIFF_BATCH_SIZE개씩 묶어
+    summarize_diff_batch로 요약한다. 번역 작업자는 차이 요약을 기다리지 않고
+    다음 조문을 번역한다.
 
     Args:
         articles: [{'id': ..., 'text': ..., '조문번호': ...}, ...]
         source_lang: 'english' 또는 'chinese'
-        progress_callback: 진행률 콜백
+        progress_callback: 번역 진행률 콜백 (완료 조문 수, 전체 조문 수)
         use_gemini: Gemini 번역 사용 여부
         use_claude: Claude 번역 사용 여부
+        use_memory: 번역 메모리 재사용 여부
+        diff_progress_callback: 차이 요약 진행률 콜백 (완료 조문 수, 요약 대상 조문 수)
+        group_callback: 조문 그룹의 결과가 확정될 때마다 (그룹 키, 결과 행들)로 부르는 콜백
+        stream_callback: 주면 번역을 스트리밍으로 받고, 번역 중인 조문의 부분 번역문을
+            {조문 번호: {'gemini': ..., 'claude': ...}}로 STREAM_REFRESH_SECONDS마다 넘긴다
+        memory_since: 주면 그 시각 이후에 번역 메모리에 저장된 번역만 재사용한다
 
     Returns:
         [{'id', 'original', 'gemini', 'claude', 'diff_summary'}, ...]
     """
-    import threading
-    from collections import defaultdict
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
     system_prompt = _get_system_prompt(source_lang)
 
     # 조문 번호별로 그룹화
-    groups = defaultdict(list)
-    for article in articles:
-        article_num = article.get('조문번호', article['id'])
-        groups[article_num].append(article)
-
+    groups = _group_articles(articles)
     total_groups = len(groups)
+    partials = _PartialTranslations() if stream_callback else None
 
-    # 단일 조문 그룹 번역 내부 함수
+    # 단일 조문 그룹 번역 내부 함수 (차이 요약 제외)
     def _translate_one(article_num, group):
-        """단일 조문 그룹을 번역하여 결과 리스트를 반환한다."""
-        group_results = []
-
-        # 전문이나 삭제 조문 처리
-        if article_num == "전문":
-            for article in group:
-                result = {
-                    "id": article["id"],
-                    "original": article["text"],
-                    "gemini": "(서문 — 번역 생략)",
-                    "claude": "(서문 — 번역 생략)",
-                    "diff_summary": "-",
-                }
-                for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                    if key in article:
-                        result[key] = article[key]
-                group_results.append(result)
-            return group_results
-
-        if article_num.endswith("(삭제)"):
-            for article in group:
-                result = {
-                    "id": article["id"],
-                    "original": "(삭제)",
-                    "gemini": "(삭제)",
-                    "claude": "(삭제)",
-                    "diff_summary": "-",
-                }
-                for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                    if key in article:
-                        result[key] = article[key]
-                group_results.append(result)
-            return group_results
-
+        """단일 조문 그룹을 번역하여 (합친 원문, Gemini 번역, Claude 번역)을 반환한다."""
         # 조문 전체 텍스트 합치기 (항/호/목 번호 포함)
-        combined_parts = []
-        for art in group:
-            text = str(art.get("text", "")).strip()
-            if not text:
-                continue
-
-            prefix = ""
-            항 = art.get("항", "")
-            호 = art.get("호", "")
-            목 = art.get("목", "")
-
-            if 항 and str(항).strip():
-                try:
-                    항_num = int(float(항))
-                    prefix = f"({항_num}) "
-                except:
-                    prefix = f"({항}) "
-
-            if 호 and str(호).strip():
-                try:
-                    호_num = int(float(호))
-                    prefix += f"{호_num}. "
-                except:
-                    prefix += f"({호}) "
-
-            if 목 and str(목).strip():
-                prefix += f"({목}) "
-
-            combined_parts.append(prefix + text)
-
-        combined_text = "\n\n".join(combined_parts)
+        combined_text = _combine_article_group(group)
 
         # 병렬 번역 (Gemini와 Claude를 동시에 실행)
         gemini_text = "(Gemini 미사용)"
@@ -433,9 +937,15 @@ def _translate_by_article_group(
         futures = {}
         with ThreadPoolExecutor(max_workers=2) as executor:
             if use_gemini:
-                futures['gemini'] = executor.submit(translate_gemini, combined_text, system_prompt)
+                futures['gemini'] = executor.submit(
+                    _translate_with_memory, "gemini", combined_text, source_lang, system_prompt, use_memory,
+                    partials.updater(str(article_num), "gemini") if partials else None, memory_since,
+                )
             if use_claude:
-                futures['claude'] = executor.submit(translate_claude, combined_text, system_prompt)
+                futures['claude'] = executor.submit(
+                    _translate_with_memory, "claude", combined_text, source_lang, system_prompt, use_memory,
+                    partials.updater(str(article_num), "claude") if partials else None, memory_since,
+                )
 
             for service, future in futures.items():
                 try:
@@ -449,65 +959,116 @@ def _translate_by_article_group(
                     elif service == 'claude':
                         claude_text = f"(번역 실패: {e})"
 
-        # 차이 요약
-        if use_gemini and use_claude and "(번역 실패" not in gemini_text and "(번역 실패" not in claude_text:
-            diff = summarize_diff(gemini_text, claude_text)
-        else:
-            diff = "-"
+        return combined_text, gemini_text, claude_text
 
-        # 조 단위로 각 항목에 전체 번역 결과 할당
-        for i, article in enumerate(group):
-            result = {
-                "id": article["id"],
-                "original": combined_text if i == 0 else article["text"],
-                "gemini": gemini_text,
-                "claude": claude_text,
-                "diff_summary": diff if i == 0 else "-",
-            }
-            for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                if key in article:
-                    result[key] = article[key]
-            group_results.append(result)
-
-        return group_results
-
-    # 동시 실행 (max_workers=5: 동시 5개 조문 처리)
-    lock = threading.Lock()
-    current = [0]
     ordered_results = [None] * total_groups
-
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_idx = {}
-        for idx, (article_num, group) in enumerate(groups.items()):
-            f = executor.submit(_translate_one, article_num, group)
-            future_to_idx[f] = idx
-
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                ordered_results[idx] = future.result()
-            except Exception as e:
-                # 예외 발생 시 해당 그룹의 모든 항목에 오류 결과 할당
-                article_num, group = list(groups.items())[idx]
-                error_results = []
-                for article in group:
-                    result = {
-                        "id": article["id"],
-                        "original": article.get("text", ""),
-                        "gemini": f"(번역 오류: {e})",
-                        "claude": f"(번역 오류: {e})",
-                        "diff_summary": "-",
-                    }
-                    for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                        if key in article:
-                            result[key] = article[key]
-                    error_results.append(result)
-                ordered_results[idx] = error_results
-
-            with lock:
-                current[0] += 1
-                if progress_callback:
-                    progress_callback(current[0], total_groups)
+    group_items = list(groups.items())
+    translated = {}  # idx → (합친 원문, Gemini 번역, Claude 번역)
+    diff_queue = []  # 차이 요약을 기다리는 그룹 idx
+    translate_done = 0
+    diff_done = 0
+    diff_total = 0
+
+    def _set_group(idx, group_results):
+        ordered_results[idx] = group_results
+        if group_callback:
+            group_callback(group_items[idx][0], group_results)
+
+    def _finish_diff(indices, summaries):
+        nonlocal diff_done
+        for idx, diff in zip(indices, summaries):
+            combined_text, gemini_text, claude_text = translated.pop(idx)
+            _set_group(idx, _build_group_results(
+                group_items[idx][1], combined_text, gemini_text, claude_text, diff,
+            ))
+        diff_done += len(indices)
+        if diff_progress_callback:
+            diff_progress_callback(diff_done, diff_total)
+
+    def _finish_without_diff(idx, group_results):
+        nonlocal diff_done
+        _set_group(idx, group_results)
+        if use_gemini and use_claude:
+            diff_done += 1
+            if diff_progress_callback:
+                diff_progress_callback(diff_done, diff_total)
+
+    # 번역 작업 풀(max_workers=5: 동시 5개 조문)과 차이 요약 작업 풀을 따로 둔다
+    with ThreadPoolExecutor(max_workers=5) as translate_pool, \
+            ThreadPoolExecutor(max_workers=DIFF_WORKERS) as diff_pool:
+        pending = {}  # future → ("translate", idx) 또는 ("diff", [idx, ...])
+        try:
+            for idx, (article_num, group) in enumerate(group_items):
+                # 전문이나 삭제 조문 처리
+                skipped = _skipped_group_results(article_num, group)
+                if skipped is not None:
+                    _set_group(idx, skipped)
+                    translate_done += 1
+                    if progress_callback:
+                        progress_callback(translate_done, total_groups)
+                    continue
+                pending[translate_pool.submit(_translate_one, article_num, group)] = ("translate", idx)
+                if use_gemini and use_claude:
+                    diff_total += 1
+
+            while pending:
+                done, _ = wait(
+                    pending,
+                    timeout=STREAM_REFRESH_SECONDS if partials else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    stage, target = pending.pop(future)
+
+                    if stage == "diff":
+                        try:
+                            summaries = future.result()
+                        except Exception as e:
+                            summaries = [f"비교 불가 ({type(e).__name__})"] * len(target)
+                        _finish_diff(target, summaries)
+                        continue
+
+                    idx = target
+                    if partials:
+                        partials.discard(str(group_items[idx][0]))
+                    try:
+                        combined_text, gemini_text, claude_text = future.result()
+                    except Exception as e:
+                        # 예외 발생 시 해당 그룹의 모든 항목에 오류 결과 할당
+                        _finish_without_diff(idx, _error_group_results(group_items[idx][1], e))
+                    else:
+                        if use_gemini and use_claude and "(번역 실패" not in gemini_text and "(번역 실패" not in claude_text:
+                            translated[idx] = (combined_text, gemini_text, claude_text)
+                            diff_queue.append(idx)
+                        else:
+                            _finish_without_diff(idx, _build_group_results(
+                                group_items[idx][1], combined_text, gemini_text, claude_text, "-",
+                            ))
+
+                    translate_done += 1
+                    if progress_callback:
+                        progress_callback(translate_done, total_groups)
+
+                # 대기 중인 쌍을 묶어 차이 요약 작업 풀에 넣는다.
+                # 쉬는 차이 요약 작업자가 있거나 번역이 모두 끝났으면 모인 만큼 바로 보내고,
+                # 작업자가 모두 바쁘면 DIFF_BATCH_SIZE개가 찰 때까지 모은다.
+                translating = any(stage == "translate" for stage, _ in pending.values())
+                diff_running = sum(1 for stage, _ in pending.values() if stage == "diff")
+                while diff_queue and (
+                    len(diff_queue) >= DIFF_BATCH_SIZE or diff_running < DIFF_WORKERS or not translating
+                ):
+                    batch = diff_queue[:DIFF_BATCH_SIZE]
+                    del diff_queue[:DIFF_BATCH_SIZE]
+                    pairs = [(translated[idx][1], translated[idx][2]) for idx in batch]
+                    pending[diff_pool.submit(summarize_diff_batch, pairs)] = ("diff", batch)
+                    diff_running += 1
+
+                if partials:
+                    partials.flush(stream_callback)
+        finally:
+            # 중단(작업 취소·Streamlit 재실행 등) 시 아직 시작하지 않은 번역·차이 요약은 취소한다
+            for future in pending:
+                future.cancel()
 
     # 순서대로 결과 조립
     results = []
@@ -639,37 +1200,303 @@ def _split_translation(
     return [text] * expected_count
 
 
+def _parse_json_response(response: str) -> dict:
+    """LLM 응답에서 JSON 객체를 꺼낸다 (```json 코드 블록 허용). 객체가 아니면 ValueError."""
+    import json
+
+    if "```json" in response:
+        json_start = response.find("```json") + 7
+        json_end = response.find("```", json_start)
+        json_text = response[json_start:json_end].strip()
+    else:
+        json_text = response
+    parsed = json.loads(json_text)
+    if not isinstance(parsed, dict):
+        raise ValueError(f"JSON 객체가 아님: {type(parsed).__name__}")
+    return parsed
+
+
+def _salvage_json_pairs(response: str) -> dict:
+    """깨진 JSON 응답에서 완전한 "키": "문자열" 쌍을 모두 건진다.
+
+    응답이 중간에 잘렸거나(출력 한도) JSON 뒤에 문장이 붙어 json.loads가 실패할 때 쓴다.
+    응답을 앞에서부터 훑으며 닫는 따옴표까지 온전한 쌍만 꺼내고, 잘린 마지막 쌍은 버린다.
+    """
+    import json
+
+    pairs = {}
+    for match in _JSON_PAIR_PATTERN.finditer(response):
+        try:
+            key = json.loads(f'"{match.group(1)}"', strict=False)
+            value = json.loads(f'"{match.group(2)}"', strict=False)
+        except ValueError:
+            continue
+        pairs[key] = value
+    return pairs
+
+
+def _record_batch_stat(engine: str, kind: str, count: int = 1) -> None:
+    with _batch_stats_lock:
+        _batch_stats[(engine, kind)] += count
+
+
+def batch_fallback_stats() -> dict:
+    """배치 번역 폴백 횟수를 엔진별로 반환한다.
+
+    Returns:
+        {engine: {'articles': 배치로 요청한 조문 수, 'salvaged': 깨진 응답에서 건진 수,
+                  'rerequested': 빠져서 다시 묶어 요청한 수, 'individual': 개별 번역으로 폴백한 수}}
+    """
+    with _batch_stats_lock:
+        snapshot = dict(_batch_stats)
+    by_engine = {}
+    for (engine, kind), count in snapshot.items():
+        by_engine.setdefault(
+            engine, {"articles": 0, "salvaged": 0, "rerequested": 0, "individual": 0},
+        )[kind] = count
+    return by_engine
+
+
+def _log_batch_fallback_rates(before: dict) -> None:
+    """이번 실행의 엔진별 배치 폴백 비율을 출력한다."""
+    for engine, counts in batch_fallback_stats().items():
+        base = before.get(engine, {})
+        delta = {kind: count - base.get(kind, 0) for kind, count in counts.items()}
+        if not delta["articles"]:
+            continue
+        label = "Gemini" if engine == "gemini" else "Claude"
+        rate = lambda n: n / delta["articles"] * 100
+        print(
+            f"[배치 번역] {label}: 조문 {delta['articles']}개 중 "
+            f"깨진 응답에서 복구 {delta['salvaged']}개({rate(delta['salvaged']):.1f}%), "
+            f"재요청 {delta['rerequested']}개({rate(delta['rerequested']):.1f}%), "
+            f"개별 폴백 {delta['individual']}개({rate(delta['individual']):.1f}%)"
+        )
+
+
+def _translate_batch_json(
+    engine: str,
+    batch_texts: dict,
+    source_lang: str,
+    system_prompt: str,
+    batch_idx: int,
+    use_memory: bool = True,
+) -> dict:
+    """조문 여러 개를 JSON 요청 한 번으로 번역한다. {조문번호: 번역문}을 반환한다.
+
+    번역 메모리에 있는 조문은 요청에서 빼고, 응답이 깨진 JSON이면 온전한 쌍만 건진다.
+    응답에서 빠진 조문만 다시 묶어 요청하고(최대 BATCH_JSON_ATTEMPTS회),
+    그래도 남은 조문은 개별 번역으로 폴백한다.
+    """
+    import json
+
+    model_id, translate = _ENGINES[engine]
+    label = "Gemini" if engine == "gemini" else "Claude"
+
+    translations = {}
+    pending = {}
+    for article_num, text in batch_texts.items():
+        cached = translation_memory.lookup(text, source_lang, system_prompt, model_id) if use_memory else None
+        if cached is not None:
+            translations[str(article_num)] = cached
+        else:
+            pending[article_num] = text
+    if not pending:
+        return translations
+    _record_batch_stat(engine, "articles", len(pending))
+
+    for attempt in range(BATCH_JSON_ATTEMPTS):
+        if attempt > 0:
+            # 조문 하나만 남았으면 JSON으로 묶지 않고 개별 번역한다
+            if len(pending) < 2:
+                break
+            print(f"🔁 {label} 배치 {batch_idx+1}: 응답에서 빠진 조문 {len(pending)}개 재요청")
+            _record_batch_stat(engine, "rerequested", len(pending))
+
+        # 배치 프롬프트 구성
+        texts_json = json.dumps(pending, ensure_ascii=False, indent=2)
+        batch_content = f"""다음은 여러 조문의 텍스트입니다. 각 조문을 개별적으로 번역하여 JSON 형식으로 응답해주세요.
+
+**입력:**
+{texts_json}
+
+**응답 형식 (JSON만):**
+```json
+{{
+  "조문ID1": "번역문1",
+  "조문ID2": "번역문2"
+}}
+```"""
+
+        response = translate(batch_content, system_prompt)
+        if response.startswith(translation_memory.ERROR_MARKER_PREFIXES):
+            # API 오류 표시: 묶음 재요청 대신 바로 개별 번역으로 폴백
+            print(f"⚠️ {label} 배치 {batch_idx+1} 번역 실패: {response}")
+            break
+        try:
+            parsed = _parse_json_response(response)
+        except Exception as e:
+            # 잘린 응답·뒤에 붙은 문장 등: 온전한 "조문ID": "번역문" 쌍만 건진다
+            parsed = _salvage_json_pairs(response)
+            salvaged = sum(1 for article_num in pending if isinstance(parsed.get(str(article_num)), str))
+            print(f"⚠️ {label} 배치 {batch_idx+1} JSON 파싱 실패: {e} — {salvaged}/{len(pending)}개 복구")
+            _record_batch_stat(engine, "salvaged", salvaged)
+
+        for article_num, text in list(pending.items()):
+            value = parsed.get(str(article_num))
+            if isinstance(value, str):
+                translations[str(article_num)] = value
+                translation_memory.store(text, source_lang, system_prompt, model_id, value)
+                del pending[article_num]
+        if not pending:
+            return translations
+
+    # 남은 조문은 개별 번역으로 폴백 (이미 조회했으므로 메모리는 다시 보지 않는다)
+    _record_batch_stat(engine, "individual", len(pending))
+    for article_num, text in pending.items():
+        translations[str(article_num)] = _translate_with_memory(
+            engine, text, source_lang, system_prompt, use_memory=False,
+        )
+    return translations
+
+
+def _estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 어림한다 (한글·한자·가나는 글자당 1, 그 밖은 4글자당 1)."""
+    cjk = len(re.findall(r'[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7af]', text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _estimate_batch_cost(text: str) -> int:
+    """배치 요청에서 한 항목이 차지하는 토큰을 어림한다 (입력과 예상 출력 중 큰 쪽)."""
+    input_tokens = _estimate_tokens(text)
+    output_tokens = int(input_tokens * _OUTPUT_TOKEN_RATIO)
+    return max(input_tokens, output_tokens) + _JSON_ITEM_OVERHEAD_TOKENS
+
+
+def _token_budget_for(provider: str, token_budget: dict | None) -> int:
+    """제공자의 요청당 토큰 예산: 인자 > 환경변수 <PROVIDER>_BATCH_TOKENS > 기본값."""
+    if token_budget and provider in token_budget:
+        return max(1, int(token_budget[provider]))
+    return max(1, int(os.environ.get(f"{provider.upper()}_BATCH_TOKENS", SMART_BATCH_TOKEN_BUDGET[provider])))
+
+
+def _split_oversized_group(group: list[dict], budget: int) -> list[list[dict]]:
+    """예산을 넘는 조문을 항/호 경계(그룹 항목 단위)에서 잘라 연속된 조각들로 나눈다.
+
+    항목 하나가 예산을 넘으면 그 항목만으로 조각을 만든다.
+    """
+    pieces = []
+    current, current_cost = [], 0
+    for item in group:
+        cost = _estimate_batch_cost(_combine_article_group([item]))
+        if current and current_cost + cost > budget:
+            pieces.append(current)
+            current, current_cost = [], 0
+        current.append(item)
+        current_cost += cost
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _pack_token_batches(
+    valid_groups: dict,
+    budget: int,
+    max_items: int | None = None,
+) -> tuple[list[dict], dict]:
+    """조문들을 요청당 토큰 예산까지 채워 배치로 묶는다 (입력 순서 유지).
+
+    예산을 넘는 조문은 항/호 경계에서 조각으로 나누어 '조문번호#n' 키로 배치에 넣는다.
+
+    Returns:
+        (배치 리스트 [{키: 텍스트}, ...], 조각으로 나눈 조문 {조문번호: [(키, 조각 항목들), ...]})
+    """
+    units = []
+    split_units = {}
+    for article_num, group in valid_groups.items():
+        text = _combine_article_group(group)
+        cost = _estimate_batch_cost(text)
+        if cost <= budget or len(group) == 1:
+            units.append((str(article_num), text, cost))
+            continue
+        pieces = []
+        for n, piece in enumerate(_split_oversized_group(group, budget), 1):
+            key = f"{article_num}#{n}"
+            piece_text = _combine_article_group(piece)
+            units.append((key, piece_text, _estimate_batch_cost(piece_text)))
+            pieces.append((key, piece))
+        split_units[str(article_num)] = pieces
+
+    batches = []
+    current, current_cost = {}, 0
+    for key, text, cost in units:
+        if current and (current_cost + cost > budget or (max_items and len(current) >= max_items)):
+            batches.append(current)
+            current, current_cost = {}, 0
+        current[key] = text
+        current_cost += cost
+    if current:
+        batches.append(current)
+    return batches, split_units
+
+
+def _reassemble_pieces(translations: dict, pieces: list[tuple[str, list[dict]]], default: str) -> str:
+    """조각별 번역을 조문 하나의 번역으로 다시 합친다.
+
+    조각 번역은 _split_translation으로 항/호 단락으로 나누어 원문과 같은 단락 구조(빈 줄 구분)로
+    잇는다. 조각 하나라도 번역이 없거나 오류이면 그 값을 조문 전체의 번역으로 쓴다.
+    """
+    paragraphs = []
+    for key, piece in pieces:
+        translated = translations.get(key, default)
+        if translated == default or translated.startswith(_RETRYABLE_PREFIXES + translation_memory.ERROR_MARKER_PREFIXES):
+            return translated
+        original_texts = [str(item.get("text", "")) for item in piece]
+        parts = _split_translation(translated, len(piece), original_texts)
+        # 단락으로 깔끔하게 나뉘지 않으면(내용 누락·반복) 조각 번역을 그대로 쓴다
+        if "".join("".join(parts).split()) != "".join(translated.split()):
+            parts = [translated.strip()]
+        paragraphs.extend(parts)
+    return "\n\n".join(paragraphs)
+
+
 def translate_batch_smart(
     articles: list[dict],
     source_lang: str,
     progress_callback=None,
     use_gemini: bool = True,
     use_claude: bool = True,
-    batch_size: int = 15,
+    batch_size: int | None = None,
+    use_memory: bool = True,
+    token_budget: dict | None = None,
 ) -> list[dict]:
-    """스마트 배치 번역: 조문들을 적절한 크기로 묶어서 일괄 번역한다.
+    """스마트 배치 번역: 조문들을 요청당 토큰 예산에 맞춰 묶어서 일괄 번역한다.
+
+    조문마다 입력·출력 토큰을 어림하여 제공자별 예산(SMART_BATCH_TOKEN_BUDGET)까지
+    한 요청에 채운다. 짧은 조문은 많이, 긴 조문은 적게 묶이며, 예산을 넘는 조문은
+    항/호 경계에서 나누어 번역한 뒤 다시 합친다.
+
+    번역 메모리에 이미 있는 조문은 엔진별로 배치 요청에서 빼고,
+    배치 응답에서 받은 번역은 조문(조각)별로 메모리에 저장한다.
 
     Args:
         articles: [{'id': ..., 'text': ..., '조문번호': ...}, ...]
         source_lang: 'english', 'chinese', 'german' 등
-        progress_callback: 진행률 콜백
+        progress_callback: 진행률 콜백 (완료 요청 수, 전체 요청 수)
         use_gemini: Gemini 번역 사용 여부
         use_claude: Claude 번역 사용 여부
-        batch_size: 한 번에 번역할 조문 수 (기본 15개)
+        batch_size: 한 요청에 묶을 최대 조문 수 (None이면 토큰 예산만 따른다)
+        use_memory: 번역 메모리 재사용 여부
+        token_budget: 제공자별 요청당 토큰 예산 (예: {'gemini': 8000, 'claude': 6000})
 
     Returns:
         [{'id', 'original', 'gemini', 'claude', 'diff_summary'}, ...]
     """
-    import json
-
     system_prompt = _get_system_prompt(source_lang)
+    started_at = time.time()
 
     # 조문 번호별로 그룹화
-    from collections import defaultdict
-    groups = defaultdict(list)
-    for article in articles:
-        article_num = article.get('조문번호', article['id'])
-        groups[article_num].append(article)
+    groups = _group_articles(articles)
 
     # 전문/삭제 조문 분리
     valid_groups = {}
@@ -682,163 +1509,69 @@ def translate_batch_smart(
             valid_groups[article_num] = group
 
     if not valid_groups:
-        return _translate_by_article_group(articles, source_lang, progress_callback, use_gemini, use_claude)
-
-    # 조문을 배치로 나누기
-    article_nums = list(valid_groups.keys())
-    batches = [article_nums[i:i + batch_size] for i in range(0, len(article_nums), batch_size)]
-
-    results = []
-    total_batches = len(batches)
-
-    for batch_idx, batch_article_nums in enumerate(batches):
-        # 배치 내 조문 텍스트 구성
-        batch_texts = {}
-        for article_num in batch_article_nums:
-            group = valid_groups[article_num]
-            combined_parts = []
-
-            for art in group:
-                text = str(art.get("text", "")).strip()
-                if not text:
-                    continue
-
-                # 항/호/목 번호 추가
-                prefix = ""
-                항 = art.get("항", "")
-                호 = art.get("호", "")
-                목 = art.get("목", "")
-
-                if 항 and str(항).strip():
-                    try:
-                        항_num = int(float(항))
-                        prefix = f"({항_num}) "
-                    except:
-                        prefix = f"({항}) "
-
-                if 호 and str(호).strip():
-                    try:
-                        호_num = int(float(호))
-                        prefix += f"{호_num}. "
-                    except:
-                        prefix += f"({호}) "
-
-                if 목 and str(목).strip():
-                    prefix += f"({목}) "
-
-                combined_parts.append(prefix + text)
+        return _translate_by_article_group(
+            articles, source_lang, progress_callback, use_gemini, use_claude, use_memory,
+        )
 
-            batch_texts[article_num] = "\n\n".join(combined_parts)
+    fallback_before = batch_fallback_stats()
 
-        # 배치 프롬프트 구성
-        texts_json = json.dumps(batch_texts, ensure_ascii=False, indent=2)
-        batch_content = f"""다음은 여러 조문의 텍스트입니다. 각 조문을 개별적으로 번역하여 JSON 형식으로 응답해주세요.
+    # 엔진별로 토큰 예산에 맞춰 배치 구성
+    plans = {}
+    for engine, enabled in (("gemini", use_gemini), ("claude", use_claude)):
+        if enabled:
+            plans[engine] = _pack_token_batches(
+                valid_groups, _token_budget_for(engine, token_budget), batch_size,
+            )
+    total_batches = sum(len(batches) for batches, _ in plans.values())
+
+    # 엔진별 배치 번역 (번역 메모리에 없는 조문만 요청)
+    translations = {}
+    done_batches = 0
+    for engine, (batches, _) in plans.items():
+        translations[engine] = {}
+        for batch_idx, batch_texts in enumerate(batches):
+            translations[engine].update(_translate_batch_json(
+                engine, batch_texts, source_lang, system_prompt, batch_idx, use_memory,
+            ))
+            # 진행률 업데이트
+            done_batches += 1
+            if progress_callback:
+                progress_callback(done_batches, total_batches)
+    _log_batch_fallback_rates(fallback_before)
 
-**입력:**
-{texts_json}
+    # 조문별 결과 구성 (조각으로 나눈 조문은 다시 합친다)
+    results = []
+    for article_num, group in valid_groups.items():
+        combined_text = _combine_article_group(group)
+        texts = {}
+        for engine, default in (("gemini", "(Gemini 미사용)"), ("claude", "(Claude 미사용)")):
+            engine_translations = translations.get(engine, {})
+            pieces = plans[engine][1].get(str(article_num)) if engine in plans else None
+            if pieces:
+                texts[engine] = _reassemble_pieces(engine_translations, pieces, default)
+            else:
+                texts[engine] = engine_translations.get(str(article_num), default)
+        gemini_text, claude_text = texts["gemini"], texts["claude"]
 
-**응답 형식 (JSON만):**
-```json
-{{
-  "조문ID1": "번역문1",
-  "조문ID2": "번역문2"
-}}
-```"""
+        # 차이 요약
+        if use_gemini and use_claude and gemini_text != "(Gemini 미사용)" and claude_text != "(Claude 미사용)":
+            diff = summarize_diff(gemini_text, claude_text)
+        else:
+            diff = "-"
 
-        # Gemini 배치 번역
-        gemini_translations = {}
-        if use_gemini:
-            try:
-                gemini_response = translate_gemini(batch_content, system_prompt)
-                if "```json" in gemini_response:
-                    json_start = gemini_response.find("```json") + 7
-                    json_end = gemini_response.find("```", json_start)
-                    json_text = gemini_response[json_start:json_end].strip()
-                else:
-                    json_text = gemini_response
-                gemini_translations = json.loads(json_text)
-            except Exception as e:
-                print(f"⚠️ Gemini 배치 {batch_idx+1} 번역 실패: {e}")
-                # 실패 시 이 배치는 개별 번역으로 폴백
-                for article_num in batch_article_nums:
-                    text = batch_texts[article_num]
-                    gemini_translations[article_num] = translate_gemini(text, system_prompt)
-                    time.sleep(0.5)
-
-        # Claude 배치 번역
-        claude_translations = {}
-        if use_claude:
-            try:
-                claude_response = translate_claude(batch_content, system_prompt)
-                if "```json" in claude_response:
-                    json_start = claude_response.find("```json") + 7
-                    json_end = claude_response.find("```", json_start)
-                    json_text = claude_response[json_start:json_end].strip()
-                else:
-                    json_text = claude_response
-                claude_translations = json.loads(json_text)
-            except Exception as e:
-                print(f"⚠️ Claude 배치 {batch_idx+1} 번역 실패: {e}")
-                # 실패 시 이 배치는 개별 번역으로 폴백
-                for article_num in batch_article_nums:
-                    text = batch_texts[article_num]
-                    claude_translations[article_num] = translate_claude(text, system_prompt)
-                    time.sleep(0.5)
-
-        # 배치 결과 구성
-        for article_num in batch_article_nums:
-            group = valid_groups[article_num]
-            combined_text = batch_texts[article_num]
-
-            gemini_text = gemini_translations.get(str(article_num), "(Gemini 미사용)")
-            claude_text = claude_translations.get(str(article_num), "(Claude 미사용)")
-
-            # 차이 요약
-            if use_gemini and use_claude and gemini_text != "(Gemini 미사용)" and claude_text != "(Claude 미사용)":
-                diff = summarize_diff(gemini_text, claude_text)
-            else:
-                diff = "-"
-
-            # 각 항목에 결과 할당
-            for i, article in enumerate(group):
-                result = {
-                    "id": article["id"],
-                    "original": combined_text if i == 0 else article["text"],
-                    "gemini": gemini_text,
-                    "claude": claude_text,
-                    "diff_summary": diff if i == 0 else "-",
-                }
-                for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                    if key in article:
-                        result[key] = article[key]
-                results.append(result)
-
-        # 진행률 업데이트
-        if progress_callback:
-            progress_callback(batch_idx + 1, total_batches)
+        # 각 항목에 결과 할당
+        results.extend(_build_group_results(group, combined_text, gemini_text, claude_text, diff))
 
     # 스킵된 조문 처리
     for article_num, group in skip_groups.items():
-        for article in group:
-            if article_num == "전문":
-                result = {
-                    "id": article["id"],
-                    "original": article["text"],
-                    "gemini": "(서문 — 번역 생략)",
-                    "claude": "(서문 — 번역 생략)",
-                    "diff_summary": "-",
-                }
-            else:
-                result = {
-                    "id": article["id"],
-                    "original": "(삭제)",
-                    "gemini": "(삭제)",
-                    "claude": "(삭제)",
-                    "diff_summary": "-",
-                }
-            for key in ["편", "장", "절", "조문번호", "조문제목", "항", "호"]:
-                if key in article:
-                    result[key] = article[key]
-            results.append(result)
-
-    return results
+        results.extend(_skipped_group_results(article_num, group))
+
+    # 일시적 오류로 실패한 조문은 조문 단위 번역으로 다시 시도한다
+    # (재번역(use_memory=False)이면 이번 실행에서 저장된 번역만 재사용한다)
+    memory_since = None if use_memory else started_at
+    return _retry_failed_groups(
+        results, articles,
+        lambda subset: _translate_by_article_group(
+            subset, source_lang, None, use_gemini, use_claude, True, memory_since=memory_since,
+        ),
+    )
@@ -0,0 +1,344 @@
+"""비동기 번역 엔진 (asyncio).
+
+조문 그룹의 Gemini·Claude 번역과 차이 요약을 하나의 이벤트 루프에서 실행한다.
+제공자마다 두 가지 한도를 따로 둔다:
+
+- 동시 요청 수: asyncio.Semaphore (기본값 _DEFAULT_CONCURRENCY, 환경변수 <PROVIDER>_CONCURRENCY)
+- 분당 요청 수: rate_limiter의 제공자별 공용 토큰 버킷 (환경변수 <PROVIDER>_RPM)
+
+또한 동기 번역과 같은 제공자별 AIMD 제어기를 거치므로, 429를 받으면 스레드 작업자와
+함께 동시 요청 수가 줄고 retry-after 동안 새 요청을 멈춘다. 재시도도 요청 하나로 센다.
+차이 요약은 Gemini 호출이므로 Gemini 한도에 포함된다.
+스레드 풀처럼 조문 5개씩 묶여 기다리지 않으므로, 큰 법령도 각 제공자가 허용하는
+최대 속도로 번역한다.
+
+이벤트 루프는 전용 백그라운드 스레드 하나에서 계속 돌고, 비동기 클라이언트
+(Anthropic httpx 연결 풀, Gemini gRPC aio 채널)는 이 루프에 묶여 재사용된다.
+진행률 콜백은 translate_groups_async를 호출한 스레드(Streamlit 스크립트 스레드)에서 부른다.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import streamlit as st
+
+import translation_memory
+from api_clients import gemini_async_supported, get_async_anthropic_client, get_gemini_model
+from rate_limiter import get_controller, get_limiter, retry_delay
+from translator import (
+    CLAUDE_MODEL,
+    DIFF_ENGINE,
+    GEMINI_MODEL,
+    MAX_RETRIES,
+    _build_diff_request,
+    _build_group_results,
+    _clean_translation_output,
+    _combine_article_group,
+    _error_group_results,
+    _get_diff_prompt,
+    _get_system_prompt,
+    _group_articles,
+    _skipped_group_results,
+)
+
+# 제공자별 기본 동시 요청 수
+_DEFAULT_CONCURRENCY = {
+    "gemini": 16,
+    "claude": 8,
+}
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """엔진 전용 이벤트 루프를 반환한다 (처음 호출 시 백그라운드 스레드에서 시작)."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            # 비동기 API가 없는 호출(REST 전송 Gemini)을 실행할 스레드
+            loop.set_default_executor(ThreadPoolExecutor(max_workers=32, thread_name_prefix="translator-async-io"))
+            threading.Thread(target=loop.run_forever, name="translator-async", daemon=True).start()
+            _loop = loop
+        return _loop
+
+
+def _concurrency_for(provider: str, concurrency: dict | None) -> int:
+    """제공자의 동시 요청 수: 인자 > 환경변수 <PROVIDER>_CONCURRENCY > 기본값."""
+    if concurrency and provider in concurrency:
+        return max(1, int(concurrency[provider]))
+    return max(1, int(os.environ.get(f"{provider.upper()}_CONCURRENCY", _DEFAULT_CONCURRENCY[provider])))
+
+
+class _ProviderBudget:
+    """제공자 하나의 요청 한도 (실행별 동시 요청 수 + 공용 AIMD 제어기 + 분당 요청 수).
+
+    `async with budget:` 블록 하나가 API 요청 하나이며, 블록의 예외(429 등)는
+    AIMD 제어기에 전달된다.
+    """
+
+    def __init__(self, provider: str, concurrency: int):
+        self.provider = provider
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._controller = get_controller(provider)
+        self._limiter = get_limiter(provider)
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        try:
+            await _wait_until_zero(self._controller.try_acquire)
+            try:
+                await _wait_until_zero(self._limiter.try_acquire)
+            except BaseException as e:
+                self._controller.release(e)
+                raise
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._controller.release(exc)
+        self._semaphore.release()
+
+
+async def _wait_until_zero(try_acquire) -> None:
+    """try_acquire가 0(획득)을 반환할 때까지 이벤트 루프를 막지 않고 기다린다."""
+    while True:
+        wait = try_acquire()
+        if wait <= 0:
+            return
+        await asyncio.sleep(wait)
+
+
+# ── 제공자별 비동기 호출 (translator의 동기 함수와 같은 재시도·오류 표시) ──
+
+async def _call_gemini_async(text: str, system_prompt: str, api_key: str, budget: _ProviderBudget) -> str:
+    """Gemini API를 비동기로 재시도 포함하여 호출한다. API 키가 없으면 빈 문자열."""
+    if not api_key or api_key == "your-key-here":
+        return ""
+
+    model = get_gemini_model(api_key, GEMINI_MODEL, system_prompt)
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with budget:
+                if gemini_async_supported():
+                    response = await model.generate_content_async(
+                        text,
+                        request_options={"timeout": 120},
+                    )
+                else:
+                    # REST 전송은 비동기 호출을 지원하지 않으므로 루프의 스레드에서 동기 호출
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        None, lambda: model.generate_content(text, request_options={"timeout": 120}),
+                    )
+            if not response.candidates:
+                return "[Gemini 응답 없음]"
+            candidate = response.candidates[0]
+            if not candidate.content or not candidate.content.parts:
+                return "[Gemini 응답 없음]"
+            raw = candidate.content.parts[0].text.strip()
+            return _clean_translation_output(raw)
+        except Exception as e:
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(retry_delay(e, attempt))
+            else:
+                error_name = type(e).__name__
+                if "ResourceExhausted" in error_name or "429" in str(e):
+                    return "[Gemini 오류: API 할당량 초과 - 잠시 후 재시도]"
+                return f"[Gemini 오류: {error_name}]"
+
+
+async def _translate_gemini_async(text: str, system_prompt: str, api_key: str, budget: _ProviderBudget) -> str:
+    if not api_key or api_key == "your-key-here":
+        return "[Gemini API 키 미설정]"
+    result = await _call_gemini_async(text, system_prompt, api_key, budget)
+    return result if result else "[Gemini 번역 실패]"
+
+
+async def _translate_claude_async(text: str, system_prompt: str, api_key: str, budget: _ProviderBudget) -> str:
+    if not api_key or api_key == "your-key-here":
+        return "[Claude API 키 미설정]"
+
+    client = get_async_anthropic_client(api_key, max_retries=0)
+    for attempt in range(MAX_RETRIES):
+        try:
+            async with budget:
+                message = await client.messages.create(
+                    model=CLAUDE_MODEL,
+                    max_tokens=8192,
+                    system=system_prompt,
+                    messages=[{"role": "user", "content": text}],
+                )
+            raw = message.content[0].text.strip()
+            return _clean_translation_output(raw)
+        except Exception as e:
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(retry_delay(e, attempt))
+            else:
+                error_name = type(e).__name__
+                error_msg = str(e)[:200]
+                return f"[Claude 오류: {error_name} — {error_msg}]"
+
+
+# ── 조문 그룹 번역 ─────────────────────────────────────────────
+
+class _AsyncRun:
+    """translate_groups_async 한 번의 실행 설정과 제공자별 한도."""
+
+    def __init__(self, source_lang, use_gemini, use_claude, use_memory, concurrency, api_keys, memory_since=None):
+        self.source_lang = source_lang
+        self.system_prompt = _get_system_prompt(source_lang)
+        self.use_gemini = use_gemini
+        self.use_claude = use_claude
+        self.use_memory = use_memory
+        self.memory_since = memory_since
+        self.api_keys = api_keys
+        self.budgets = {
+            provider: _ProviderBudget(provider, _concurrency_for(provider, concurrency))
+            for provider in ("gemini", "claude")
+        }
+
+    async def translate(self, engine: str, text: str) -> str:
+        """번역 메모리를 먼저 조회하고, 없으면 제공자 한도 안에서 번역한다."""
+        model_id = GEMINI_MODEL if engine == "gemini" else CLAUDE_MODEL
+        if self.use_memory:
+            cached = translation_memory.lookup(
+                text, self.source_lang, self.system_prompt, model_id, self.memory_since,
+            )
+            if cached is not None:
+                return cached
+
+        call = _translate_gemini_async if engine == "gemini" else _translate_claude_async
+        result = await call(text, self.system_prompt, self.api_keys[engine], self.budgets[engine])
+        translation_memory.store(text, self.source_lang, self.system_prompt, model_id, result)
+        return result
+
+    async def summarize_diff(self, gemini_result: str, claude_result: str) -> str:
+        """translator.summarize_diff와 같으며, Gemini 한도 안에서 호출한다."""
+        if gemini_result.startswith(translation_memory.ERROR_MARKER_PREFIXES) or claude_result.startswith(
+            translation_memory.ERROR_MARKER_PREFIXES
+        ):
+            return "비교 불가 (API 오류)"
+
+        prompt = _build_diff_request(gemini_result, claude_result)
+        diff_prompt = _get_diff_prompt()
+        cached = translation_memory.lookup(prompt, "korean", diff_prompt, DIFF_ENGINE)
+        if cached is not None:
+            return cached
+
+        result = await _call_gemini_async(prompt, diff_prompt, self.api_keys["gemini"], self.budgets["gemini"])
+        translation_memory.store(prompt, "korean", diff_prompt, DIFF_ENGINE, result)
+        return result if result else "비교 불가 (타임아웃)"
+
+    async def translate_group(self, article_num: str, group: list[dict]) -> list[dict]:
+        """조문 그룹 하나를 번역한다 (_translate_by_article_group의 _translate_one과 같은 결과 형식)."""
+        skipped = _skipped_group_results(article_num, group)
+        if skipped is not None:
+            return skipped
+
+        combined_text = _combine_article_group(group)
+
+        engines = [e for e, used in (("gemini", self.use_gemini), ("claude", self.use_claude)) if used]
+        outputs = await asyncio.gather(
+            *(self.translate(engine, combined_text) for engine in engines),
+            return_exceptions=True,
+        )
+        texts = {"gemini": "(Gemini 미사용)", "claude": "(Claude 미사용)"}
+        for engine, output in zip(engines, outputs):
+            texts[engine] = f"(번역 실패: {output})" if isinstance(output, Exception) else output
+        gemini_text, claude_text = texts["gemini"], texts["claude"]
+
+        if (
+            self.use_gemini and self.use_claude
+            and "(번역 실패" not in gemini_text and "(번역 실패" not in claude_text
+        ):
+            diff = await self.summarize_diff(gemini_text, claude_text)
+        else:
+            diff = "-"
+
+        return _build_group_results(group, combined_text, gemini_text, claude_text, diff)
+
+
+def translate_groups_async(
+    articles: list[dict],
+    source_lang: str,
+    progress_callback=None,
+    use_gemini: bool = True,
+    use_claude: bool = True,
+    use_memory: bool = True,
+    concurrency: dict | None = None,
+    group_callback=None,
+    diff_progress_callback=None,
+    memory_since: float | None = None,
+) -> list[dict]:
+    """조문 그룹을 비동기 엔진으로 번역한다 (translate_batch(async_mode=True)의 구현).
+
+    Args:
+        articles: [{'id': ..., 'text': ..., '조문번호': ...}, ...]
+        source_lang: 'english' 또는 'chinese'
+        progress_callback: 진행률 콜백 (current, total) — 호출한 스레드에서 불린다
+        use_gemini: Gemini 번역 사용 여부
+        use_claude: Claude 번역 사용 여부
+        use_memory: 번역 메모리 재사용 여부
+        concurrency: 제공자별 동시 요청 수 (예: {'gemini': 16, 'claude': 8})
+        group_callback: 조문 그룹이 끝날 때마다 (그룹 키, 결과 행들)로 부르는 콜백 — 호출한 스레드에서 불린다
+        diff_progress_callback: 차이 요약 진행률 콜백 (완료 조문 수, 요약 대상 조문 수) — 호출한 스레드에서 불린다.
+            비동기 엔진은 조문 그룹 안에서 번역 뒤 바로 차이 요약을 하므로, 요약 대상 그룹이 끝날 때 센다.
+        memory_since: 주면 그 시각 이후에 번역 메모리에 저장된 번역만 재사용한다
+
+    Returns:
+        [{'id', 'original', 'gemini', 'claude', 'diff_summary'}, ...] (입력 순서 유지)
+    """
+    groups = list(_group_articles(articles).items())
+    total_groups = len(groups)
+    if not total_groups:
+        return []
+
+    # st.secrets는 스크립트 스레드에서 읽어 루프에 넘긴다
+    api_keys = {
+        "gemini": st.secrets.get("GEMINI_API_KEY", ""),
+        "claude": st.secrets.get("ANTHROPIC_API_KEY", ""),
+    }
+    run = _AsyncRun(source_lang, use_gemini, use_claude, use_memory, concurrency, api_keys, memory_since)
+
+    loop = _get_loop()
+    future_to_idx = {
+        asyncio.run_coroutine_threadsafe(run.translate_group(article_num, group), loop): idx
+        for idx, (article_num, group) in enumerate(groups)
+    }
+
+    # 차이 요약 대상: 두 엔진을 모두 쓰는 경우 전문·삭제가 아닌 그룹 (동기 경로와 같은 기준)
+    diff_targets = {
+        idx for idx, (article_num, group) in enumerate(groups)
+        if use_gemini and use_claude and _skipped_group_results(article_num, group) is None
+    }
+    diff_done = 0
+
+    ordered_results = [None] * total_groups
+    try:
+        for done, future in enumerate(as_completed(future_to_idx), 1):
+            idx = future_to_idx[future]
+            try:
+                ordered_results[idx] = future.result()
+            except Exception as e:
+                ordered_results[idx] = _error_group_results(groups[idx][1], e)
+            if group_callback:
+                group_callback(groups[idx][0], ordered_results[idx])
+            if progress_callback:
+                progress_callback(done, total_groups)
+            if diff_progress_callback and idx in diff_targets:
+                diff_done += 1
+                diff_progress_callback(diff_done, len(diff_targets))
+    finally:
+        # 중단(Streamlit 재실행 등) 시 아직 시작하지 않은 그룹은 취소한다
+        for future in future_to_idx:
+            future.cancel()
+
+    results = []
+    for group_results in ordered_results:
+        results.extend(group_results)
+    return results